@@ -0,0 +1,138 @@
+"""
+Benchmark throughput of the saved-words API against concurrent requests.
+
+The asyncio session is compared with the former synchronous session at every
+number of in-flight requests.
+
+The "before" route reproduces the former handler: an ``async def`` route that
+runs the synchronous session on the event loop. Database latency is what makes
+the difference visible, so run it against PostgreSQL for meaningful numbers.
+
+Usage: python -m benchmarks.async_concurrency [database_url]
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+TEMPORARY_DIRECTORY = tempfile.TemporaryDirectory()
+if len(sys.argv) > 1:
+    os.environ["DATABASE_URL"] = sys.argv[1]
+else:
+    os.environ["DATABASE_URL"] = f"sqlite:///{TEMPORARY_DIRECTORY.name}/bench.db"
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from fastapi.responses import Response  # noqa: E402
+from pydantic import UUID4  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from vocabulary_builder.db.crud import (  # noqa: E402
+    create_user,
+    get_saved_word_ids_for_user,
+    save_word_for_user,
+)
+from vocabulary_builder.db.database import (  # noqa: E402
+    BaseModel,
+    SessionLocal,
+    async_engine,
+    engine,
+)
+from vocabulary_builder.db.db_populate import populate_database  # noqa: E402
+from vocabulary_builder.db.models import WordModel  # noqa: E402
+from vocabulary_builder.dependencies import get_db  # noqa: E402
+from vocabulary_builder.main import app  # noqa: E402
+from vocabulary_builder.utils.word_info import get_word_payloads  # noqa: E402
+
+
+# The former handler keeps pooled connections checked out while it blocks the
+# event loop, so more requests in flight than the pool allows (5 + 10 overflow)
+# make it wait for a connection that can never be released.
+CONCURRENCY_LEVELS = [1, 2, 4, 8, 12]
+REQUESTS_PER_LEVEL = 512
+SAVED_WORDS = 20
+
+legacy_app = FastAPI()
+
+
+@legacy_app.get("/users/{user_id}/words")
+async def get_saved_words_blocking(
+    user_id: UUID4, db: Session = Depends(get_db)
+) -> Response:
+    """
+    Reproduce the former handler that blocks the event loop on every query.
+
+    :param user_id: User ID.
+    :param db: Database session dependency.
+    :return: JSON list of saved words.
+    """
+    payloads = get_word_payloads(db, get_saved_word_ids_for_user(db, user_id))
+    return Response(
+        content=b"[" + b",".join(payloads) + b"]", media_type="application/json"
+    )
+
+
+def prepare_database() -> str:
+    """
+    Create the schema, a dictionary and a user with saved words.
+
+    :return: ID of the created user.
+    """
+    BaseModel.metadata.drop_all(bind=engine)
+    BaseModel.metadata.create_all(bind=engine)
+    words = json.loads(
+        (Path(__file__).parent.parent / "tiny_db_input.json").read_text("utf-8")
+    )
+    with SessionLocal() as session:
+        populate_database(words * (SAVED_WORDS // len(words) + 1), session)
+        user = create_user(session, "benchmark", "not a real hash")
+        for word in session.query(WordModel).limit(SAVED_WORDS):
+            save_word_for_user(session, word.id, user.id)
+        return str(user.id)
+
+
+async def measure_throughput(app: FastAPI, url: str, concurrency: int) -> float:
+    """
+    Send requests with a fixed number in flight and measure throughput.
+
+    :param app: ASGI application to call.
+    :param url: URL to request.
+    :param concurrency: Number of requests in flight.
+    :return: Throughput in requests per second.
+    """
+    remaining = REQUESTS_PER_LEVEL
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get(url)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return REQUESTS_PER_LEVEL / (time.perf_counter() - start)
+
+
+async def run() -> None:
+    """Run the benchmark and print a throughput table."""
+    url = f"/users/{prepare_database()}/words"
+    print(f"{'in flight':>10} {'sync session, rps':>19} {'async session, rps':>20}")
+    for concurrency in CONCURRENCY_LEVELS:
+        before = await measure_throughput(legacy_app, url, concurrency)
+        after = await measure_throughput(app, url, concurrency)
+        print(f"{concurrency:>10} {before:>19.0f} {after:>20.0f}")
+    await async_engine.dispose()
+    BaseModel.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
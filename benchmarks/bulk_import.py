@@ -0,0 +1,88 @@
+"""
+Benchmark dictionary import throughput of the bulk import mode.
+
+Compares ``populate_database``, which flushes every row and commits once per
+word, with ``bulk_populate_database`` at several batch sizes.
+
+Usage: python -m benchmarks.bulk_import [database_url]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+TEMPORARY_DIRECTORY = tempfile.TemporaryDirectory()
+if len(sys.argv) > 1:
+    os.environ["DATABASE_URL"] = sys.argv[1]
+else:
+    os.environ["DATABASE_URL"] = f"sqlite:///{TEMPORARY_DIRECTORY.name}/bench.db"
+
+from vocabulary_builder.db.database import (  # noqa: E402
+    BaseModel,
+    SessionLocal,
+    engine,
+)
+from vocabulary_builder.db.db_populate import (  # noqa: E402
+    bulk_populate_database,
+    populate_database,
+)
+
+
+WORDS = 5_000
+BATCH_SIZES = [100, 1_000, 5_000]
+
+
+def load_words() -> list[dict]:
+    """
+    Build a dictionary of the requested size from the sample input.
+
+    :return: List of word data dictionaries.
+    """
+    words = json.loads(
+        (Path(__file__).parent.parent / "tiny_db_input.json").read_text("utf-8")
+    )
+    return [
+        {**words[i % len(words)], "word": f"{words[i % len(words)]['word']}{i}"}
+        for i in range(WORDS)
+    ]
+
+
+def measure(populate, words: list[dict]) -> float:
+    """
+    Import the words into an empty database and measure throughput.
+
+    :param populate: Function that imports words with a session.
+    :param words: List of word data dictionaries.
+    :return: Throughput in words per second.
+    """
+    BaseModel.metadata.drop_all(bind=engine)
+    BaseModel.metadata.create_all(bind=engine)
+    with SessionLocal() as session, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        populate(words, session)
+        return len(words) / (time.perf_counter() - start)
+
+
+def run() -> None:
+    """Run the benchmark and print a throughput table."""
+    words = load_words()
+    print(f"{'mode':>24} {'words/sec':>10}")
+    print(f"{'row by row':>24} {measure(populate_database, words):>10.0f}")
+    for batch_size in BATCH_SIZES:
+        throughput = measure(
+            lambda data, session, size=batch_size: bulk_populate_database(
+                data, session, size
+            ),
+            words,
+        )
+        print(f"{f'bulk, batch size {batch_size}':>24} {throughput:>10.0f}")
+    BaseModel.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    run()
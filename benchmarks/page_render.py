@@ -0,0 +1,84 @@
+"""
+Benchmark the translation overhead of rendering pages.
+
+Compares the catalog registry of ``utils.translations._`` with the former
+implementation, which located and parsed the gettext catalog on every call.
+Compile the catalogs first (``doit mo``), otherwise every language falls back
+to the untranslated messages.
+
+Usage: python -m benchmarks.page_render
+"""
+import gettext
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from vocabulary_builder.main import app  # noqa: E402
+from vocabulary_builder.routes import pages  # noqa: E402
+from vocabulary_builder.utils import translations  # noqa: E402
+
+
+CALLS = 2000
+PAGE_LOADS = 500
+LANGUAGES = [language.value for language in translations.LanguageModel]
+
+
+def legacy_gettext(language: str) -> Callable[[str], str]:
+    """
+    Retrieve the translation function the way it was done before the registry.
+
+    :param language: Language code (e.g., 'ru', 'fr').
+    :return: The translation function for the specified language.
+    """
+    try:
+        catalog = gettext.translation(
+            domain="translations",
+            localedir=Path(translations.__file__).parent.parent.absolute() / "locales",
+            languages=[language],
+        )
+    except FileNotFoundError:
+        catalog = gettext.NullTranslations()
+    return catalog.gettext
+
+
+def time_per_call(function: Callable[[], object], calls: int) -> float:
+    """
+    Measure the average latency of a function in microseconds.
+
+    :param function: Function to call without arguments.
+    :param calls: Number of calls to average over.
+    :return: Average latency in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a latency table."""
+    translations.load_translations()
+    client = TestClient(app)
+
+    print(f"{'':>20} {'before, us':>12} {'after, us':>12}")
+    for language in LANGUAGES:
+        before = time_per_call(lambda lang=language: legacy_gettext(lang), CALLS)
+        after = time_per_call(lambda lang=language: translations._(lang), CALLS)
+        print(f"{'_(' + language + ')':>20} {before:>12.1f} {after:>12.1f}")
+
+    url = "/login?language=fr"
+    pages._ = legacy_gettext
+    before = time_per_call(lambda: client.get(url), PAGE_LOADS)
+    pages._ = translations._
+    after = time_per_call(lambda: client.get(url), PAGE_LOADS)
+    print(f"{'GET ' + url:>20} {before:>12.1f} {after:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
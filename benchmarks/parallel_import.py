@@ -0,0 +1,120 @@
+"""
+Benchmark how the parallel dictionary import scales with the number of workers.
+
+Imports the same NDJSON dictionary with ``bulk_populate_database`` in a single
+process and with ``parallel_populate_database`` on 1 to 8 worker processes,
+checking that every run imports the same words. SQLite serializes writers, so
+run it against PostgreSQL to see the import scale past the parsing work.
+
+Usage: python -m benchmarks.parallel_import [database_url]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# Worker processes re-import this module, so they must resolve the same URL
+DEFAULT_DATABASE_PATH = Path(tempfile.gettempdir()) / "parallel_import_bench.db"
+if len(sys.argv) > 1:
+    os.environ["DATABASE_URL"] = sys.argv[1]
+else:
+    os.environ["DATABASE_URL"] = f"sqlite:///{DEFAULT_DATABASE_PATH}"
+
+from sqlalchemy import func, select  # noqa: E402
+
+from vocabulary_builder.db.database import (  # noqa: E402
+    BaseModel,
+    SessionLocal,
+    engine,
+)
+from vocabulary_builder.db.db_populate import (  # noqa: E402
+    bulk_populate_database,
+    parallel_populate_database,
+)
+from vocabulary_builder.db.dictionary_reader import DictionaryReader  # noqa: E402
+from vocabulary_builder.db.models import WordModel, WordSampleModel  # noqa: E402
+
+
+WORDS = 20_000
+WORKERS = [1, 2, 4, 8]
+BATCH_SIZE = 1_000
+
+
+def write_dictionary(directory: str) -> Path:
+    """
+    Write an NDJSON dictionary of the requested size from the sample input.
+
+    :param directory: Directory to write the file to.
+    :return: Path to the NDJSON file.
+    """
+    words = json.loads(
+        (Path(__file__).parent.parent / "tiny_db_input.json").read_text("utf-8")
+    )
+    path = Path(directory) / "words.ndjson"
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(WORDS):
+            word_data = words[i % len(words)]
+            file.write(json.dumps({**word_data, "word": f"{word_data['word']}{i}"}))
+            file.write("\n")
+    return path
+
+
+def measure(populate) -> tuple[float, tuple[int, int]]:
+    """
+    Import the dictionary into an empty database and measure throughput.
+
+    :param populate: Function that imports the dictionary.
+    :return: Throughput in words per second, and the number of words and
+        sample index entries in the database.
+    """
+    BaseModel.metadata.drop_all(bind=engine)
+    BaseModel.metadata.create_all(bind=engine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        populate()
+        elapsed = time.perf_counter() - start
+    with SessionLocal() as session:
+        counts = (
+            session.scalar(select(func.count(WordModel.id))),
+            session.scalar(select(func.count(WordSampleModel.position))),
+        )
+    return WORDS / elapsed, counts
+
+
+def single_process_import(path: Path) -> None:
+    """
+    Import the dictionary in the current process.
+
+    :param path: Path to the NDJSON file.
+    """
+    with SessionLocal() as session:
+        bulk_populate_database(DictionaryReader(path), session, BATCH_SIZE)
+
+
+def run() -> None:
+    """Run the benchmark and print a throughput table."""
+    directory = tempfile.TemporaryDirectory()
+    path = write_dictionary(directory.name)
+    throughput, expected = measure(lambda: single_process_import(path))
+    print(f"{'mode':>16} {'words/sec':>10} {'speedup':>8}")
+    print(f"{'single process':>16} {throughput:>10.0f} {1:>8.2f}")
+    for workers in WORKERS:
+        parallel, counts = measure(
+            lambda workers=workers: parallel_populate_database(
+                str(path), workers, BATCH_SIZE
+            )
+        )
+        assert counts == expected, f"imported {counts}, expected {expected}"
+        speedup = parallel / throughput
+        print(f"{f'{workers} workers':>16} {parallel:>10.0f} {speedup:>8.2f}")
+    BaseModel.metadata.drop_all(bind=engine)
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,111 @@
+"""
+Benchmark random word sampling against dictionary size.
+
+Compares the sample index lookup of ``sampler.pick_random_word_id``, which
+serves random words, with the previous ``ORDER BY random()`` query on
+dictionaries from 1k to 1M words.
+
+Usage: python -m benchmarks.random_word [database_url]
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from vocabulary_builder.db.database import BaseModel  # noqa: E402
+from vocabulary_builder.db.models import WordModel, WordSampleModel  # noqa: E402
+from vocabulary_builder.db.sampler import pick_random_word_id  # noqa: E402
+
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+INSERT_CHUNK = 10_000
+PICKS = 200
+LEGACY_MAX_PICKS = 20
+
+
+def grow_dictionary(session: Session, current_size: int, target_size: int) -> None:
+    """
+    Insert placeholder words until the dictionary reaches the target size.
+
+    :param session: SQLAlchemy session object.
+    :param current_size: Number of words already in the database.
+    :param target_size: Number of words to reach.
+    """
+    for start in range(current_size, target_size, INSERT_CHUNK):
+        stop = min(start + INSERT_CHUNK, target_size)
+        word_ids = [uuid.uuid4() for _ in range(start, stop)]
+        session.execute(
+            insert(WordModel),
+            [
+                {
+                    "id": word_id,
+                    "word": f"word{position}",
+                    "part_of_speech": "noun",
+                    "transcription": "",
+                    "audio": b"Audio Placeholder",
+                }
+                for position, word_id in enumerate(word_ids, start=start)
+            ],
+        )
+        session.execute(
+            insert(WordSampleModel),
+            [
+                {"position": position, "word_id": word_id}
+                for position, word_id in enumerate(word_ids, start=start)
+            ],
+        )
+        session.commit()
+
+
+def time_per_call(function, calls: int) -> float:
+    """
+    Measure the average latency of a function in milliseconds.
+
+    :param function: Function to call without arguments.
+    :param calls: Number of calls to average over.
+    :return: Average latency in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a latency table."""
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = (
+            sys.argv[1] if len(sys.argv) > 1 else f"sqlite:///{directory}/bench.db"
+        )
+        engine = create_engine(database_url)
+        BaseModel.metadata.drop_all(bind=engine)
+        BaseModel.metadata.create_all(bind=engine)
+
+        legacy_stmt = select(WordModel).order_by(func.random()).limit(1)
+        print(f"{'words':>10} {'sample index, ms':>18} {'ORDER BY random(), ms':>23}")
+        with Session(engine) as session:
+            size = 0
+            for target_size in SIZES:
+                grow_dictionary(session, size, target_size)
+                size = target_size
+
+                sampled = time_per_call(lambda: pick_random_word_id(session), PICKS)
+                legacy = time_per_call(
+                    lambda: session.scalars(legacy_stmt).first(), LEGACY_MAX_PICKS
+                )
+                session.expunge_all()
+                print(f"{size:>10} {sampled:>18.3f} {legacy:>23.3f}")
+
+        BaseModel.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark the memory held per word by hydrated ORM graphs and the snapshot.
+
+Imports a dictionary of 20k words, then measures with ``tracemalloc`` the
+memory retained by every ``WordModel`` graph loaded in a session. It compares
+that with the memory-mapped dictionary snapshot, whose interned strings and
+integer records live in the page cache shared by every worker, and checks that
+both format to the same responses.
+
+Usage: python -m benchmarks.word_memory [database_url]
+"""
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+
+TEMPORARY_DIRECTORY = tempfile.TemporaryDirectory()
+if len(sys.argv) > 1:
+    os.environ["DATABASE_URL"] = sys.argv[1]
+else:
+    os.environ["DATABASE_URL"] = f"sqlite:///{TEMPORARY_DIRECTORY.name}/bench.db"
+
+from sqlalchemy import select  # noqa: E402
+
+from vocabulary_builder.db.crud import word_graph_options  # noqa: E402
+from vocabulary_builder.db.database import (  # noqa: E402
+    BaseModel,
+    SessionLocal,
+    engine,
+)
+from vocabulary_builder.db.db_populate import bulk_populate_database  # noqa: E402
+from vocabulary_builder.db.models import WordModel  # noqa: E402
+from vocabulary_builder.db.snapshot import build_snapshot  # noqa: E402
+from vocabulary_builder.utils.word_info import format_word_info  # noqa: E402
+from vocabulary_builder.utils.word_snapshot import WordSnapshot  # noqa: E402
+
+
+# Keeping 100k ORM graphs loaded at once takes about 4 GB
+WORDS = 20_000
+BATCH_SIZE = 1_000
+CHECKED_WORDS = 100
+SNAPSHOT_PATH = Path(TEMPORARY_DIRECTORY.name) / "words.snapshot"
+
+
+def prepare_database() -> None:
+    """Create the schema and import the dictionary."""
+    BaseModel.metadata.drop_all(bind=engine)
+    BaseModel.metadata.create_all(bind=engine)
+    words = json.loads(
+        (Path(__file__).parent.parent / "tiny_db_input.json").read_text("utf-8")
+    )
+    data = (
+        {**words[i % len(words)], "word": f"{words[i % len(words)]['word']}{i}"}
+        for i in range(WORDS)
+    )
+    with SessionLocal() as session, contextlib.redirect_stdout(io.StringIO()):
+        bulk_populate_database(data, session, BATCH_SIZE)
+
+
+def traced_memory() -> int:
+    """
+    Measure the memory currently allocated by Python after a full collection.
+
+    :return: Allocated memory in bytes.
+    """
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure_orm() -> tuple[int, list[dict]]:
+    """
+    Measure the memory retained by the ORM graphs of every word.
+
+    :return: Retained memory in bytes, and the first words formatted.
+    """
+    baseline = traced_memory()
+    session = SessionLocal()
+    stmt = select(WordModel).order_by(WordModel.id).options(*word_graph_options())
+    words = session.scalars(stmt).all()
+    retained = traced_memory() - baseline
+    expected = [format_word_info(word) for word in words[:CHECKED_WORDS]]
+    session.close()
+    del words
+    return retained, expected
+
+
+def measure_snapshot(expected: list[dict]) -> tuple[int, int, list[dict]]:
+    """
+    Measure the memory of the snapshot of every word.
+
+    :param expected: Words formatted from their ORM graphs.
+    :return: Memory retained by Python, size of the mapped file, and the same
+        words formatted from the snapshot.
+    """
+    with SessionLocal() as session:
+        build_snapshot(session, SNAPSHOT_PATH, BATCH_SIZE)
+    baseline = traced_memory()
+    snapshot = WordSnapshot(SNAPSHOT_PATH)
+    retained = traced_memory() - baseline
+    formatted = [snapshot.get_word_info(word_info["word_id"]) for word_info in expected]
+    return retained, SNAPSHOT_PATH.stat().st_size, formatted
+
+
+def run() -> None:
+    """Run the benchmark and print a memory table."""
+    prepare_database()
+    tracemalloc.start()
+    orm, expected = measure_orm()
+    heap, mapped, formatted = measure_snapshot(expected)
+    tracemalloc.stop()
+    assert formatted == expected, "the snapshot formats words differently"
+
+    print(f"{'model':>12} {'heap MiB':>9} {'mapped MiB':>11} {'bytes/word':>11}")
+    for name, heap_bytes, mapped_bytes in [
+        ("ORM graphs", orm, 0),
+        ("snapshot", heap, mapped),
+    ]:
+        print(
+            f"{name:>12} {heap_bytes / 2**20:>9.1f} {mapped_bytes / 2**20:>11.1f} "
+            f"{(heap_bytes + mapped_bytes) / WORDS:>11.0f}"
+        )
+    print(f"the snapshot uses {(heap + mapped) / orm:.1%} of the memory of ORM graphs")
+    BaseModel.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    run()
@@ -1,19 +1,87 @@
+import asyncio
+import json
 import os
+import signal
+import threading
+import uuid
+from contextlib import contextmanager
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
-from vocabulary_builder.db.crud import get_user_by_username
-from vocabulary_builder.db.database import BaseModel
-from vocabulary_builder.main import app, get_db
+from vocabulary_builder import main
+from vocabulary_builder.db.crud import (
+    create_user,
+    get_saved_word_ids_for_user,
+    get_user_by_username,
+    get_words_by_ids,
+    remove_word_for_user,
+    save_word_for_user,
+)
+from vocabulary_builder.db.database import BaseModel, get_async_database_url
+from vocabulary_builder.db.db_cleanup import (
+    delete_word,
+    delete_word_batch,
+    delete_words,
+)
+from vocabulary_builder.db.db_populate import (
+    bulk_populate_database,
+    populate_database,
+)
+from vocabulary_builder.db.dictionary_reader import (
+    DictionaryReader,
+    find_line_boundaries,
+)
+from vocabulary_builder.db.models import (
+    ExampleModel,
+    ExampleTranslationModel,
+    SemanticModel,
+    TranslationModel,
+    WordDocumentModel,
+    WordModel,
+    WordSampleModel,
+)
+from vocabulary_builder.db.sampler import pick_random_word_id, sync_sample_index
+from vocabulary_builder.db.snapshot import build_snapshot
+from vocabulary_builder.db.word_documents import rebuild_word_documents
+from vocabulary_builder.dependencies import get_async_db, get_db
+from vocabulary_builder.exceptions import (
+    PasswordPoolSaturatedException,
+    UserNotFound,
+    WordNotFound,
+)
+from vocabulary_builder.main import app
+from vocabulary_builder.models import MAX_SAVED_WORD_CHANGES
+from vocabulary_builder.utils import password_pool, translations, word_info
+from vocabulary_builder.utils.dictionary_version import DictionaryVersionWatcher
+from vocabulary_builder.utils.password_pool import PasswordHashingPool
+from vocabulary_builder.utils.principal_cache import principal_cache
+from vocabulary_builder.utils.saved_word_cache import saved_word_id_cache
+from vocabulary_builder.utils.word_cache import (
+    WordPayloadCache,
+    serialize_word_info,
+    word_payload_cache,
+)
+from vocabulary_builder.utils.word_info import format_word_info, get_word_payloads
+from vocabulary_builder.utils.word_pool import RandomWordPool
+from vocabulary_builder.utils.word_snapshot import WordSnapshotFile
 
 
 TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 BaseModel.metadata.create_all(bind=engine)
+# TestClient runs every request in a new event loop, so connections can't be pooled
+async_engine = create_async_engine(
+    get_async_database_url(TEST_DATABASE_URL), poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    autoflush=False, expire_on_commit=False, bind=async_engine
+)
 
 
 def override_get_db():
@@ -24,7 +92,13 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 client = TestClient(app)
 
@@ -86,3 +160,774 @@ def test_learn_endpoint(test_client):
     cookies = login_response.cookies
     response = test_client.get("/learn?language=ru", cookies=cookies)
     assert response.status_code == 200
+
+
+@contextmanager
+def count_queries(bind=engine):
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(bind, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+
+def make_word_data(word, semantics_count, languages):
+    return {
+        "word": word,
+        "part_of_speech": "noun",
+        "transcription": word,
+        "audio": "",
+        "semantics": [
+            {
+                "examples": [f"{word} example {i}", f"{word} another example {i}"],
+                "translations": {
+                    language: {
+                        "word": f"{word}-{language}-{i}",
+                        "examples": [f"{language} {i} one", f"{language} {i} two"],
+                    }
+                    for language in languages
+                },
+            }
+            for i in range(semantics_count)
+        ],
+    }
+
+
+def test_word_graph_query_count_is_constant(test_client, db_session):
+    populate_database(
+        [
+            make_word_data("small", 1, ["ru"]),
+            make_word_data("large", 3, ["ru", "uk", "fr", "de"]),
+        ],
+        db_session,
+    )
+    query_counts = []
+    for word in ("small", "large"):
+        word_id = db_session.scalar(select(WordModel.id).where(WordModel.word == word))
+        db_session.expunge_all()
+        with count_queries() as queries:
+            (loaded,) = get_words_by_ids(db_session, [word_id])
+            word_info = format_word_info(loaded)
+        query_counts.append(len(queries))
+        assert word_info["word"] == word
+
+    assert len(word_info["semantics"]) == 3
+    assert set(word_info["semantics"][2]["translations"]) == {"ru", "uk", "fr", "de"}
+    assert query_counts[0] == query_counts[1] <= 5
+
+
+def test_sample_index_stays_dense(test_client, db_session):
+    populate_database(
+        [make_word_data(word, 1, ["ru"]) for word in ("alpha", "beta", "gamma")],
+        db_session,
+    )
+    delete_word("alpha", db_session)
+
+    positions = db_session.scalars(
+        select(WordSampleModel.position).order_by(WordSampleModel.position)
+    ).all()
+    word_ids = set(db_session.scalars(select(WordModel.id)))
+    assert positions == list(range(len(word_ids)))
+    assert {pick_random_word_id(db_session) for _ in range(50)} <= word_ids
+
+
+def test_saved_words_are_served_from_payload_cache(test_client, db_session):
+    test_client.post(
+        "/signup", data={"username": "testuser", "password": "testpassword"}
+    )
+    user_id = get_user_by_username(db_session, "testuser").id
+    populate_database([make_word_data("cached", 2, ["ru", "fr"])], db_session)
+    word_id = db_session.scalar(select(WordModel.id).where(WordModel.word == "cached"))
+    test_client.post(f"/users/{user_id}/words", json={"word_id": str(word_id)})
+
+    first = test_client.get(f"/users/{user_id}/words")
+    hits = test_client.get("/metrics").json()["word_payload_cache"]["hits"]
+    second = test_client.get(f"/users/{user_id}/words")
+
+    assert first.json() == second.json()
+    assert [word["word"] for word in second.json()] == ["cached"]
+    assert test_client.get("/metrics").json()["word_payload_cache"]["hits"] > hits
+
+
+def test_word_payload_cache_evicts_least_recently_used():
+    cache = WordPayloadCache(max_bytes=10)
+    first, second, third = (uuid.uuid4() for _ in range(3))
+    cache.put(first, None, b"12345")
+    cache.put(second, None, b"12345")
+    cache.get(first)
+    cache.put(third, None, b"12345")
+
+    assert cache.get(second) is None
+    assert cache.get(first) == b"12345"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_new_word_is_projected_to_language(test_client, db_session):
+    populate_database([make_word_data("projected", 2, ["ru", "fr"])], db_session)
+    word_id = db_session.scalar(
+        select(WordModel.id).where(WordModel.word == "projected")
+    )
+    db_session.expunge_all()
+    (word,) = get_words_by_ids(db_session, [word_id], "fr")
+    assert all(
+        [translation.language for translation in semantic.translations] == ["fr"]
+        for semantic in word.semantics
+    )
+
+    for _ in range(10):
+        response = test_client.get("/new_word?language=fr")
+        assert all(
+            set(semantic["translations"]) <= {"fr"}
+            for semantic in response.json()["semantics"]
+        )
+    response = test_client.get("/new_word")
+    assert all(
+        set(semantic["translations"]) <= {"ru", "uk", "fr", "de"}
+        for semantic in response.json()["semantics"]
+    )
+
+
+def test_word_audio_supports_ranges_and_etags(test_client, db_session):
+    populate_database([make_word_data("spoken", 1, ["ru"])], db_session)
+    word = db_session.scalars(select(WordModel).where(WordModel.word == "spoken")).one()
+    audio = word.audio
+    url = f"/words/{word.id}/audio"
+
+    response = test_client.get(url)
+    assert response.status_code == 200
+    assert response.content == audio
+    assert "immutable" in response.headers["cache-control"]
+
+    response = test_client.get(url, headers={"Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == audio[2:6]
+    assert response.headers["content-range"] == f"bytes 2-5/{len(audio)}"
+
+    response = test_client.get(url, headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+
+    response = test_client.get(url, headers={"Range": f"bytes={len(audio)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(audio)}"
+
+    word_info = test_client.get("/new_word").json()
+    assert "audio" not in word_info
+    assert word_info["audio_url"] == f"/words/{word_info['word_id']}/audio"
+
+
+def test_get_new_words_returns_distinct_words(test_client, db_session):
+    populate_database(
+        [make_word_data(f"batch{i}", 1, ["ru", "de"]) for i in range(4)], db_session
+    )
+    word_count = db_session.query(WordModel).count()
+
+    response = test_client.get("/new_words?count=3&language=de")
+    word_ids = [word["word_id"] for word in response.json()]
+    assert len(word_ids) == len(set(word_ids)) == 3
+
+    response = test_client.get(f"/new_words?count={word_count + 10}")
+    assert response.status_code == 200
+    assert len(response.json()) == word_count
+
+
+def test_password_pool_rejects_when_saturated():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def saturate():
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordPoolSaturatedException):
+            await pool.run(release.wait)
+        release.set()
+        return await asyncio.gather(*running)
+
+    assert asyncio.run(saturate()) == [True, True]
+    stats = pool.stats()
+    assert (stats["completed"], stats["rejected"]) == (2, 1)
+
+
+def test_password_pool_holds_slots_until_calls_finish():
+    pool = PasswordHashingPool(workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def cancel_running_call():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        try:
+            with pytest.raises(PasswordPoolSaturatedException):
+                await asyncio.wait_for(pool.run(int), 1)
+        finally:
+            release.set()
+        await asyncio.sleep(0.05)
+        with pytest.raises(ZeroDivisionError):
+            await pool.run(divmod, 1, 0)
+
+    asyncio.run(cancel_running_call())
+    stats = pool.stats()
+    assert (stats["queued"], stats["completed"], stats["rejected"]) == (0, 1, 1)
+
+
+def test_saturated_password_pool_asks_to_retry(test_client, monkeypatch):
+    pool = password_pool.password_hashing_pool
+    monkeypatch.setattr(pool, "max_queue", -pool.workers)
+    response = test_client.post(
+        "/signup", data={"username": "busyuser", "password": "testpassword"}
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_repeated_page_loads_authenticate_without_queries(test_client, db_session):
+    test_client.post(
+        "/signup", data={"username": "testuser", "password": "testpassword"}
+    )
+    test_client.post(
+        "/login", data={"username": "testuser", "password": "testpassword"}
+    )
+
+    test_client.get("/learn?language=ru")
+    with count_queries(async_engine.sync_engine) as queries:
+        response = test_client.get("/favorites?language=ru")
+    assert response.status_code == 200
+    assert queries == []
+
+    principal_cache.clear()
+    with count_queries(async_engine.sync_engine) as queries:
+        test_client.get("/tests?language=ru")
+    assert len(queries) == 1
+
+
+def test_translation_catalogs_are_loaded_once():
+    catalog = translations._("fr").__self__
+    assert translations._("fr").__self__ is catalog
+
+    translations.load_translations()
+    assert translations._("fr").__self__ is not catalog
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="requires SIGHUP")
+def test_hangup_reloads_translation_catalogs(monkeypatch):
+    monkeypatch.setattr(main.dictionary_version_watcher, "start", lambda factory: None)
+    monkeypatch.setattr(main.random_word_pool, "start", lambda factory: None)
+    cleared = []
+    monkeypatch.setattr(main.pages.page_cache, "clear", lambda: cleared.append(True))
+    catalog = translations._("fr").__self__
+
+    async def hang_up():
+        async with main.lifespan(app):
+            os.kill(os.getpid(), signal.SIGHUP)
+            await asyncio.sleep(0.05)
+
+    asyncio.run(hang_up())
+    assert translations._("fr").__self__ is not catalog
+    assert cleared == [True]
+
+
+def test_static_pages_are_served_with_etags(test_client):
+    response = test_client.get("/login?language=fr")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = test_client.get("/login?language=fr", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = test_client.get("/login?language=ru", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = test_client.get("/login?language=fr", headers={"Host": "example.org"})
+    assert response.headers["ETag"] == etag
+    assert b'href="/static/css/style.css"' in response.content
+
+
+def test_bulk_import_isolates_failing_words(test_client, db_session):
+    data = [make_word_data(f"bulk{i}", 2, ["ru", "uk"]) for i in range(7)]
+    data[3]["semantics"][1]["translations"]["ru"]["word"] = None
+    del data[5]["transcription"]
+
+    assert bulk_populate_database(data, db_session, batch_size=4) == 5
+
+    words = db_session.scalars(
+        select(WordModel).where(WordModel.word.like("bulk%"))
+    ).all()
+    assert sorted(word.word for word in words) == [
+        "bulk0",
+        "bulk1",
+        "bulk2",
+        "bulk4",
+        "bulk6",
+    ]
+    info = format_word_info(get_words_by_ids(db_session, [words[0].id])[0])
+    assert len(info["semantics"]) == 2
+    positions = db_session.scalars(select(WordSampleModel.position)).all()
+    assert sorted(positions) == list(
+        range(db_session.scalar(select(func.count(WordModel.id))))
+    )
+
+
+def test_dictionary_reader_streams_and_resumes(tmp_path):
+    words = [make_word_data(f"stream{i}", 1, ["ru"]) for i in range(5)]
+    array_path = tmp_path / "words.json"
+    array_path.write_text(json.dumps(words, indent=2, ensure_ascii=False))
+    ndjson_path = tmp_path / "words.ndjson"
+    lines = [json.dumps(word) for word in words]
+    ndjson_path.write_text("\n".join(lines[:2] + ["{broken"] + lines[2:]) + "\n")
+
+    for path in (array_path, ndjson_path):
+        assert list(DictionaryReader(path)) == words
+        reader = DictionaryReader(path)
+        offsets = [reader.offset for _ in reader]
+        assert list(DictionaryReader(path, start_offset=offsets[1])) == words[2:]
+        assert list(DictionaryReader(path, offsets[1], skip_words=1)) == words[3:]
+
+
+def test_ndjson_partitions_cover_every_word_once(tmp_path):
+    words = [make_word_data(f"part{i}", i % 3 + 1, ["ru"]) for i in range(50)]
+    path = tmp_path / "words.ndjson"
+    path.write_text("".join(json.dumps(word) + "\n" for word in words))
+
+    for parts in (1, 3, 8, 64):
+        boundaries = find_line_boundaries(path, parts)
+        assert len(boundaries) == parts + 1
+        partitions = [
+            list(DictionaryReader(path, start, end_offset=end))
+            for start, end in zip(boundaries, boundaries[1:])
+        ]
+        assert [word for partition in partitions for word in partition] == words
+
+
+def test_sync_sample_index_appends_missing_words(test_client, db_session):
+    bulk_populate_database(
+        [make_word_data(f"sync{i}", 1, ["ru"]) for i in range(3)], db_session
+    )
+    db_session.execute(delete(WordSampleModel))
+    db_session.commit()
+    populate_database(
+        [make_word_data(word, 1, ["ru"]) for word in ("cascaded", "indexed")],
+        db_session,
+    )
+    # Leave a free position, like a word deleted by the database cascade
+    cascaded_id = db_session.scalar(
+        select(WordModel.id).where(WordModel.word == "cascaded")
+    )
+    db_session.execute(
+        delete(WordSampleModel).where(WordSampleModel.word_id == cascaded_id)
+    )
+    delete_word_batch(["cascaded"], db_session)
+    db_session.commit()
+
+    sync_sample_index(db_session)
+    db_session.commit()
+
+    rows = db_session.execute(select(WordSampleModel.position, WordSampleModel.word_id))
+    positions, word_ids = zip(*rows)
+    assert sorted(positions) == list(range(len(positions)))
+    assert set(word_ids) == set(db_session.scalars(select(WordModel.id)))
+
+
+def test_delete_words_statement_count_does_not_grow(test_client, db_session):
+    populate_database(
+        [make_word_data(f"doomed{i}", 3, ["ru", "fr"]) for i in range(12)]
+        + [make_word_data("kept", 1, ["ru"])],
+        db_session,
+    )
+    user = create_user(db_session, "cleanup", "not a real hash")
+    doomed_ids = db_session.scalars(
+        select(WordModel.id).where(WordModel.word.like("doomed%"))
+    ).all()
+    for word_id in doomed_ids[:3]:
+        save_word_for_user(db_session, word_id, user.id)
+
+    with count_queries() as one_word:
+        delete_words(["doomed0"], db_session)
+    with count_queries() as many_words:
+        delete_words([f"doomed{i}" for i in range(1, 12)], db_session)
+    assert len(many_words) <= len(one_word)
+
+    assert get_saved_word_ids_for_user(db_session, user.id) == []
+    for foreign_key, parent_id in [
+        (SemanticModel.word_id, WordModel.id),
+        (ExampleModel.semantic_id, SemanticModel.id),
+        (TranslationModel.semantic_id, SemanticModel.id),
+        (ExampleTranslationModel.translation_id, TranslationModel.id),
+    ]:
+        orphans = select(func.count()).where(foreign_key.not_in(select(parent_id)))
+        assert db_session.scalar(orphans) == 0
+    assert "kept" in db_session.scalars(select(WordModel.word)).all()
+    assert not db_session.scalars(
+        select(WordModel.word).where(WordModel.word.like("doomed%"))
+    ).all()
+    positions = db_session.scalars(select(WordSampleModel.position)).all()
+    assert sorted(positions) == list(range(len(positions)))
+    assert len(positions) == db_session.scalar(select(func.count(WordModel.id)))
+
+
+def explain_query_plans(db_session, action):
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        queries.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    connection = db_session.connection().connection
+    return [
+        (
+            statement,
+            [
+                row[3]
+                for row in connection.execute(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            ],
+        )
+        for statement, parameters in queries
+        if not statement.startswith(("SAVEPOINT", "RELEASE"))
+    ]
+
+
+def test_word_lookups_use_indexes(test_client, db_session):
+    populate_database([make_word_data("indexed", 2, ["ru", "fr"])], db_session)
+    user = create_user(db_session, "explain", "not a real hash")
+    word_id = db_session.scalar(select(WordModel.id).where(WordModel.word == "indexed"))
+    save_word_for_user(db_session, word_id, user.id)
+
+    plans = explain_query_plans(
+        db_session, lambda: get_words_by_ids(db_session, [word_id], "ru")
+    ) + explain_query_plans(
+        db_session, lambda: delete_word_batch(["indexed"], db_session)
+    )
+    db_session.rollback()
+    assert len(plans) > 10
+    for statement, plan in plans:
+        assert not [step for step in plan if step.startswith("SCAN")], statement
+
+
+def test_saved_words_are_paginated_by_cursor(test_client, db_session):
+    populate_database(
+        [make_word_data(f"page{i}", 1, ["ru"]) for i in range(5)], db_session
+    )
+    user = create_user(db_session, "paginated", "not a real hash")
+    word_ids = db_session.scalars(
+        select(WordModel.id).where(WordModel.word.like("page%"))
+    ).all()
+    for word_id in word_ids:
+        save_word_for_user(db_session, word_id, user.id)
+
+    all_words = test_client.get(f"/users/{user.id}/words").json()
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = test_client.get(f"/users/{user.id}/words", params=params)
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [word for page in pages for word in page] == all_words
+    assert [word["word_id"] for word in all_words] == [
+        str(word_id) for word_id in reversed(word_ids)
+    ]
+    response = test_client.get(f"/users/{user.id}/words", params={"cursor": "bogus"})
+    assert response.status_code == 400
+
+
+def test_save_and_remove_cost_does_not_depend_on_favorites(test_client, db_session):
+    populate_database(
+        [make_word_data(f"fav{i}", 1, ["ru"]) for i in range(30)], db_session
+    )
+    word_ids = db_session.scalars(
+        select(WordModel.id).where(WordModel.word.like("fav%"))
+    ).all()
+    light_user = create_user(db_session, "light", "not a real hash")
+    heavy_user = create_user(db_session, "heavy", "not a real hash")
+    for word_id in word_ids[1:]:
+        save_word_for_user(db_session, word_id, heavy_user.id)
+
+    costs = []
+    for user in (light_user, heavy_user):
+        with count_queries() as queries:
+            assert save_word_for_user(db_session, word_ids[0], user.id)
+            assert not save_word_for_user(db_session, word_ids[0], user.id)
+            remove_word_for_user(db_session, word_ids[0], user.id)
+        costs.append(queries)
+        assert not [query for query in queries if "audio" in query]
+    assert len(costs[0]) == len(costs[1])
+
+    with pytest.raises(WordNotFound):
+        remove_word_for_user(db_session, word_ids[0], light_user.id)
+    test_client.post(
+        f"/users/{light_user.id}/words", json={"word_id": str(word_ids[1])}
+    )
+    response = test_client.post(
+        f"/users/{light_user.id}/words", json={"word_id": str(word_ids[1])}
+    )
+    assert response.status_code == 200
+    with pytest.raises(UserNotFound):
+        remove_word_for_user(db_session, word_ids[1], uuid.uuid4())
+
+
+def test_saved_words_batch_reports_outcomes(test_client, db_session):
+    populate_database(
+        [make_word_data(f"batch{i}", 1, ["ru"]) for i in range(4)], db_session
+    )
+    word_ids = [
+        str(word_id)
+        for word_id in db_session.scalars(
+            select(WordModel.id).where(WordModel.word.like("batch%"))
+        )
+    ]
+    user = create_user(db_session, "batcher", "not a real hash")
+    save_word_for_user(db_session, uuid.UUID(word_ids[0]), user.id)
+    unknown_id = str(uuid.uuid4())
+
+    response = test_client.post(
+        f"/users/{user.id}/words/batch",
+        json={"add": [word_ids[0]], "remove": [word_ids[0]]},
+    )
+    assert response.status_code == 400
+
+    with count_queries(async_engine.sync_engine) as queries:
+        response = test_client.post(
+            f"/users/{user.id}/words/batch",
+            json={
+                "add": [word_ids[0], word_ids[1], word_ids[2], unknown_id],
+                "remove": [word_ids[3]],
+            },
+        )
+    assert response.json() == {
+        "add": {
+            word_ids[0]: "already_saved",
+            word_ids[1]: "added",
+            word_ids[2]: "added",
+            unknown_id: "unknown_word",
+        },
+        "remove": {word_ids[3]: "not_saved"},
+    }
+    assert len([query for query in queries if "user_favorite_words" in query]) == 3
+
+    response = test_client.post(
+        f"/users/{user.id}/words/batch", json={"remove": word_ids[:2]}
+    )
+    assert response.json()["remove"] == {
+        word_ids[0]: "removed",
+        word_ids[1]: "removed",
+    }
+    assert get_saved_word_ids_for_user(db_session, user.id) == [uuid.UUID(word_ids[2])]
+
+    response = test_client.post(
+        f"/users/{user.id}/words/batch",
+        json={"add": [str(uuid.uuid4()) for _ in range(MAX_SAVED_WORD_CHANGES + 1)]},
+    )
+    assert response.status_code == 422
+
+
+def test_saved_words_revalidate_with_favorites_version(test_client, db_session):
+    populate_database(
+        [make_word_data(f"etag{i}", 1, ["ru"]) for i in range(2)], db_session
+    )
+    word_ids = db_session.scalars(
+        select(WordModel.id).where(WordModel.word.like("etag%"))
+    ).all()
+    user = create_user(db_session, "revalidator", "not a real hash")
+    save_word_for_user(db_session, word_ids[0], user.id)
+
+    response = test_client.get(f"/users/{user.id}/words")
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    with count_queries(async_engine.sync_engine) as queries:
+        response = test_client.get(
+            f"/users/{user.id}/words", headers={"If-None-Match": etag}
+        )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert len(queries) == 1
+
+    assert not save_word_for_user(db_session, word_ids[0], user.id)
+    response = test_client.get(
+        f"/users/{user.id}/words", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    save_word_for_user(db_session, word_ids[1], user.id)
+    response = test_client.get(
+        f"/users/{user.id}/words", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+def test_saved_word_ids_are_cached_per_user(test_client, db_session):
+    populate_database(
+        [make_word_data(f"member{i}", 1, ["ru"]) for i in range(3)], db_session
+    )
+    word_ids = [
+        str(word_id)
+        for word_id in db_session.scalars(
+            select(WordModel.id).where(WordModel.word.like("member%"))
+        )
+    ]
+    user = create_user(db_session, "member", "not a real hash")
+    save_word_for_user(db_session, uuid.UUID(word_ids[0]), user.id)
+
+    response = test_client.get(f"/users/{user.id}/words/ids")
+    assert response.json() == [word_ids[0]]
+    test_client.post(f"/users/{user.id}/words", json={"word_id": word_ids[1]})
+    test_client.post(
+        f"/users/{user.id}/words/batch",
+        json={"add": [word_ids[2]], "remove": [word_ids[0]]},
+    )
+
+    hits = saved_word_id_cache.stats()["hits"]
+    with count_queries(async_engine.sync_engine) as queries:
+        response = test_client.get(f"/users/{user.id}/words/ids")
+    assert sorted(response.json()) == sorted(word_ids[1:])
+    assert saved_word_id_cache.stats()["hits"] == hits + 1
+    assert len(queries) == 1
+
+    delete_word("member1", db_session)
+    response = test_client.get(
+        f"/users/{user.id}/words/ids",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 200
+    assert response.json() == [word_ids[2]]
+
+
+def test_random_word_pool_refills_in_background(test_client, db_session):
+    populate_database(
+        [make_word_data(f"pooled{i}", 1, ["ru", "fr"]) for i in range(3)], db_session
+    )
+    pool = RandomWordPool(4, 2, ["ru"])
+    assert pool.pop("ru") is None
+
+    async def refill_once():
+        pool.start(TestingSessionLocal)
+        while pool.stats()["sizes"]["ru"] < 4:
+            await asyncio.sleep(0.01)
+        await pool.stop()
+
+    asyncio.run(refill_once())
+    word_info, payload = pool.pop("ru")
+    assert json.loads(payload)["word"] == word_info["word"]
+    assert set(word_info["semantics"][0]["translations"]) == {"ru"}
+    assert pool.pop("de") is None
+
+    stats = pool.stats()
+    assert (stats["hits"], stats["underflows"], stats["refill_errors"]) == (1, 1, 0)
+    assert stats["sizes"] == {"ru": 3}
+    assert stats["refill_words_per_second"] > 0
+
+
+def test_dictionary_changes_drop_words_in_memory(test_client, db_session):
+    populate_database([make_word_data("stale", 1, ["ru"])], db_session)
+    pool = RandomWordPool(4, 2, ["ru"])
+    pool.fill(db_session, "ru")
+    cache = WordPayloadCache(1024 * 1024)
+    cache.put(uuid.uuid4(), None, b"{}")
+    watcher = DictionaryVersionWatcher(60, [cache.clear, pool.clear])
+    assert not watcher.check(db_session)
+
+    delete_word("stale", db_session)
+    assert watcher.check(db_session)
+    assert not watcher.check(db_session)
+    assert pool.stats()["sizes"] == {"ru": 0}
+    assert cache.stats()["entries"] == 0
+    assert watcher.stats()["changes"] == 1
+
+
+def test_word_documents_are_kept_in_sync(test_client, db_session):
+    populate_database([make_word_data("documented", 2, ["ru", "fr"])], db_session)
+    bulk_populate_database([make_word_data("bulkdoc", 1, ["uk"])], db_session)
+    word_ids = [
+        db_session.scalar(select(WordModel.id).where(WordModel.word == word))
+        for word in ("documented", "bulkdoc")
+    ]
+    documents = select(WordDocumentModel.language).where(
+        WordDocumentModel.word_id == word_ids[0]
+    )
+    assert set(db_session.scalars(documents)) == {"*", "ru", "uk", "fr", "de"}
+
+    db_session.execute(delete(WordDocumentModel))
+    db_session.commit()
+    rebuild_word_documents(db_session, batch_size=2)
+    word_payload_cache.clear()
+    with count_queries() as queries:
+        payloads = get_word_payloads(db_session, word_ids, "fr")
+    assert len(queries) == 1
+    expected = [
+        serialize_word_info(format_word_info(word, "fr"))
+        for word in get_words_by_ids(db_session, word_ids)
+    ]
+    assert payloads == expected
+
+    delete_word("documented", db_session)
+    documents = select(func.count()).select_from(WordDocumentModel)
+    assert not db_session.scalar(
+        documents.where(WordDocumentModel.word_id == word_ids[0])
+    )
+
+
+def test_imports_skip_disabled_word_documents(test_client, db_session, monkeypatch):
+    monkeypatch.setattr(
+        "vocabulary_builder.db.db_populate.WORD_DOCUMENTS_ENABLED", False
+    )
+    populate_database([make_word_data("undocumented", 1, ["ru"])], db_session)
+    bulk_populate_database([make_word_data("bulkless", 1, ["de"])], db_session)
+    words = db_session.scalars(
+        select(WordModel).where(WordModel.word.in_(["undocumented", "bulkless"]))
+    ).all()
+    documents = select(func.count()).select_from(WordDocumentModel)
+    assert not db_session.scalar(
+        documents.where(WordDocumentModel.word_id.in_([word.id for word in words]))
+    )
+
+    word_payload_cache.clear()
+    payloads = get_word_payloads(db_session, [word.id for word in words])
+    assert payloads == [serialize_word_info(format_word_info(word)) for word in words]
+
+
+def test_words_are_served_from_snapshot(test_client, db_session, tmp_path, monkeypatch):
+    populate_database([make_word_data("snapshotted", 2, ["ru", "fr"])], db_session)
+    path = tmp_path / "words.snapshot"
+    build_snapshot(db_session, path, batch_size=3)
+    snapshot_file = WordSnapshotFile(path, check_interval=0)
+    monkeypatch.setattr(word_info, "word_snapshot", snapshot_file)
+    snapshot = snapshot_file.get()
+
+    word_ids = list(db_session.scalars(select(WordModel.id)))
+    assert snapshot.word_count == len(word_ids)
+    for word in get_words_by_ids(db_session, word_ids):
+        for language in (None, "fr"):
+            expected = format_word_info(word, language)
+            assert snapshot.get_word_info(word.id, language) == expected
+
+    word_payload_cache.clear()
+    with count_queries() as queries:
+        payloads = get_word_payloads(db_session, word_ids, "ru")
+        random_word = word_info.fetch_random_word_data(db_session, "ru")
+    assert not queries
+    assert len(payloads) == len(word_ids)
+    assert random_word["word_id"] in word_ids
+
+    version = snapshot.version
+    populate_database([make_word_data("resnapshotted", 1, ["de"])], db_session)
+    build_snapshot(db_session, path)
+    assert snapshot_file.get().version > version
+    assert snapshot_file.get().word_count == len(word_ids) + 1
+    assert snapshot_file.stats()["reloads"] == 2
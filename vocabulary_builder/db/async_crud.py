@@ -0,0 +1,288 @@
+"""
+Asyncio versions of the CRUD operations in ``crud.py``.
+
+These functions take an ``AsyncSession`` and are meant for ``async def``
+routes, where a synchronous database round trip would block the event loop.
+"""
+from collections.abc import Iterable
+from datetime import datetime
+
+from pydantic import UUID4
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vocabulary_builder.db.crud import (
+    SAVED_WORDS_ORDER,
+    bump_favorites_version,
+    check_user_and_word,
+    saved_word_changes_outcomes,
+    saved_word_delete,
+    saved_word_ids_among,
+    saved_word_insert,
+    user_and_word_exist,
+    word_graph_options,
+)
+from vocabulary_builder.db.models import (
+    ALL_LANGUAGES,
+    UserModel,
+    WordDocumentModel,
+    WordModel,
+    user_favorite_words,
+)
+from vocabulary_builder.exceptions import UserNotFound, WordNotFound
+from vocabulary_builder.utils.saved_word_cache import saved_word_id_cache
+
+
+async def get_words_by_ids(
+    db: AsyncSession, word_ids: Iterable[UUID4], language: str | None = None
+) -> list[WordModel]:
+    """
+    Fetch words with their whole graph loaded, keeping the order of the IDs.
+
+    :param db: The database session.
+    :param word_ids: IDs of the words to fetch.
+    :param language: If given, only translations into this language are loaded.
+    :return: List of found words; unknown IDs are skipped.
+    """
+    word_ids = list(word_ids)
+    if not word_ids:
+        return []
+    stmt = (
+        select(WordModel)
+        .where(WordModel.id.in_(word_ids))
+        .options(*word_graph_options(language))
+    )
+    words = {word.id: word for word in await db.scalars(stmt)}
+    return [words[word_id] for word_id in word_ids if word_id in words]
+
+
+async def get_word_documents(
+    db: AsyncSession, word_ids: Iterable[UUID4], language: str | None = None
+) -> dict[UUID4, bytes]:
+    """
+    Fetch materialized word documents with a single primary key lookup.
+
+    :param db: The database session.
+    :param word_ids: IDs of the words to fetch.
+    :param language: If given, the documents with only translations into this
+        language are fetched.
+    :return: Serialized documents by word ID; words without a document are
+        missing.
+    """
+    word_ids = list(word_ids)
+    if not word_ids:
+        return {}
+    stmt = select(WordDocumentModel.word_id, WordDocumentModel.document).where(
+        WordDocumentModel.word_id.in_(word_ids),
+        WordDocumentModel.language == (language or ALL_LANGUAGES),
+    )
+    return dict((await db.execute(stmt)).all())
+
+
+async def create_user(
+    db: AsyncSession, username: str, hashed_password: str
+) -> UserModel:
+    """
+    Create a new user in the database.
+
+    :param db: The database session.
+    :param username: The username of the new user.
+    :param hashed_password: The plain text password of the new user.
+    :return: The created user record.
+    """
+    user = UserModel(username=username, hashed_password=hashed_password)
+    db.add(user)
+    await db.commit()
+    return user
+
+
+async def get_user_by_username(db: AsyncSession, username: str) -> UserModel:
+    """
+    Retrieve a user by username.
+
+    :param db: SQLAlchemy session object.
+    :param username: Username to search for.
+    :return: UserModel object or None if not found.
+    """
+    stmt = select(UserModel).where(UserModel.username == username)
+    return (await db.scalars(stmt)).first()
+
+
+async def save_word_for_user(db: AsyncSession, word_id: UUID4, user_id: UUID4) -> bool:
+    """
+    Save a word for a user in the database.
+
+    Saving an already saved word does nothing.
+
+    :param db: Database session.
+    :param word_id: ID of the word to save.
+    :param user_id: ID of the user saving the word.
+    :return: True if the word was saved, False if it was already saved.
+    """
+    exist = (await db.execute(user_and_word_exist(user_id, word_id))).one()
+    check_user_and_word(exist)
+
+    stmt = saved_word_insert(
+        db.get_bind().dialect.name, [{"user_id": user_id, "word_id": word_id}]
+    )
+    result = await db.execute(stmt)
+    if not result.rowcount:
+        await db.commit()
+        return False
+    version = (await db.execute(bump_favorites_version(user_id))).scalar_one()
+    await db.commit()
+    saved_word_id_cache.apply(user_id, version, added=[word_id])
+    return True
+
+
+async def remove_word_for_user(
+    db: AsyncSession, word_id: UUID4, user_id: UUID4
+) -> None:
+    """
+    Remove a word for a user in the database.
+
+    :param db: Database session.
+    :param word_id: ID of the word to remove.
+    :param user_id: ID of the user removing the word.
+    """
+    result = await db.execute(saved_word_delete(user_id, [word_id]))
+    if not result.rowcount:
+        await db.rollback()
+        exist = (await db.execute(user_and_word_exist(user_id, word_id))).one()
+        check_user_and_word(exist)
+        raise WordNotFound("The word is not in the user's favorites.")
+    version = (await db.execute(bump_favorites_version(user_id))).scalar_one()
+    await db.commit()
+    saved_word_id_cache.apply(user_id, version, removed=[word_id])
+
+
+async def apply_saved_word_changes(
+    db: AsyncSession, user_id: UUID4, add_ids: list[UUID4], remove_ids: list[UUID4]
+) -> dict[str, dict[UUID4, str]]:
+    """
+    Save and remove a batch of words for a user in one transaction.
+
+    Uses the same number of statements for any batch size.
+
+    :param db: Database session.
+    :param user_id: ID of the user.
+    :param add_ids: IDs of the words to save.
+    :param remove_ids: IDs of the words to remove.
+    :return: Outcome per word ID for the added and for the removed words.
+    """
+    if not await db.scalar(select(UserModel.id).where(UserModel.id == user_id)):
+        raise UserNotFound("There is no user with the specified ID.")
+
+    word_ids = [*add_ids, *remove_ids]
+    known_ids = set(
+        await db.scalars(select(WordModel.id).where(WordModel.id.in_(word_ids)))
+    )
+    saved_ids = set(await db.scalars(saved_word_ids_among(user_id, word_ids)))
+    outcomes = saved_word_changes_outcomes(add_ids, remove_ids, known_ids, saved_ids)
+
+    rows = [
+        {"user_id": user_id, "word_id": word_id}
+        for word_id, outcome in outcomes["add"].items()
+        if outcome == "added"
+    ]
+    if rows:
+        await db.execute(saved_word_insert(db.get_bind().dialect.name, rows))
+    if remove_ids:
+        await db.execute(saved_word_delete(user_id, remove_ids))
+    added = [row["word_id"] for row in rows]
+    removed = saved_ids & set(remove_ids)
+    if not added and not removed:
+        await db.commit()
+        return outcomes
+    version = (await db.execute(bump_favorites_version(user_id))).scalar_one()
+    await db.commit()
+    saved_word_id_cache.apply(user_id, version, added, removed)
+    return outcomes
+
+
+async def get_favorites_version(db: AsyncSession, user_id: UUID4) -> int:
+    """
+    Fetch the favorites version of a user.
+
+    :param db: Database session.
+    :param user_id: ID of the user.
+    :return: Counter incremented whenever the user's favorite words change.
+    """
+    version = await db.scalar(
+        select(UserModel.favorites_version).where(UserModel.id == user_id)
+    )
+    if version is None:
+        raise UserNotFound("There is no user with the specified ID.")
+    return version
+
+
+async def get_saved_word_id_set(
+    db: AsyncSession, user_id: UUID4
+) -> tuple[int, frozenset[UUID4]]:
+    """
+    Fetch the IDs of all words saved by a user, from the cache if it is current.
+
+    :param db: Database session.
+    :param user_id: ID of the user.
+    :return: Favorites version of the user, and the IDs of their saved words.
+    """
+    version = await get_favorites_version(db, user_id)
+    word_ids = saved_word_id_cache.get(user_id, version)
+    if word_ids is None:
+        stmt = select(user_favorite_words.c.word_id).where(
+            user_favorite_words.c.user_id == user_id
+        )
+        word_ids = frozenset(await db.scalars(stmt))
+        saved_word_id_cache.put(user_id, version, word_ids)
+    return version, word_ids
+
+
+async def get_saved_word_ids_for_user(db: AsyncSession, user_id: UUID4) -> list[UUID4]:
+    """
+    Fetch the IDs of all words saved by a user.
+
+    :param db: Database session.
+    :param user_id: ID of the user.
+    :return: List of IDs of the words saved by the user, most recent first.
+    """
+    if not await db.get(UserModel, user_id):
+        raise UserNotFound("There is no user with the specified ID.")
+
+    stmt = (
+        select(user_favorite_words.c.word_id)
+        .where(user_favorite_words.c.user_id == user_id)
+        .order_by(*SAVED_WORDS_ORDER)
+    )
+    return list(await db.scalars(stmt))
+
+
+async def get_saved_word_page(
+    db: AsyncSession,
+    user_id: UUID4,
+    limit: int,
+    after: tuple[datetime, UUID4] | None = None,
+) -> list[tuple[UUID4, datetime]]:
+    """
+    Fetch a page of the words saved by a user, most recent first.
+
+    :param db: Database session.
+    :param user_id: ID of the user.
+    :param limit: Maximum number of words in the page.
+    :param after: Save time and ID of the last word of the previous page.
+    :return: List of IDs and save times of the words in the page.
+    """
+    if not await db.get(UserModel, user_id):
+        raise UserNotFound("There is no user with the specified ID.")
+
+    stmt = (
+        select(user_favorite_words.c.word_id, user_favorite_words.c.created_at)
+        .where(user_favorite_words.c.user_id == user_id)
+        .order_by(*SAVED_WORDS_ORDER)
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(user_favorite_words.c.created_at, user_favorite_words.c.word_id)
+            < tuple_(*after)
+        )
+    return [tuple(row) for row in await db.execute(stmt)]
@@ -1,24 +1,138 @@
 """CRUD operations for interacting with the database."""
+from collections.abc import Iterable
+
 from pydantic import UUID4
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Delete,
+    Insert,
+    LargeBinary,
+    Select,
+    Update,
+    delete,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
-from vocabulary_builder.db.models import UserModel, WordModel
+from vocabulary_builder.db.models import (
+    ALL_LANGUAGES,
+    DICTIONARY_VERSION_ID,
+    DictionaryVersionModel,
+    SemanticModel,
+    TranslationModel,
+    UserModel,
+    WordDocumentModel,
+    WordModel,
+    user_favorite_words,
+)
 from vocabulary_builder.exceptions import UserNotFound, WordNotFound
+from vocabulary_builder.utils.saved_word_cache import saved_word_id_cache
+
+
+# Saved words are listed most recent first; the ID breaks ties between
+# words saved at the same time, so the order is stable for pagination
+SAVED_WORDS_ORDER = (
+    user_favorite_words.c.created_at.desc(),
+    user_favorite_words.c.word_id.desc(),
+)
+
+
+def word_graph_options(language: str | None = None) -> tuple[LoaderOption, ...]:
+    """
+    Build loader options that hydrate the whole word graph eagerly.
+
+    Every level of the graph is fetched with one ``SELECT ... WHERE ... IN``
+    statement, so loading any number of words costs the same five queries
+    regardless of how many semantics, examples or languages they have.
+
+    :param language: If given, only translations into this language are loaded.
+    :return: Loader options to pass to ``Select.options``.
+    """
+    translations = SemanticModel.translations
+    if language is not None:
+        translations = translations.and_(TranslationModel.language == language)
+
+    semantics = selectinload(WordModel.semantics)
+    return (
+        semantics.selectinload(SemanticModel.examples),
+        semantics.selectinload(translations).selectinload(TranslationModel.examples),
+    )
+
+
+def get_words_by_ids(
+    db: Session, word_ids: Iterable[UUID4], language: str | None = None
+) -> list[WordModel]:
+    """
+    Fetch words with their whole graph loaded, keeping the order of the IDs.
+
+    :param db: The database session.
+    :param word_ids: IDs of the words to fetch.
+    :param language: If given, only translations into this language are loaded.
+    :return: List of found words; unknown IDs are skipped.
+    """
+    word_ids = list(word_ids)
+    if not word_ids:
+        return []
+    stmt = (
+        select(WordModel)
+        .where(WordModel.id.in_(word_ids))
+        .options(*word_graph_options(language))
+    )
+    words = {word.id: word for word in db.scalars(stmt)}
+    return [words[word_id] for word_id in word_ids if word_id in words]
+
+
+def get_word_documents(
+    db: Session, word_ids: Iterable[UUID4], language: str | None = None
+) -> dict[UUID4, bytes]:
+    """
+    Fetch materialized word documents with a single primary key lookup.
+
+    :param db: The database session.
+    :param word_ids: IDs of the words to fetch.
+    :param language: If given, the documents with only translations into this
+        language are fetched.
+    :return: Serialized documents by word ID; words without a document are
+        missing.
+    """
+    word_ids = list(word_ids)
+    if not word_ids:
+        return {}
+    stmt = select(WordDocumentModel.word_id, WordDocumentModel.document).where(
+        WordDocumentModel.word_id.in_(word_ids),
+        WordDocumentModel.language == (language or ALL_LANGUAGES),
+    )
+    return dict(db.execute(stmt).all())
 
 
-def get_random_word(db: Session):
+def get_audio_length(db: Session, word_id: UUID4) -> int | None:
     """
-    Fetch a random word from the database.
+    Get the size of a word's pronunciation audio without loading it.
 
     :param db: The database session.
-    :return: The random word record from the database.
+    :param word_id: ID of the word.
+    :return: Size of the audio in bytes, or None if there is no such word.
+    """
+    stmt = select(func.length(WordModel.audio)).where(WordModel.id == word_id)
+    return db.scalar(stmt)
+
+
+def read_audio_chunk(db: Session, word_id: UUID4, offset: int, size: int) -> bytes:
     """
-    # Select a random word
-    stmt = select(WordModel).order_by(func.random()).limit(1)
-    random_word = db.scalars(stmt).first()
+    Read a slice of a word's pronunciation audio.
 
-    return random_word
+    :param db: The database session.
+    :param word_id: ID of the word.
+    :param offset: Zero-based offset of the first byte to read.
+    :param size: Number of bytes to read.
+    :return: The requested bytes.
+    """
+    chunk = func.substr(WordModel.audio, offset + 1, size, type_=LargeBinary)
+    stmt = select(chunk).where(WordModel.id == word_id)
+    return bytes(db.scalar(stmt) or b"")
 
 
 def create_user(db: Session, username: str, hashed_password: str) -> UserModel:
@@ -48,23 +162,148 @@ def get_user_by_username(db: Session, username: str) -> UserModel:
     return db.scalars(stmt).first()
 
 
-def save_word_for_user(db: Session, word_id: UUID4, user_id: UUID4) -> None:
+def saved_word_insert(dialect_name: str, rows: list[dict]) -> Insert:
+    """
+    Build an INSERT into ``user_favorite_words`` that skips saved words.
+
+    :param dialect_name: Name of the database dialect.
+    :param rows: Rows with ``user_id`` and ``word_id``.
+    :return: ``INSERT ... ON CONFLICT DO NOTHING`` statement.
+    """
+    dialect_insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+    stmt = dialect_insert[dialect_name](user_favorite_words).values(rows)
+    return stmt.on_conflict_do_nothing()
+
+
+def user_and_word_exist(user_id: UUID4, word_id: UUID4) -> Select:
+    """
+    Build a query that checks whether a user and a word exist.
+
+    Both checks are primary key lookups in one round trip, without loading
+    either row.
+
+    :param user_id: ID of the user.
+    :param word_id: ID of the word.
+    :return: Query returning a pair of booleans.
+    """
+    return select(
+        select(UserModel.id).where(UserModel.id == user_id).exists(),
+        select(WordModel.id).where(WordModel.id == word_id).exists(),
+    )
+
+
+def saved_word_ids_among(user_id: UUID4, word_ids: list[UUID4]) -> Select:
+    """
+    Build a query for the IDs among the given ones that a user has saved.
+
+    :param user_id: ID of the user.
+    :param word_ids: IDs of the words.
+    :return: Query returning word IDs.
+    """
+    return select(user_favorite_words.c.word_id).where(
+        user_favorite_words.c.user_id == user_id,
+        user_favorite_words.c.word_id.in_(word_ids),
+    )
+
+
+def saved_word_delete(user_id: UUID4, word_ids: list[UUID4]) -> Delete:
+    """
+    Build a DELETE of saved words of a user.
+
+    :param user_id: ID of the user.
+    :param word_ids: IDs of the words to remove.
+    :return: DELETE statement.
+    """
+    return delete(user_favorite_words).where(
+        user_favorite_words.c.user_id == user_id,
+        user_favorite_words.c.word_id.in_(word_ids),
+    )
+
+
+def bump_favorites_version(user_id: UUID4) -> Update:
+    """
+    Build an UPDATE that increments the favorites version of a user.
+
+    :param user_id: ID of the user.
+    :return: UPDATE statement returning the new version.
+    """
+    return (
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        .values(favorites_version=UserModel.favorites_version + 1)
+        .returning(UserModel.favorites_version)
+    )
+
+
+def get_dictionary_version(db: Session) -> int:
+    """
+    Get the version of the dictionary.
+
+    :param db: Database session.
+    :return: Dictionary version, 0 if it was never incremented.
+    """
+    stmt = select(DictionaryVersionModel.version).where(
+        DictionaryVersionModel.id == DICTIONARY_VERSION_ID
+    )
+    return db.scalar(stmt) or 0
+
+
+def bump_dictionary_version(db: Session) -> None:
+    """
+    Increment the version of the dictionary, creating its row if needed.
+
+    The caller is responsible for committing the session, in the same
+    transaction as the changes to the words.
+
+    :param db: Database session.
+    """
+    result = db.execute(
+        update(DictionaryVersionModel)
+        .where(DictionaryVersionModel.id == DICTIONARY_VERSION_ID)
+        .values(version=DictionaryVersionModel.version + 1)
+    )
+    if not result.rowcount:
+        db.add(DictionaryVersionModel(id=DICTIONARY_VERSION_ID, version=1))
+        db.flush()
+
+
+def check_user_and_word(exist: tuple[bool, bool]) -> None:
+    """
+    Raise an error if the user or the word doesn't exist.
+
+    :param exist: Result of the ``user_and_word_exist`` query.
+    """
+    user_exists, word_exists = exist
+    if not user_exists:
+        raise UserNotFound("There is no user with the specified ID.")
+    if not word_exists:
+        raise WordNotFound("There is no word with the specified ID.")
+
+
+def save_word_for_user(db: Session, word_id: UUID4, user_id: UUID4) -> bool:
     """
     Save a word for a user in the database.
 
+    Saving an already saved word does nothing.
+
     :param db: Database session.
     :param word_id: ID of the word to save.
     :param user_id: ID of the user saving the word.
+    :return: True if the word was saved, False if it was already saved.
     """
-    user = db.get(UserModel, user_id)
-    if not user:
-        raise UserNotFound("There is no user with the specified ID.")
-    word = db.get(WordModel, word_id)
-    if not word:
-        raise WordNotFound("There is no word with the specified ID.")
+    check_user_and_word(db.execute(user_and_word_exist(user_id, word_id)).one())
 
-    user.favorite_words.append(word)
+    stmt = saved_word_insert(
+        db.get_bind().dialect.name, [{"user_id": user_id, "word_id": word_id}]
+    )
+    result = db.execute(stmt)
+    if not result.rowcount:
+        db.commit()
+        return False
+    version = db.execute(bump_favorites_version(user_id)).scalar_one()
     db.commit()
+    saved_word_id_cache.apply(user_id, version, added=[word_id])
+    return True
 
 
 def remove_word_for_user(db: Session, word_id: UUID4, user_id: UUID4) -> None:
@@ -75,30 +314,69 @@ def remove_word_for_user(db: Session, word_id: UUID4, user_id: UUID4) -> None:
     :param word_id: ID of the word to remove.
     :param user_id: ID of the user removing the word.
     """
-    user = db.get(UserModel, user_id)
-    if not user:
-        raise UserNotFound("There is no user with the specified ID.")
-    word = db.get(WordModel, word_id)
-    if not word:
-        raise WordNotFound("There is no word with the specified ID.")
-
-    if word in user.favorite_words:
-        user.favorite_words.remove(word)
-        db.commit()
-    else:
+    result = db.execute(saved_word_delete(user_id, [word_id]))
+    if not result.rowcount:
+        db.rollback()
+        check_user_and_word(db.execute(user_and_word_exist(user_id, word_id)).one())
         raise WordNotFound("The word is not in the user's favorites.")
+    version = db.execute(bump_favorites_version(user_id)).scalar_one()
+    db.commit()
+    saved_word_id_cache.apply(user_id, version, removed=[word_id])
+
+
+def saved_word_changes_outcomes(
+    add_ids: list[UUID4],
+    remove_ids: list[UUID4],
+    known_ids: set[UUID4],
+    saved_ids: set[UUID4],
+) -> dict[str, dict[UUID4, str]]:
+    """
+    Work out the outcome of every change in a batch of saved word changes.
+
+    :param add_ids: IDs of the words to save.
+    :param remove_ids: IDs of the words to remove.
+    :param known_ids: IDs from the batch that exist in the database.
+    :param saved_ids: IDs from the batch that the user had already saved.
+    :return: Outcome per word ID for the added and for the removed words.
+    """
+    added = {
+        word_id: (
+            "unknown_word"
+            if word_id not in known_ids
+            else "already_saved"
+            if word_id in saved_ids
+            else "added"
+        )
+        for word_id in add_ids
+    }
+    removed = {
+        word_id: (
+            "unknown_word"
+            if word_id not in known_ids
+            else "removed"
+            if word_id in saved_ids
+            else "not_saved"
+        )
+        for word_id in remove_ids
+    }
+    return {"add": added, "remove": removed}
 
 
-def get_all_saved_words_for_user(db: Session, user_id: UUID4) -> list[WordModel]:
+def get_saved_word_ids_for_user(db: Session, user_id: UUID4) -> list[UUID4]:
     """
-    Fetch all saved words for a user from the database.
+    Fetch the IDs of all words saved by a user.
 
     :param db: Database session.
     :param user_id: ID of the user.
-    :return: List of words saved by the user.
+    :return: List of IDs of the words saved by the user, most recent first.
     """
     user = db.get(UserModel, user_id)
     if not user:
         raise UserNotFound("There is no user with the specified ID.")
 
-    return user.favorite_words
+    stmt = (
+        select(user_favorite_words.c.word_id)
+        .where(user_favorite_words.c.user_id == user_id)
+        .order_by(*SAVED_WORDS_ORDER)
+    )
+    return list(db.scalars(stmt))
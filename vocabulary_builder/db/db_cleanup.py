@@ -1,59 +1,133 @@
 """Database cleanup utility for deleting words and related records."""
-import sys
+import argparse
+from collections.abc import Iterable
+from pathlib import Path
+from uuid import UUID
 
+from sqlalchemy import ColumnElement, Update, delete, select, update
 from sqlalchemy.orm import Session
 
+from vocabulary_builder.db.crud import bump_dictionary_version
 from vocabulary_builder.db.database import SessionLocal
 from vocabulary_builder.db.models import (
     ExampleModel,
     ExampleTranslationModel,
     SemanticModel,
     TranslationModel,
+    UserModel,
+    WordDocumentModel,
     WordModel,
+    user_favorite_words,
 )
+from vocabulary_builder.db.sampler import clear_sample_index, remove_from_sample_index
 
 
-def delete_word(word: str, session: Session) -> None:
+DELETE_BATCH_SIZE = 500
+
+
+def bump_favorites_versions(
+    favorites_filter: ColumnElement[bool] | None = None,
+) -> Update:
     """
-    Delete all records related to a specific word from the database.
+    Build an UPDATE that increments the favorites version of users.
 
-    :param word: Word to delete.
+    Only users losing favorite words are updated, so their cached favorites
+    are no longer used.
+
+    :param favorites_filter: Condition on ``user_favorite_words`` selecting
+        the favorites being deleted, or None for all of them.
+    :return: UPDATE statement.
+    """
+    user_ids = select(user_favorite_words.c.user_id)
+    if favorites_filter is not None:
+        user_ids = user_ids.where(favorites_filter)
+    return (
+        update(UserModel)
+        .where(UserModel.id.in_(user_ids))
+        .values(favorites_version=UserModel.favorites_version + 1)
+    )
+
+
+def delete_word_batch(words: list[str], session: Session) -> list[UUID]:
+    """
+    Delete words and all their records with a fixed number of statements.
+
+    Rows are deleted children first, so the deletion doesn't depend on the
+    database enforcing ``ON DELETE CASCADE``. The dictionary version is
+    incremented, so running applications drop the deleted words from memory.
+    The caller is responsible for committing the session.
+
+    :param words: Words to delete.
     :param session: SQLAlchemy session object.
+    :return: IDs of the deleted word records.
     """
-    try:
-        words = session.query(WordModel).filter_by(word=word).all()
+    word_ids = session.scalars(
+        select(WordModel.id).where(WordModel.word.in_(words))
+    ).all()
+    if not word_ids:
+        return []
+    remove_from_sample_index(session, word_ids)
+
+    semantic_ids = select(SemanticModel.id).where(SemanticModel.word_id.in_(word_ids))
+    translation_ids = select(TranslationModel.id).where(
+        TranslationModel.semantic_id.in_(semantic_ids)
+    )
+    for stmt in (
+        bump_favorites_versions(user_favorite_words.c.word_id.in_(word_ids)),
+        delete(ExampleTranslationModel).where(
+            ExampleTranslationModel.translation_id.in_(translation_ids)
+        ),
+        delete(ExampleModel).where(ExampleModel.semantic_id.in_(semantic_ids)),
+        delete(TranslationModel).where(TranslationModel.semantic_id.in_(semantic_ids)),
+        delete(SemanticModel).where(SemanticModel.word_id.in_(word_ids)),
+        delete(user_favorite_words).where(user_favorite_words.c.word_id.in_(word_ids)),
+        delete(WordDocumentModel).where(WordDocumentModel.word_id.in_(word_ids)),
+        delete(WordModel).where(WordModel.id.in_(word_ids)),
+    ):
+        session.execute(stmt.execution_options(synchronize_session=False))
+    bump_dictionary_version(session)
+    return list(word_ids)
+
+
+def delete_words(words: Iterable[str], session: Session) -> int:
+    """
+    Delete words and all their records, committing every batch of words.
 
-        for word_record in words:
-            semantics = (
-                session.query(SemanticModel).filter_by(word_id=word_record.id).all()
+    :param words: Words to delete.
+    :param session: SQLAlchemy session object.
+    :return: Number of deleted word records.
+    """
+    words = list(dict.fromkeys(words))
+    deleted_words = 0
+    for start in range(0, len(words), DELETE_BATCH_SIZE):
+        end = start + DELETE_BATCH_SIZE
+        batch = words[start:end]
+        try:
+            word_ids = delete_word_batch(batch, session)
+            session.commit()
+            deleted_words += len(word_ids)
+        except Exception as e:
+            session.rollback()
+            print(
+                f"Error deleting records for {len(batch)} words "
+                f"starting with '{batch[0]}': {e}"
             )
+    print(
+        f"Successfully deleted {deleted_words} word records for {len(words)} words "
+        "from the database."
+    )
+    return deleted_words
 
-            for semantic in semantics:
-                examples = (
-                    session.query(ExampleModel).filter_by(semantic_id=semantic.id).all()
-                )
-                for example in examples:
-                    session.delete(example)
-
-                translations = (
-                    session.query(TranslationModel)
-                    .filter_by(semantic_id=semantic.id)
-                    .all()
-                )
-                for translation in translations:
-                    example_translations = (
-                        session.query(ExampleTranslationModel)
-                        .filter_by(translation_id=translation.id)
-                        .all()
-                    )
-                    for example_translation in example_translations:
-                        session.delete(example_translation)
-                    session.delete(translation)
-
-                session.delete(semantic)
-
-            session.delete(word_record)
 
+def delete_word(word: str, session: Session) -> None:
+    """
+    Delete all records related to a specific word from the database.
+
+    :param word: Word to delete.
+    :param session: SQLAlchemy session object.
+    """
+    try:
+        delete_word_batch([word], session)
         session.commit()
         print(
             f"Successfully deleted all records for the word '{word}' from the database."
@@ -70,11 +144,16 @@ def delete_all_words(session: Session):
     :param session: SQLAlchemy session object.
     """
     try:
+        clear_sample_index(session)
+        session.execute(bump_favorites_versions())
+        session.execute(delete(user_favorite_words))
         session.query(ExampleTranslationModel).delete()
         session.query(ExampleModel).delete()
         session.query(TranslationModel).delete()
         session.query(SemanticModel).delete()
+        session.query(WordDocumentModel).delete()
         session.query(WordModel).delete()
+        bump_dictionary_version(session)
         session.commit()
         print("Successfully deleted all words and related records from the database.")
     except Exception as e:
@@ -84,18 +163,24 @@ def delete_all_words(session: Session):
 
 def main():
     """Delete words from the database."""
-    if len(sys.argv) != 2:
-        print("Usage: db_cleanup.py <word|--all>")
-        sys.exit(1)
-
-    argument = sys.argv[1]
+    parser = argparse.ArgumentParser(description=__doc__)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("word", nargs="?", help="word to delete")
+    target.add_argument("--all", action="store_true", help="delete every word")
+    target.add_argument(
+        "--file", type=Path, help="path to a file with one word to delete per line"
+    )
+    args = parser.parse_args()
 
     session = SessionLocal()
     try:
-        if argument == "--all":
+        if args.all:
             delete_all_words(session)
+        elif args.file:
+            lines = args.file.read_text(encoding="utf-8").splitlines()
+            delete_words([line.strip() for line in lines if line.strip()], session)
         else:
-            delete_word(argument, session)
+            delete_word(args.word, session)
     finally:
         session.close()
 
@@ -1,13 +1,25 @@
 """Database population utility for adding words and related records from a JSON file."""
-import json
+import argparse
+import csv
+import io
+import multiprocessing
 import sys
+import time
 import uuid
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from vocabulary_builder.db.database import SessionLocal
+from vocabulary_builder.db.crud import bump_dictionary_version
+from vocabulary_builder.db.database import BaseModel, SessionLocal
+from vocabulary_builder.db.dictionary_reader import (
+    DictionaryReader,
+    find_line_boundaries,
+)
 from vocabulary_builder.db.models import (
     ExampleModel,
     ExampleTranslationModel,
@@ -15,6 +27,21 @@ from vocabulary_builder.db.models import (
     TranslationModel,
     WordModel,
 )
+from vocabulary_builder.db.sampler import add_to_sample_index, sync_sample_index
+from vocabulary_builder.db.word_documents import write_word_documents
+from vocabulary_builder.utils.word_info import WORD_DOCUMENTS_ENABLED
+
+
+DEFAULT_BATCH_SIZE = 1000
+# Tables in the order their rows have to be inserted to satisfy foreign keys
+BULK_INSERT_ORDER = (
+    WordModel,
+    SemanticModel,
+    ExampleModel,
+    TranslationModel,
+    ExampleTranslationModel,
+)
+WordRows = dict[type[BaseModel], list[dict[str, Any]]]
 
 
 def create_audio_placeholder() -> bytes:
@@ -22,17 +49,6 @@ def create_audio_placeholder() -> bytes:
     return b"Audio Placeholder"
 
 
-def load_json(file_path: str) -> list[dict[str, Any]]:
-    """
-    Load JSON data from a file.
-
-    :param file_path: Path to the JSON file.
-    :return: Parsed JSON data.
-    """
-    with open(file_path, "r", encoding="utf-8") as file:
-        return json.load(file)
-
-
 def populate_database(data: list[dict[str, Any]], session: Session) -> None:
     """
     Populate the database with word data.
@@ -86,6 +102,9 @@ def populate_database(data: list[dict[str, Any]], session: Session) -> None:
                         )
                         session.add(example_translation)
 
+            add_to_sample_index(session, [word.id])
+            if WORD_DOCUMENTS_ENABLED:
+                write_word_documents(session, [word.id])
             session.commit()
             successful_words += 1
         except Exception as e:
@@ -93,28 +112,416 @@ def populate_database(data: list[dict[str, Any]], session: Session) -> None:
             session.rollback()
             continue
 
+    bump_dictionary_version(session)
+    session.commit()
     print(
         f"Successfully added {successful_words} out of {total_words} words "
         "to the database."
     )
 
 
+def build_word_rows(word_data: dict[str, Any]) -> WordRows:
+    """
+    Build the rows of every table for a word, generating the IDs client-side.
+
+    :param word_data: Word data dictionary.
+    :return: Rows to insert, grouped by model.
+    """
+    rows: WordRows = {model: [] for model in BULK_INSERT_ORDER}
+    word_id = uuid.uuid4()
+    rows[WordModel].append(
+        {
+            "id": word_id,
+            "word": word_data["word"],
+            "part_of_speech": word_data["part_of_speech"],
+            "transcription": word_data["transcription"],
+            "audio": create_audio_placeholder(),
+        }
+    )
+    for semantic_data in word_data["semantics"]:
+        semantic_id = uuid.uuid4()
+        rows[SemanticModel].append({"id": semantic_id, "word_id": word_id})
+        for example_text in semantic_data["examples"]:
+            rows[ExampleModel].append(
+                {
+                    "id": uuid.uuid4(),
+                    "semantic_id": semantic_id,
+                    "example": example_text,
+                }
+            )
+        for lang, translation_data in semantic_data["translations"].items():
+            translation_id = uuid.uuid4()
+            rows[TranslationModel].append(
+                {
+                    "id": translation_id,
+                    "semantic_id": semantic_id,
+                    "language": lang,
+                    "word": translation_data["word"],
+                }
+            )
+            for translated_example_text in translation_data["examples"]:
+                rows[ExampleTranslationModel].append(
+                    {
+                        "id": uuid.uuid4(),
+                        "translation_id": translation_id,
+                        "example": translated_example_text,
+                    }
+                )
+    return rows
+
+
+def format_copy_value(value: Any) -> Any:
+    """
+    Format a value for a CSV ``COPY`` stream.
+
+    :param value: Column value.
+    :return: Value in the text representation expected by PostgreSQL.
+    """
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    return value
+
+
+def copy_rows(session: Session, model: type[BaseModel], rows: list[dict]) -> None:
+    """
+    Write rows to a PostgreSQL table with ``COPY FROM STDIN``.
+
+    :param session: SQLAlchemy session object.
+    :param model: Model of the target table.
+    :param rows: Rows to write; all of them must have the same columns.
+    """
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    # Quoting every value keeps empty strings from being read as NULL
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    for row in rows:
+        writer.writerow([format_copy_value(row[column]) for column in columns])
+    buffer.seek(0)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def insert_rows(session: Session, model: type[BaseModel], rows: list[dict]) -> None:
+    """
+    Write rows to a table in a single batch.
+
+    Uses ``COPY`` on PostgreSQL with psycopg2 and a multi-row ``INSERT``
+    otherwise.
+
+    :param session: SQLAlchemy session object.
+    :param model: Model of the target table.
+    :param rows: Rows to write.
+    """
+    if not rows:
+        return
+    dialect = session.get_bind().dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        copy_rows(session, model, rows)
+    else:
+        session.execute(insert(model), rows)
+
+
+def import_chunk(
+    session: Session,
+    chunk: list[tuple[str, WordRows]],
+    update_sample_index: bool = True,
+) -> int:
+    """
+    Import a chunk of words in one transaction.
+
+    If the transaction fails, the chunk is split in halves that are retried
+    separately, so a failing word is isolated without losing the rest.
+
+    :param session: SQLAlchemy session object.
+    :param chunk: Pairs of word and its rows.
+    :param update_sample_index: Append the words to the sample index.
+    :return: Number of imported words.
+    """
+    word_ids = [rows[WordModel][0]["id"] for _, rows in chunk]
+    try:
+        for model in BULK_INSERT_ORDER:
+            insert_rows(
+                session, model, [row for _, rows in chunk for row in rows[model]]
+            )
+        if update_sample_index:
+            add_to_sample_index(session, word_ids)
+        if WORD_DOCUMENTS_ENABLED:
+            write_word_documents(session, word_ids)
+        session.commit()
+        return len(chunk)
+    except Exception as e:
+        session.rollback()
+        if len(chunk) == 1:
+            print(f"Error populating database for word '{chunk[0][0]}': {e}")
+            return 0
+        middle = len(chunk) // 2
+        return import_chunk(
+            session, chunk[:middle], update_sample_index
+        ) + import_chunk(session, chunk[middle:], update_sample_index)
+
+
+def import_words(
+    data: Iterable[dict[str, Any]],
+    session: Session,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_chunk_imported: Callable[[], None] | None = None,
+    update_sample_index: bool = True,
+) -> tuple[int, int]:
+    """
+    Import words in chunks of ``batch_size`` words, one transaction per chunk.
+
+    Words are consumed lazily, so at most one chunk is held in memory.
+
+    :param data: Iterable of word data dictionaries.
+    :param session: SQLAlchemy session object.
+    :param batch_size: Number of words per transaction.
+    :param on_chunk_imported: Function called after every chunk is committed.
+    :param update_sample_index: Append the words to the sample index.
+    :return: Number of words read and number of imported words.
+    """
+    total_words = 0
+    successful_words = 0
+
+    def flush_chunk() -> None:
+        nonlocal successful_words
+        successful_words += import_chunk(session, chunk, update_sample_index)
+        chunk.clear()
+        if on_chunk_imported is not None:
+            on_chunk_imported()
+
+    chunk: list[tuple[str, WordRows]] = []
+    for word_data in data:
+        total_words += 1
+        try:
+            chunk.append((word_data["word"], build_word_rows(word_data)))
+        except (KeyError, TypeError, AttributeError) as e:
+            print(f"Error populating database for word '{word_data}': {e}")
+        if len(chunk) == batch_size:
+            flush_chunk()
+    if chunk:
+        flush_chunk()
+    return total_words, successful_words
+
+
+def print_import_summary(
+    total_words: int, successful_words: int, elapsed: float
+) -> None:
+    """
+    Print the number of imported words and the import throughput.
+
+    :param total_words: Number of words read.
+    :param successful_words: Number of imported words.
+    :param elapsed: Duration of the import in seconds.
+    """
+    print(
+        f"Successfully added {successful_words} out of {total_words} words "
+        f"to the database ({successful_words / elapsed:.0f} words/sec)."
+    )
+
+
+def bulk_populate_database(
+    data: Iterable[dict[str, Any]],
+    session: Session,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_chunk_imported: Callable[[], None] | None = None,
+) -> int:
+    """
+    Populate the database with word data in large batches.
+
+    Rows are grouped per table and written with one statement per table and
+    chunk, and every chunk of ``batch_size`` words is committed separately.
+    The dictionary version is incremented once every chunk is imported.
+
+    :param data: Iterable of word data dictionaries.
+    :param session: SQLAlchemy session object.
+    :param batch_size: Number of words per transaction.
+    :param on_chunk_imported: Function called after every chunk is committed.
+    :return: Number of imported words.
+    """
+    start = time.perf_counter()
+    total_words, successful_words = import_words(
+        data, session, batch_size, on_chunk_imported
+    )
+    bump_dictionary_version(session)
+    session.commit()
+    print_import_summary(total_words, successful_words, time.perf_counter() - start)
+    return successful_words
+
+
+def import_partition(
+    file_path: str, start_offset: int, end_offset: int, batch_size: int
+) -> tuple[int, int]:
+    """
+    Import a byte range of an NDJSON file in a worker process.
+
+    :param file_path: Path to the NDJSON file.
+    :param start_offset: Offset of the first line of the range.
+    :param end_offset: Offset just after the last line of the range.
+    :param batch_size: Number of words per transaction.
+    :return: Number of words read and number of imported words.
+    """
+    reader = DictionaryReader(file_path, start_offset, end_offset=end_offset)
+    with SessionLocal() as session:
+        return import_words(reader, session, batch_size, update_sample_index=False)
+
+
+def import_word_list(data: list[dict[str, Any]], batch_size: int) -> tuple[int, int]:
+    """
+    Import a chunk of a JSON array file in a worker process.
+
+    :param data: List of word data dictionaries.
+    :param batch_size: Number of words per transaction.
+    :return: Number of words read and number of imported words.
+    """
+    with SessionLocal() as session:
+        return import_words(data, session, batch_size, update_sample_index=False)
+
+
+def parallel_populate_database(
+    file_path: str, workers: int, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Populate the database from a dictionary file with a pool of processes.
+
+    An NDJSON file is split into one byte range per worker, and every worker
+    parses and imports its own range. A JSON array can only be split by
+    parsing it, so the coordinator reads it and hands out chunks of words.
+    Each worker uses its own session, and the sample index is synchronized
+    once all of them are done, because positions can't be assigned
+    concurrently.
+
+    :param file_path: Path to the JSON array or NDJSON file.
+    :param workers: Number of worker processes.
+    :param batch_size: Number of words per transaction.
+    :return: Number of imported words.
+    """
+    start = time.perf_counter()
+    reader = DictionaryReader(file_path)
+    # Spawned workers create their own engine instead of sharing pooled
+    # connections inherited through fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        if reader.is_array:
+            # Bound the chunks in flight so memory doesn't grow with the file
+            futures: set[Future] = set()
+            results = []
+            for word_list in iter_word_lists(reader, batch_size):
+                if len(futures) >= 2 * workers:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+                futures.add(executor.submit(import_word_list, word_list, batch_size))
+            results.extend(future.result() for future in futures)
+        else:
+            boundaries = find_line_boundaries(file_path, workers)
+            results = list(
+                executor.map(
+                    import_partition,
+                    [file_path] * workers,
+                    boundaries[:-1],
+                    boundaries[1:],
+                    [batch_size] * workers,
+                )
+            )
+
+    with SessionLocal() as session:
+        sync_sample_index(session)
+        bump_dictionary_version(session)
+        session.commit()
+    total_words = sum(total for total, _ in results)
+    successful_words = sum(successful for _, successful in results)
+    print_import_summary(total_words, successful_words, time.perf_counter() - start)
+    return successful_words
+
+
+def iter_word_lists(
+    data: Iterable[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Group words into lists.
+
+    :param data: Iterable of word data dictionaries.
+    :param size: Maximum number of words per list.
+    :return: Iterator over lists of word data dictionaries.
+    """
+    word_list = []
+    for word_data in data:
+        word_list.append(word_data)
+        if len(word_list) == size:
+            yield word_list
+            word_list = []
+    if word_list:
+        yield word_list
+
+
 def main() -> None:
     """Populate the database."""
-    if len(sys.argv) != 2:
-        print("Usage: db_populate.py <path_to_json_file>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "json_file_path", help="path to the JSON array or NDJSON file with words"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="number of words imported per transaction",
+    )
+    parser.add_argument(
+        "--resume-offset",
+        type=int,
+        default=0,
+        help="byte offset to resume an interrupted import from",
+    )
+    parser.add_argument(
+        "--resume-line",
+        type=int,
+        default=0,
+        help="number of words (lines of an NDJSON file) to skip",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes importing the file in parallel",
+    )
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+    if args.resume_offset < 0 or args.resume_line < 0:
+        parser.error("resume offsets must not be negative")
+    if args.workers < 1:
+        parser.error("--workers must be positive")
+    if args.workers > 1 and (args.resume_offset or args.resume_line):
+        parser.error("an import can only be resumed with a single worker")
 
-    json_file_path = sys.argv[1]
+    json_file_path = args.json_file_path
     if not Path(json_file_path).is_file():
         print(f"File not found: {json_file_path}")
         sys.exit(1)
 
-    data = load_json(json_file_path)
+    if args.workers > 1:
+        parallel_populate_database(json_file_path, args.workers, args.batch_size)
+        return
+
+    reader = DictionaryReader(json_file_path, args.resume_offset, args.resume_line)
+
+    def report_progress() -> None:
+        print(
+            f"Read {reader.offset} of {reader.size} bytes "
+            f"({reader.offset / max(reader.size, 1):.1%}), "
+            f"resume with --resume-offset {reader.offset}",
+            flush=True,
+        )
 
     session = SessionLocal()
     try:
-        populate_database(data, session)
+        bulk_populate_database(reader, session, args.batch_size, report_progress)
     finally:
         session.close()
 
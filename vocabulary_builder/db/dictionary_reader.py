@@ -0,0 +1,191 @@
+"""
+Streaming reader of dictionary files.
+
+Words are parsed one at a time, so memory use does not depend on the size of
+the file. Two formats are supported: NDJSON (one word object per line) and
+the top-level JSON array of ``tiny_db_input.json``, which is parsed
+incrementally. The reader tracks the byte offset just after the last word it
+produced, which can be used to report progress and to resume an import.
+"""
+import codecs
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+
+READ_CHUNK_SIZE = 1024 * 1024
+WHITESPACE = " \t\r\n"
+WHITESPACE_PATTERN = re.compile(f"[{WHITESPACE}]*")
+
+
+class DictionaryReader:
+    """
+    Iterable over the words of a dictionary file.
+
+    :param file_path: Path to an NDJSON or JSON array file.
+    :param start_offset: Byte offset to resume from; must be an offset
+        previously reported by the reader.
+    :param skip_words: Number of words to skip after the start offset.
+    :param end_offset: Byte offset to stop at; only supported for NDJSON,
+        where lines starting before it are read.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        start_offset: int = 0,
+        skip_words: int = 0,
+        end_offset: int | None = None,
+    ) -> None:
+        """Open nothing yet, only detect the file format."""
+        self.file_path = Path(file_path)
+        self.size = self.file_path.stat().st_size
+        self.offset = start_offset
+        self.skip_words = skip_words
+        self.end_offset = self.size if end_offset is None else end_offset
+        self.is_array = self._detect_array()
+
+    def _detect_array(self) -> bool:
+        """
+        Detect whether the file holds a JSON array or NDJSON.
+
+        :return: True if the first non-blank character is an opening bracket.
+        """
+        with open(self.file_path, "rb") as file:
+            while chunk := file.read(READ_CHUNK_SIZE):
+                stripped = chunk.lstrip(WHITESPACE.encode())
+                if stripped:
+                    return stripped.startswith(b"[")
+        return False
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the words of the file.
+
+        :return: Iterator over word data dictionaries.
+        """
+        words = self._read_array() if self.is_array else self._read_lines()
+        for index, word_data in enumerate(words):
+            if index >= self.skip_words:
+                yield word_data
+
+    def _read_lines(self) -> Iterator[dict[str, Any]]:
+        """
+        Parse an NDJSON file line by line.
+
+        :return: Iterator over word data dictionaries.
+        """
+        with open(self.file_path, "rb") as file:
+            file.seek(self.offset)
+            for line in file:
+                if self.offset >= self.end_offset:
+                    return
+                line_offset = self.offset
+                self.offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    word_data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    # Lines are independent, so a malformed one is only skipped
+                    print(f"Skipping malformed line at byte {line_offset}: {e}")
+                    continue
+                yield word_data
+
+    def _read_array(self) -> Iterator[dict[str, Any]]:
+        """
+        Parse a top-level JSON array incrementally.
+
+        :return: Iterator over word data dictionaries.
+        """
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        # "start" expects the opening bracket, "first" the first word or the
+        # closing bracket, "word" a word, and "after_word" a comma or the
+        # closing bracket. A resumed import starts right after a word.
+        state = "start" if self.offset == 0 else "after_word"
+        # The buffer is scanned by moving the position forward, and only
+        # compacted when it is refilled, so no word copies the whole buffer
+        buffer = ""
+        position = 0
+        at_end_of_file = False
+        with open(self.file_path, "rb") as file:
+            file.seek(self.offset)
+            while True:
+                end = WHITESPACE_PATTERN.match(buffer, position).end()
+                self.offset += end - position
+                position = end
+                if position == len(buffer):
+                    if at_end_of_file:
+                        raise ValueError("Unexpected end of the dictionary file")
+                    buffer, at_end_of_file = self._read_chunk(file, text_decoder)
+                    position = 0
+                    continue
+
+                token = buffer[position]
+                if state == "start" or (state == "after_word" and token != "]"):
+                    if token != ("[" if state == "start" else ","):
+                        raise ValueError(
+                            f"Unexpected {token!r} at byte {self.offset} "
+                            "of the dictionary file"
+                        )
+                    self.offset += 1
+                    position += 1
+                    state = "first" if state == "start" else "word"
+                    continue
+                if token == "]" and state != "word":
+                    self.offset += 1
+                    return
+
+                try:
+                    word_data, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if at_end_of_file:
+                        raise
+                    chunk, at_end_of_file = self._read_chunk(file, text_decoder)
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+                self.offset += len(buffer[position:end].encode("utf-8"))
+                position = end
+                state = "after_word"
+                yield word_data
+
+    @staticmethod
+    def _read_chunk(
+        file: BinaryIO, text_decoder: codecs.IncrementalDecoder
+    ) -> tuple[str, bool]:
+        """
+        Read and decode the next chunk of the file.
+
+        :param file: File opened in binary mode.
+        :param text_decoder: Incremental UTF-8 decoder.
+        :return: Decoded text and whether the end of the file was reached.
+        """
+        chunk = file.read(READ_CHUNK_SIZE)
+        return text_decoder.decode(chunk, final=not chunk), not chunk
+
+
+def find_line_boundaries(file_path: str | Path, parts: int) -> list[int]:
+    """
+    Split an NDJSON file into byte ranges of about the same size.
+
+    Every boundary is moved forward to the start of the next line.
+
+    :param file_path: Path to the NDJSON file.
+    :param parts: Number of ranges.
+    :return: Offsets of the ranges, from 0 to the file size, ``parts + 1``
+        values in total.
+    """
+    size = Path(file_path).stat().st_size
+    boundaries = [0]
+    with open(file_path, "rb") as file:
+        for part in range(1, parts):
+            file.seek(max(size * part // parts, boundaries[-1]))
+            # Skip to the end of the line the guess falls into
+            file.readline()
+            boundaries.append(file.tell())
+    boundaries.append(size)
+    return boundaries
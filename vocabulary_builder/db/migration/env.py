@@ -12,6 +12,7 @@ from vocabulary_builder.db.models import (
     SemanticModel,
     TranslationModel,
     WordModel,
+    WordSampleModel,
 )
 
 
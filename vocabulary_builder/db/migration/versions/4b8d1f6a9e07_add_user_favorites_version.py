@@ -0,0 +1,31 @@
+"""Add user favorites version
+
+Revision ID: 4b8d1f6a9e07
+Revises: e2a94c5d7f18
+Create Date: 2026-10-18 15:52:14.730195
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8d1f6a9e07"
+down_revision: Union[str, None] = "e2a94c5d7f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "favorites_version", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "favorites_version")
@@ -0,0 +1,40 @@
+"""Add word sample index
+
+Revision ID: 5a1c7e93d2b4
+Revises: f3b8e20a04aa
+Create Date: 2026-10-18 10:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1c7e93d2b4"
+down_revision: Union[str, None] = "f3b8e20a04aa"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "word_sample_index",
+        sa.Column("position", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("word_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["word_id"],
+            ["words.id"],
+        ),
+        sa.PrimaryKeyConstraint("position"),
+        sa.UniqueConstraint("word_id"),
+    )
+    op.execute(
+        "INSERT INTO word_sample_index (position, word_id) "
+        "SELECT ROW_NUMBER() OVER (ORDER BY id) - 1, id FROM words"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("word_sample_index")
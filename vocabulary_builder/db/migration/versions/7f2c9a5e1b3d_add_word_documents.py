@@ -0,0 +1,35 @@
+"""Add word documents
+
+Revision ID: 7f2c9a5e1b3d
+Revises: 4b8d1f6a9e07
+Create Date: 2026-10-18 17:08:45.261930
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2c9a5e1b3d"
+down_revision: Union[str, None] = "4b8d1f6a9e07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fill it with "python -m vocabulary_builder.db.word_documents"; until
+    # then, words are assembled from the normalized tables
+    op.create_table(
+        "word_documents",
+        sa.Column("word_id", sa.Uuid(), nullable=False),
+        sa.Column("language", sa.String(), nullable=False),
+        sa.Column("document", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["word_id"], ["words.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("word_id", "language"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("word_documents")
@@ -0,0 +1,46 @@
+"""Cascade word deletes
+
+Revision ID: 9d4e2b7f61c3
+Revises: 5a1c7e93d2b4
+Create Date: 2026-10-18 12:04:52.630914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4e2b7f61c3"
+down_revision: Union[str, None] = "5a1c7e93d2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referred table) of every foreign key that should cascade;
+# the constraints keep the default names given by PostgreSQL
+CASCADING_FOREIGN_KEYS = [
+    ("semantics", "word_id", "words"),
+    ("examples", "semantic_id", "semantics"),
+    ("translations", "semantic_id", "semantics"),
+    ("examples_translations", "translation_id", "translations"),
+    ("user_favorite_words", "word_id", "words"),
+    ("user_favorite_words", "user_id", "users"),
+    ("word_sample_index", "word_id", "words"),
+]
+
+
+def recreate_foreign_keys(ondelete: Union[str, None]) -> None:
+    for table, column, referred_table in CASCADING_FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referred_table, [column], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    recreate_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    recreate_foreign_keys(None)
@@ -0,0 +1,32 @@
+"""Add dictionary version
+
+Revision ID: a6e3d9c1f2b8
+Revises: 7f2c9a5e1b3d
+Create Date: 2026-10-18 21:14:37.508126
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e3d9c1f2b8"
+down_revision: Union[str, None] = "7f2c9a5e1b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dictionary_version = op.create_table(
+        "dictionary_version",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("version", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(dictionary_version, [{"id": 1, "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("dictionary_version")
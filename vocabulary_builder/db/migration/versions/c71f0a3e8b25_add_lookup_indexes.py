@@ -0,0 +1,49 @@
+"""Add lookup indexes
+
+Revision ID: c71f0a3e8b25
+Revises: 9d4e2b7f61c3
+Create Date: 2026-10-18 13:27:09.514372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c71f0a3e8b25"
+down_revision: Union[str, None] = "9d4e2b7f61c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_words_word", "words", ["word"]),
+    ("ix_semantics_word_id", "semantics", ["word_id"]),
+    ("ix_examples_semantic_id", "examples", ["semantic_id"]),
+    (
+        "ix_translations_semantic_id_language",
+        "translations",
+        ["semantic_id", "language"],
+    ),
+    ("ix_translations_language", "translations", ["language"]),
+    (
+        "ix_examples_translations_translation_id",
+        "examples_translations",
+        ["translation_id"],
+    ),
+    ("ix_user_favorite_words_word_id", "user_favorite_words", ["word_id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY doesn't lock writes on PostgreSQL, but it
+    # can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
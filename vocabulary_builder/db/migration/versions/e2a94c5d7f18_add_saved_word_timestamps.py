@@ -0,0 +1,47 @@
+"""Add saved word timestamps
+
+Revision ID: e2a94c5d7f18
+Revises: c71f0a3e8b25
+Create Date: 2026-10-18 14:41:37.208561
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a94c5d7f18"
+down_revision: Union[str, None] = "c71f0a3e8b25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user_favorite_words",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_favorite_words_user_id_created_at",
+            "user_favorite_words",
+            ["user_id", "created_at", "word_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_favorite_words_user_id_created_at",
+            table_name="user_favorite_words",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("user_favorite_words", "created_at")
@@ -1,9 +1,10 @@
 """Database models."""
 
 import uuid
+from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, LargeBinary, Table
+from sqlalchemy import Column, DateTime, ForeignKey, Index, LargeBinary, Table, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from vocabulary_builder.db.database import BaseModel
@@ -12,8 +13,24 @@ from vocabulary_builder.db.database import BaseModel
 user_favorite_words = Table(
     "user_favorite_words",
     BaseModel.metadata,
-    Column("user_id", ForeignKey("users.id"), primary_key=True),
-    Column("word_id", ForeignKey("words.id"), primary_key=True),
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "word_id",
+        ForeignKey("words.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    ),
+    # Serves the keyset pagination of a user's saved words
+    Index(
+        "ix_user_favorite_words_user_id_created_at", "user_id", "created_at", "word_id"
+    ),
 )
 
 
@@ -25,16 +42,17 @@ class WordModel(BaseModel):
     :param word: The English word.
     :param part_of_speech: The part of speech of the word.
     :param transcription: The transcription of the word.
-    :param audio: The pronunciation audio of the word (binary data).
+    :param audio: The pronunciation audio of the word (binary data), loaded only
+        when accessed.
     :param semantics: List of semantic meanings of the word.
     """
 
     __tablename__ = "words"
     id: Mapped[UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
-    word: Mapped[str] = mapped_column(nullable=False)
+    word: Mapped[str] = mapped_column(nullable=False, index=True)
     part_of_speech: Mapped[str] = mapped_column(nullable=False)
     transcription: Mapped[str] = mapped_column(nullable=False)
-    audio: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    audio: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, deferred=True)
     semantics: Mapped[list["SemanticModel"]] = relationship()
 
 
@@ -50,7 +68,9 @@ class SemanticModel(BaseModel):
 
     __tablename__ = "semantics"
     id: Mapped[UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
-    word_id: Mapped[UUID] = mapped_column(ForeignKey("words.id"), nullable=False)
+    word_id: Mapped[UUID] = mapped_column(
+        ForeignKey("words.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     translations: Mapped[list["TranslationModel"]] = relationship()
     examples: Mapped[list["ExampleModel"]] = relationship()
 
@@ -67,7 +87,7 @@ class ExampleModel(BaseModel):
     __tablename__ = "examples"
     id: Mapped[UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
     semantic_id: Mapped[UUID] = mapped_column(
-        ForeignKey("semantics.id"), nullable=False
+        ForeignKey("semantics.id", ondelete="CASCADE"), nullable=False, index=True
     )
     example: Mapped[str] = mapped_column(nullable=False)
 
@@ -85,11 +105,15 @@ class TranslationModel(BaseModel):
     """
 
     __tablename__ = "translations"
+    # Also serves lookups by semantic_id alone
+    __table_args__ = (
+        Index("ix_translations_semantic_id_language", "semantic_id", "language"),
+    )
     id: Mapped[UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
     semantic_id: Mapped[UUID] = mapped_column(
-        ForeignKey("semantics.id"), nullable=False
+        ForeignKey("semantics.id", ondelete="CASCADE"), nullable=False
     )
-    language: Mapped[str] = mapped_column(nullable=False)
+    language: Mapped[str] = mapped_column(nullable=False, index=True)
     word: Mapped[str] = mapped_column(nullable=False)
     examples: Mapped[list["ExampleTranslationModel"]] = relationship()
 
@@ -106,11 +130,73 @@ class ExampleTranslationModel(BaseModel):
     __tablename__ = "examples_translations"
     id: Mapped[UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
     translation_id: Mapped[UUID] = mapped_column(
-        ForeignKey("translations.id"), nullable=False
+        ForeignKey("translations.id", ondelete="CASCADE"), nullable=False, index=True
     )
     example: Mapped[str] = mapped_column(nullable=False)
 
 
+class WordSampleModel(BaseModel):
+    """
+    Represents a slot in the dense index used to sample random words.
+
+    Positions always form the range from 0 to the number of words minus one,
+    so a random word is picked with a single primary key lookup.
+
+    :param position: Primary key, sequential position of the word in the index.
+    :param word_id: Foreign key to the indexed word.
+    """
+
+    __tablename__ = "word_sample_index"
+    position: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    word_id: Mapped[UUID] = mapped_column(
+        ForeignKey("words.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+
+
+# Language key of the word documents that include every translation
+ALL_LANGUAGES = "*"
+
+
+class WordDocumentModel(BaseModel):
+    """
+    Represents a word assembled from all its records, as served by the API.
+
+    Materialized from the normalized tables, so a word is read with a single
+    primary key lookup instead of five queries.
+
+    :param word_id: Primary key, foreign key to the word.
+    :param language: Primary key, language of the included translations, or
+        ``ALL_LANGUAGES`` for every translation.
+    :param document: The serialized JSON document.
+    """
+
+    __tablename__ = "word_documents"
+    word_id: Mapped[UUID] = mapped_column(
+        ForeignKey("words.id", ondelete="CASCADE"), primary_key=True
+    )
+    language: Mapped[str] = mapped_column(primary_key=True)
+    document: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class DictionaryVersionModel(BaseModel):
+    """
+    Represents the version of the dictionary, a table with a single row.
+
+    Imports and cleanups increment it with their changes, so application
+    processes know when to drop the words they keep in memory.
+
+    :param id: Primary key, always ``DICTIONARY_VERSION_ID``.
+    :param version: Counter incremented whenever words are added or deleted.
+    """
+
+    __tablename__ = "dictionary_version"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    version: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+
+
+DICTIONARY_VERSION_ID = 1
+
+
 class UserModel(BaseModel):
     """
     Represents a user in the system.
@@ -118,6 +204,8 @@ class UserModel(BaseModel):
     :param id: Primary key.
     :param username: The username of the user.
     :param hashed_password: The hashed password of the user.
+    :param favorites_version: Counter incremented whenever the user's favorite
+        words change.
     :param favorite_words: List of user's favorite words.
     """
 
@@ -125,6 +213,9 @@ class UserModel(BaseModel):
     id: Mapped[UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
     username: Mapped[str] = mapped_column(nullable=False, unique=True)
     hashed_password: Mapped[str] = mapped_column(nullable=False)
+    favorites_version: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
     favorite_words: Mapped[list["WordModel"]] = relationship(
         secondary=user_favorite_words,
     )
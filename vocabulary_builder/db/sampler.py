@@ -0,0 +1,257 @@
+"""
+Constant-time sampling of random words.
+
+The ``word_sample_index`` table keeps every word ID at a sequential position
+from 0 to N - 1. Picking a random word is then a lookup of the highest
+position followed by a primary key lookup, instead of sorting the whole
+``words`` table by ``random()``. The index is maintained incrementally by
+the functions below whenever words are added or deleted.
+
+Usage: python -m vocabulary_builder.db.sampler {rebuild,sync}
+
+Slots cascade with the words they index, so deleting words directly in the
+database leaves free positions; ``sync_sample_index`` fills them.
+"""
+import argparse
+import random
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from vocabulary_builder.db.database import SessionLocal
+from vocabulary_builder.db.models import WordModel, WordSampleModel
+
+
+MAX_PICK_ATTEMPTS = 3
+
+
+def get_sample_index_size(db: Session) -> int:
+    """
+    Get the number of words in the sample index.
+
+    :param db: The database session.
+    :return: Number of indexed words.
+    """
+    last_position = db.scalar(select(func.max(WordSampleModel.position)))
+    if last_position is None:
+        return 0
+    return last_position + 1
+
+
+def pick_random_word_id(db: Session) -> UUID | None:
+    """
+    Pick the ID of a uniformly random word.
+
+    :param db: The database session.
+    :return: ID of a random word, or None if there are no words.
+    """
+    for _ in range(MAX_PICK_ATTEMPTS):
+        size = get_sample_index_size(db)
+        if not size:
+            return None
+        stmt = select(WordSampleModel.word_id).where(
+            WordSampleModel.position == random.randrange(size)
+        )
+        word_id = db.scalar(stmt)
+        # The slot may have been moved by a concurrent removal; try again.
+        if word_id is not None:
+            return word_id
+    return None
+
+
+def pick_random_word_ids(db: Session, count: int) -> list[UUID]:
+    """
+    Pick the IDs of distinct uniformly random words with a single lookup query.
+
+    :param db: The database session.
+    :param count: Number of words to pick.
+    :return: IDs of random words; fewer than requested if there are not enough.
+    """
+    size = get_sample_index_size(db)
+    positions = random.sample(range(size), min(count, size))
+    if not positions:
+        return []
+    stmt = select(WordSampleModel.position, WordSampleModel.word_id).where(
+        WordSampleModel.position.in_(positions)
+    )
+    word_ids = dict(db.execute(stmt).all())
+    return [word_ids[position] for position in positions if position in word_ids]
+
+
+def add_to_sample_index(db: Session, word_ids: Iterable[UUID]) -> None:
+    """
+    Append words to the end of the sample index.
+
+    The caller is responsible for committing the session.
+
+    :param db: The database session.
+    :param word_ids: IDs of the newly created words.
+    """
+    size = get_sample_index_size(db)
+    rows = [
+        {"position": position, "word_id": word_id}
+        for position, word_id in enumerate(word_ids, start=size)
+    ]
+    if rows:
+        db.execute(insert(WordSampleModel), rows)
+
+
+def fill_sample_index_holes(db: Session) -> None:
+    """
+    Move the words at the end of the sample index into its free positions.
+
+    Positions are freed when slots are deleted by the database cascading a
+    delete of their words. Finding them scans the index. The caller is
+    responsible for committing the session.
+
+    :param db: The database session.
+    """
+    size = db.scalar(select(func.count()).select_from(WordSampleModel))
+    moved_positions = db.scalars(
+        select(WordSampleModel.position)
+        .where(WordSampleModel.position >= size)
+        .order_by(WordSampleModel.position)
+    ).all()
+    if not moved_positions:
+        return
+    holes: list[int] = []
+    next_position = 0
+    for position in db.scalars(
+        select(WordSampleModel.position)
+        .where(WordSampleModel.position < size)
+        .order_by(WordSampleModel.position)
+    ):
+        holes.extend(range(next_position, position))
+        next_position = position + 1
+    holes.extend(range(next_position, size))
+    move_sample_slots(db, zip(moved_positions, holes))
+
+
+def move_sample_slots(db: Session, moves: Iterable[tuple[int, int]]) -> None:
+    """
+    Move slots of the sample index to free positions with one statement.
+
+    :param db: The database session.
+    :param moves: Pairs of the current and the new position of a slot.
+    """
+    # A Core executemany; the ORM would treat the parameters as primary keys
+    db.connection().execute(
+        update(WordSampleModel)
+        .where(WordSampleModel.position == bindparam("old_position"))
+        .values(position=bindparam("new_position")),
+        [{"old_position": old, "new_position": new} for old, new in moves],
+    )
+
+
+def sync_sample_index(db: Session) -> None:
+    """
+    Fill the free positions of the sample index and append missing words.
+
+    Used after words have been imported by concurrent processes, which can't
+    assign positions themselves, or deleted directly in the database. The
+    caller is responsible for committing the session.
+
+    :param db: The database session.
+    """
+    fill_sample_index_holes(db)
+    size = get_sample_index_size(db)
+    missing_words = select(
+        func.row_number().over(order_by=WordModel.id) - 1 + size,
+        WordModel.id,
+    ).where(
+        ~select(WordSampleModel.word_id)
+        .where(WordSampleModel.word_id == WordModel.id)
+        .exists()
+    )
+    db.execute(
+        insert(WordSampleModel).from_select(["position", "word_id"], missing_words)
+    )
+
+
+def remove_from_sample_index(db: Session, word_ids: Iterable[UUID]) -> None:
+    """
+    Remove words from the sample index, keeping positions dense.
+
+    The slots of the removed words below the new size are filled with the
+    words from the positions past it, using a fixed number of statements
+    regardless of how many words are removed. Slots must be removed before
+    their words are deleted: slots deleted by the cascade are not refilled
+    here, see ``fill_sample_index_holes``. The caller is responsible for
+    committing the session.
+
+    :param db: The database session.
+    :param word_ids: IDs of the words that are about to be deleted.
+    """
+    word_ids = list(word_ids)
+    if not word_ids:
+        return
+    size = get_sample_index_size(db)
+    removed_positions = db.scalars(
+        select(WordSampleModel.position).where(WordSampleModel.word_id.in_(word_ids))
+    ).all()
+    if not removed_positions:
+        return
+    db.execute(delete(WordSampleModel).where(WordSampleModel.word_id.in_(word_ids)))
+
+    new_size = size - len(removed_positions)
+    holes = sorted(position for position in removed_positions if position < new_size)
+    moved_positions = db.scalars(
+        select(WordSampleModel.position)
+        .where(WordSampleModel.position >= new_size)
+        .order_by(WordSampleModel.position)
+    ).all()
+    if holes:
+        move_sample_slots(db, zip(moved_positions, holes))
+
+
+def clear_sample_index(db: Session) -> None:
+    """
+    Remove every word from the sample index.
+
+    :param db: The database session.
+    """
+    db.execute(delete(WordSampleModel))
+
+
+def rebuild_sample_index(db: Session) -> None:
+    """
+    Rebuild the sample index from the ``words`` table and commit.
+
+    :param db: The database session.
+    """
+    clear_sample_index(db)
+    word_ids = db.scalars(select(WordModel.id).order_by(WordModel.id)).all()
+    add_to_sample_index(db, word_ids)
+    db.commit()
+
+
+def main() -> None:
+    """Run the sample index command."""
+    parser = argparse.ArgumentParser(description="Manage the word sample index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("rebuild", help="index every word again from scratch")
+    commands.add_parser(
+        "sync", help="fill free positions and append words missing from the index"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with SessionLocal() as session:
+        if args.command == "rebuild":
+            rebuild_sample_index(session)
+        else:
+            sync_sample_index(session)
+            session.commit()
+        size = get_sample_index_size(session)
+    print(
+        f"Successfully {'rebuilt' if args.command == 'rebuild' else 'synced'} "
+        f"the sample index of {size} words "
+        f"in {time.perf_counter() - start:.1f} seconds."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Command to compile the dictionary into a memory-mapped snapshot file.
+
+Usage: python -m vocabulary_builder.db.snapshot build [--output PATH]
+
+Rebuild the snapshot after every import or cleanup: words imported since the
+last build are read from the database, but they are not picked as random
+words until they are part of a snapshot.
+"""
+import argparse
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from vocabulary_builder.db.crud import word_graph_options
+from vocabulary_builder.db.database import SessionLocal
+from vocabulary_builder.db.models import WordModel
+from vocabulary_builder.utils.word_info import format_word_info
+from vocabulary_builder.utils.word_snapshot import (
+    WORD_SNAPSHOT_PATH,
+    write_word_snapshot,
+)
+
+
+SNAPSHOT_BATCH_SIZE = 1000
+
+
+def iter_word_infos(
+    session: Session, batch_size: int = SNAPSHOT_BATCH_SIZE
+) -> Iterator[dict]:
+    """
+    Format every word with all its translations, loading a batch at a time.
+
+    :param session: SQLAlchemy session object.
+    :param batch_size: Number of words loaded at once.
+    :return: Iterator over formatted words.
+    """
+    last_id = None
+    while True:
+        stmt = (
+            select(WordModel)
+            .order_by(WordModel.id)
+            .limit(batch_size)
+            .options(*word_graph_options())
+        )
+        if last_id is not None:
+            stmt = stmt.where(WordModel.id > last_id)
+        words = list(session.scalars(stmt))
+        if not words:
+            return
+        for word in words:
+            yield format_word_info(word)
+        last_id = words[-1].id
+        # Drop the loaded graphs, so memory doesn't grow with the dictionary
+        session.expunge_all()
+
+
+def build_snapshot(
+    session: Session, path: str | Path, batch_size: int = SNAPSHOT_BATCH_SIZE
+) -> int:
+    """
+    Compile every word of the database into a snapshot file.
+
+    :param session: SQLAlchemy session object.
+    :param path: Path to the snapshot file, replaced atomically.
+    :param batch_size: Number of words loaded at once.
+    :return: Number of words in the snapshot.
+    """
+    return write_word_snapshot(path, iter_word_infos(session, batch_size))
+
+
+def main() -> None:
+    """Run the snapshot command."""
+    parser = argparse.ArgumentParser(description="Manage the dictionary snapshot.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="compile the dictionary into a file")
+    build.add_argument(
+        "--output",
+        type=Path,
+        default=WORD_SNAPSHOT_PATH,
+        help="path to the snapshot file (default is $WORD_SNAPSHOT_PATH)",
+    )
+    build.add_argument(
+        "--batch-size",
+        type=int,
+        default=SNAPSHOT_BATCH_SIZE,
+        help="number of words loaded from the database at once",
+    )
+    args = parser.parse_args()
+    if args.output is None:
+        parser.error("--output is required when WORD_SNAPSHOT_PATH is not set")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    start = time.perf_counter()
+    with SessionLocal() as session:
+        words = build_snapshot(session, args.output, args.batch_size)
+    print(
+        f"Successfully wrote a snapshot of {words} words to {args.output} "
+        f"in {time.perf_counter() - start:.1f} seconds."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Materialization of the ``word_documents`` table and a command to rebuild it.
+
+Every word is stored as the JSON document served by the API, once with every
+translation and once per language, so read paths fetch any number of words
+with a single primary key lookup. The import utility writes the documents in
+the same transactions as the words they belong to, unless word documents are
+disabled, and deleted words drop theirs through the foreign key. Rebuild
+them after enabling word documents.
+"""
+import argparse
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from vocabulary_builder.db.crud import word_graph_options
+from vocabulary_builder.db.database import SessionLocal
+from vocabulary_builder.db.models import ALL_LANGUAGES, WordDocumentModel, WordModel
+from vocabulary_builder.utils.translations import LanguageModel
+from vocabulary_builder.utils.word_cache import serialize_word_info
+from vocabulary_builder.utils.word_info import format_word_info
+
+
+REBUILD_BATCH_SIZE = 500
+
+
+def build_word_documents(words: Iterable[WordModel]) -> list[dict]:
+    """
+    Build the document rows of words with their whole graph loaded.
+
+    Besides the document with every translation, there is one per language
+    the word is translated into and one per supported language, so requests
+    for a language without translations are served from documents too.
+
+    :param words: Word model instances with their graph loaded.
+    :return: Rows of the ``word_documents`` table.
+    """
+    rows = []
+    for word in words:
+        languages = {language.value for language in LanguageModel}
+        languages.update(
+            translation.language
+            for semantic in word.semantics
+            for translation in semantic.translations
+        )
+        for language in [ALL_LANGUAGES, *sorted(languages)]:
+            word_info = format_word_info(
+                word, None if language == ALL_LANGUAGES else language
+            )
+            rows.append(
+                {
+                    "word_id": word.id,
+                    "language": language,
+                    "document": serialize_word_info(word_info),
+                }
+            )
+    return rows
+
+
+def write_word_documents(session: Session, word_ids: list[UUID]) -> int:
+    """
+    Replace the documents of words with ones built from their current records.
+
+    Pending changes are flushed first. The caller is responsible for
+    committing the session.
+
+    :param session: SQLAlchemy session object.
+    :param word_ids: IDs of the words.
+    :return: Number of written documents.
+    """
+    if not word_ids:
+        return 0
+    session.flush()
+    stmt = (
+        select(WordModel)
+        .where(WordModel.id.in_(word_ids))
+        .options(*word_graph_options())
+        .execution_options(populate_existing=True)
+    )
+    rows = build_word_documents(session.scalars(stmt))
+    session.execute(
+        delete(WordDocumentModel).where(WordDocumentModel.word_id.in_(word_ids))
+    )
+    if rows:
+        session.execute(insert(WordDocumentModel), rows)
+    return len(rows)
+
+
+def rebuild_word_documents(
+    session: Session, batch_size: int = REBUILD_BATCH_SIZE
+) -> int:
+    """
+    Regenerate the documents of every word, committing every batch of words.
+
+    Documents are replaced batch by batch, so words stay readable during the
+    rebuild.
+
+    :param session: SQLAlchemy session object.
+    :param batch_size: Number of words per transaction.
+    :return: Number of words whose documents were written.
+    """
+    rebuilt_words = 0
+    last_id = None
+    while True:
+        stmt = select(WordModel.id).order_by(WordModel.id).limit(batch_size)
+        if last_id is not None:
+            stmt = stmt.where(WordModel.id > last_id)
+        word_ids = list(session.scalars(stmt))
+        if not word_ids:
+            return rebuilt_words
+        write_word_documents(session, word_ids)
+        session.commit()
+        # Drop the loaded graphs, so memory doesn't grow with the dictionary
+        session.expunge_all()
+        rebuilt_words += len(word_ids)
+        last_id = word_ids[-1]
+
+
+def main() -> None:
+    """Rebuild the word documents."""
+    parser = argparse.ArgumentParser(description="Rebuild the word documents.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=REBUILD_BATCH_SIZE,
+        help="number of words rebuilt per transaction",
+    )
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    start = time.perf_counter()
+    with SessionLocal() as session:
+        rebuilt_words = rebuild_word_documents(session, args.batch_size)
+    print(
+        f"Successfully rebuilt the documents of {rebuilt_words} words "
+        f"in {time.perf_counter() - start:.1f} seconds."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,10 @@
 This module provides functions for dependency injection,
 such as providing a database session.
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from vocabulary_builder.db.database import SessionLocal
+from vocabulary_builder.db.database import AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Session:
@@ -18,3 +19,16 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncSession:
+    """
+    Provide an asyncio database session for dependency injection.
+
+    Use it in ``async def`` routes so that database round trips do not block
+    the event loop.
+
+    :yields: Asyncio database session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
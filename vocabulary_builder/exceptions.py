@@ -26,6 +26,18 @@ class IncorrectUsernamePasswordException(HTTPException):
         )
 
 
+class PasswordPoolSaturatedException(HTTPException):
+    """Exception raised when too many password hashing calls are queued."""
+
+    def __init__(self) -> None:
+        """Initialize the PasswordPoolSaturatedException."""
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests, please retry later",
+            headers={"Retry-After": "1"},
+        )
+
+
 class WordNotFound(Exception):
     """Exception raised when a word is not found."""
 
@@ -36,3 +48,7 @@ class UserNotFound(Exception):
 
 class BadIdentifier(Exception):
     """Exception raised for a bad identifier."""
+
+
+class InvalidCursor(Exception):
+    """Exception raised for a malformed pagination cursor."""
@@ -1,4 +1,9 @@
 """Main application file for Vocabulary Builder."""
+import asyncio
+import signal
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -7,10 +12,52 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse
 
-from vocabulary_builder.routes import auth, pages, users, words
+from vocabulary_builder.db.database import SessionLocal
+from vocabulary_builder.routes import auth, metrics, pages, users, words
+from vocabulary_builder.utils.dictionary_version import dictionary_version_watcher
+from vocabulary_builder.utils.translations import (
+    load_translations,
+    reload_translations,
+)
+from vocabulary_builder.utils.word_pool import random_word_pool
+
+
+def reload_catalogs() -> None:
+    """Reload the message catalogs and drop the pages rendered with the old ones."""
+    reload_translations()
+    pages.page_cache.clear()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manage in-process resources over the lifetime of the application.
+
+    They are prepared when the application starts and released when it stops.
+    Where the platform has it, SIGHUP reloads the message catalogs recompiled
+    with ``doit mo`` without a restart.
+
+    :param app: The application.
+    """
+    load_translations()
+    loop = asyncio.get_running_loop()
+    # Signal handlers can only be installed from the main thread
+    reload_on_hangup = (
+        hasattr(signal, "SIGHUP")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if reload_on_hangup:
+        loop.add_signal_handler(signal.SIGHUP, reload_catalogs)
+    dictionary_version_watcher.start(SessionLocal)
+    random_word_pool.start(SessionLocal)
+    yield
+    await random_word_pool.stop()
+    await dictionary_version_watcher.stop()
+    if reload_on_hangup:
+        loop.remove_signal_handler(signal.SIGHUP)
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.mount(
     "/static",
@@ -20,6 +67,7 @@ app.mount(
 
 
 app.include_router(auth.router)
+app.include_router(metrics.router)
 app.include_router(pages.router)
 app.include_router(users.router)
 app.include_router(words.router)
@@ -38,4 +86,8 @@ async def custom_http_exception_handler(
     """
     if exc.status_code in {404, 422}:
         return RedirectResponse(url="/page_not_found")
-    return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=getattr(exc, "headers", None),
+    )
@@ -2,7 +2,12 @@
 Pydantic models for the application.
 These models are used for validation and serialization of data.
 """
-from pydantic import UUID4, BaseModel
+import os
+
+from pydantic import UUID4, BaseModel, Field
+
+
+MAX_SAVED_WORD_CHANGES = int(os.getenv("MAX_SAVED_WORD_CHANGES", 500))
 
 
 class UserBase(BaseModel):
@@ -25,3 +30,18 @@ class WordBase(BaseModel):
     """
 
     word_id: UUID4
+
+
+class SavedWordChanges(BaseModel):
+    """
+    Model for a batch of changes to the user's saved words.
+
+    Each list is limited to ``MAX_SAVED_WORD_CHANGES`` IDs, so oversized
+    batches are rejected while the body is parsed.
+
+    :param add: IDs of the words to save.
+    :param remove: IDs of the words to remove.
+    """
+
+    add: list[UUID4] = Field([], max_length=MAX_SAVED_WORD_CHANGES)
+    remove: list[UUID4] = Field([], max_length=MAX_SAVED_WORD_CHANGES)
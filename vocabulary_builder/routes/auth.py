@@ -3,10 +3,10 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, Form, HTTPException
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from vocabulary_builder.db.crud import create_user, get_user_by_username
-from vocabulary_builder.dependencies import get_db
+from vocabulary_builder.db.async_crud import create_user, get_user_by_username
+from vocabulary_builder.dependencies import get_async_db
 from vocabulary_builder.exceptions import IncorrectUsernamePasswordException
 from vocabulary_builder.utils.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -14,6 +14,7 @@ from vocabulary_builder.utils.auth import (
     create_access_token,
     get_hashed_password,
 )
+from vocabulary_builder.utils.password_pool import password_hashing_pool
 from vocabulary_builder.utils.translations import LanguageModel
 
 
@@ -25,7 +26,7 @@ async def register_user(
     username: str = Form(...),
     password: str = Form(...),
     language: str = Form("ru"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RedirectResponse:
     """
     Endpoint to register a new user.
@@ -36,10 +37,11 @@ async def register_user(
     :param db: Database session dependency.
     :return: Redirect response to login page with language parameter.
     """
-    db_user = get_user_by_username(db, username)
+    db_user = await get_user_by_username(db, username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
-    create_user(db, username, get_hashed_password(password))
+    hashed_password = await password_hashing_pool.run(get_hashed_password, password)
+    await create_user(db, username, hashed_password)
     return RedirectResponse(url=f"/login?language={language}", status_code=303)
 
 
@@ -48,7 +50,7 @@ async def login_for_access_token(
     username: str = Form(...),
     password: str = Form(...),
     language: str = Form("ru"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RedirectResponse:
     """
     Endpoint to log in and get an access token.
@@ -59,7 +61,7 @@ async def login_for_access_token(
     :param db: Database session dependency.
     :return: Redirect response to learn page with JWT access token cookie.
     """
-    user = authenticate_user(username, password, db)
+    user = await authenticate_user(username, password, db)
     if not user:
         raise IncorrectUsernamePasswordException
     access_token = create_access_token(
@@ -0,0 +1,31 @@
+"""Module providing an API route to inspect in-process caches and pools."""
+from fastapi import APIRouter
+
+from vocabulary_builder.utils.dictionary_version import dictionary_version_watcher
+from vocabulary_builder.utils.password_pool import password_hashing_pool
+from vocabulary_builder.utils.principal_cache import principal_cache
+from vocabulary_builder.utils.saved_word_cache import saved_word_id_cache
+from vocabulary_builder.utils.word_cache import word_payload_cache
+from vocabulary_builder.utils.word_pool import random_word_pool
+from vocabulary_builder.utils.word_snapshot import word_snapshot
+
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+def get_metrics() -> dict:
+    """
+    Return usage counters of the in-process caches and worker pools.
+
+    :return: JSON response with counters grouped by component.
+    """
+    return {
+        "word_payload_cache": word_payload_cache.stats(),
+        "password_hashing_pool": password_hashing_pool.stats(),
+        "principal_cache": principal_cache.stats(),
+        "saved_word_id_cache": saved_word_id_cache.stats(),
+        "random_word_pool": random_word_pool.stats(),
+        "word_snapshot": word_snapshot.stats(),
+        "dictionary_version": dictionary_version_watcher.stats(),
+    }
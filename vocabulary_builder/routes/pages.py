@@ -1,20 +1,26 @@
 """Routes for rendering HTML pages"""
 from fastapi import APIRouter, Depends
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from starlette.requests import Request
-from starlette.responses import HTMLResponse
+from starlette.responses import HTMLResponse, Response
 
 from vocabulary_builder.dependencies import get_db
 from vocabulary_builder.models import UserBase
 from vocabulary_builder.utils.auth import get_current_user
+from vocabulary_builder.utils.page_cache import (
+    TEMPLATES_AUTO_RELOAD,
+    RenderedPageCache,
+    create_templates,
+)
 from vocabulary_builder.utils.translations import LanguageModel, _
 from vocabulary_builder.utils.word_info import fetch_random_word_data
+from vocabulary_builder.utils.word_pool import random_word_pool
 
 
 router = APIRouter()
 
-templates = Jinja2Templates(directory="vocabulary_builder/templates")
+templates = create_templates()
+page_cache = RenderedPageCache(templates, auto_reload=TEMPLATES_AUTO_RELOAD)
 
 
 @router.get("/")
@@ -31,7 +37,11 @@ def get_main_page_in_language(
     :param db: Database session dependency.
     :return: HTML response with the main page content in the specified language.
     """
-    context = fetch_random_word_data(db)
+    pooled_word = random_word_pool.pop(language.value)
+    if pooled_word:
+        context = dict(pooled_word[0])
+    else:
+        context = fetch_random_word_data(db, language.value)
     context.update({"_": _(language.value)})
     context.update({"language": language.value})
     return templates.TemplateResponse(
@@ -45,36 +55,32 @@ def get_main_page_in_language(
 def register_page(
     request: Request,
     language: LanguageModel = LanguageModel.ru,
-) -> HTMLResponse:
+) -> Response:
     """
     Serve the registration page.
 
     :param request: HTTP request.
     :param language: Language code.
-    :return: HTML response with the registration page.
+    :return: HTML response with the registration page, or 304 if unchanged.
     """
-    return templates.TemplateResponse(
-        request=request,
-        name="signup.html",
-        context={"_": _(language.value), "language": language.value},
+    return page_cache.render(
+        request, "signup.html", {"_": _(language.value), "language": language.value}
     )
 
 
 @router.get("/login")
 def login_page(
     request: Request, language: LanguageModel = LanguageModel.ru
-) -> HTMLResponse:
+) -> Response:
     """
     Serve the login page.
 
     :param request: HTTP request.
     :param language: Language code.
-    :return: HTML response with the login page.
+    :return: HTML response with the login page, or 304 if unchanged.
     """
-    return templates.TemplateResponse(
-        request=request,
-        name="login.html",
-        context={"_": _(language.value), "language": language.value},
+    return page_cache.render(
+        request, "login.html", {"_": _(language.value), "language": language.value}
     )
 
 
@@ -106,18 +112,18 @@ def get_learn_page_in_language(
 @router.get("/page_not_found")
 async def page_not_found(
     request: Request, language: LanguageModel = LanguageModel.ru
-) -> HTMLResponse:
+) -> Response:
     """
     Serve the error page with a custom image based on the status code and language.
 
     :param request: HTTP request.
     :param language: Language code.
-    :return: HTML response with the error page.
+    :return: HTML response with the error page, or 304 if unchanged.
     """
-    return templates.TemplateResponse(
-        request=request,
-        name="page_not_found.html",
-        context={"_": _(language.value), "language": language.value},
+    return page_cache.render(
+        request,
+        "page_not_found.html",
+        {"_": _(language.value), "language": language.value},
     )
 
 
@@ -1,25 +1,36 @@
 """API routes for managing user saved words"""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
 from pydantic import UUID4
-from requests import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from vocabulary_builder.db.crud import (
-    get_all_saved_words_for_user,
+from vocabulary_builder.db.async_crud import (
+    apply_saved_word_changes,
+    get_favorites_version,
+    get_saved_word_id_set,
+    get_saved_word_ids_for_user,
+    get_saved_word_page,
     remove_word_for_user,
     save_word_for_user,
 )
-from vocabulary_builder.dependencies import get_db
-from vocabulary_builder.exceptions import UserNotFound, WordNotFound
-from vocabulary_builder.models import WordBase
-from vocabulary_builder.utils.word_info import format_word_info
+from vocabulary_builder.dependencies import get_async_db
+from vocabulary_builder.exceptions import InvalidCursor, UserNotFound, WordNotFound
+from vocabulary_builder.models import SavedWordChanges, WordBase
+from vocabulary_builder.utils.http_cache import etag_matches
+from vocabulary_builder.utils.pagination import decode_cursor, encode_cursor
+from vocabulary_builder.utils.translations import LanguageModel
+from vocabulary_builder.utils.word_info import get_word_payloads_async
 
 
 router = APIRouter()
 
+DEFAULT_SAVED_WORDS_PAGE_SIZE = 24
+MAX_SAVED_WORDS_PAGE_SIZE = 100
+
 
 @router.post("/users/{user_id}/words")
 async def save_word(
-    user_id: UUID4, word: WordBase, db: Session = Depends(get_db)
+    user_id: UUID4, word: WordBase, db: AsyncSession = Depends(get_async_db)
 ) -> dict:
     """
     Save a word for the user.
@@ -30,7 +41,7 @@ async def save_word(
     :return: JSON response with a success message.
     """
     try:
-        save_word_for_user(db, word.word_id, user_id)
+        await save_word_for_user(db, word.word_id, user_id)
     except (UserNotFound, WordNotFound) as e:
         raise HTTPException(status_code=404, detail=str(e))
     return {"message": "Word saved successfully."}
@@ -38,7 +49,7 @@ async def save_word(
 
 @router.delete("/users/{user_id}/words")
 async def remove_word(
-    user_id: UUID4, word: WordBase, db: Session = Depends(get_db)
+    user_id: UUID4, word: WordBase, db: AsyncSession = Depends(get_async_db)
 ) -> dict:
     """
     Remove a word for the user.
@@ -49,26 +60,122 @@ async def remove_word(
     :return: JSON response with a success message.
     """
     try:
-        remove_word_for_user(db, word.word_id, user_id)
+        await remove_word_for_user(db, word.word_id, user_id)
     except (UserNotFound, WordNotFound) as e:
         raise HTTPException(status_code=404, detail=str(e))
     return {"message": "Word removed successfully."}
 
 
+@router.post("/users/{user_id}/words/batch")
+async def change_saved_words(
+    user_id: UUID4, changes: SavedWordChanges, db: AsyncSession = Depends(get_async_db)
+) -> dict:
+    """
+    Save and remove a batch of words for the user in one transaction.
+
+    :param user_id: User ID.
+    :param changes: IDs of the words to save and to remove.
+    :param db: Database session dependency.
+    :return: JSON object with the outcome per word ID: "added", "already_saved"
+        or "unknown_word" for saved words, and "removed", "not_saved" or
+        "unknown_word" for removed words.
+    """
+    add_ids = list(dict.fromkeys(changes.add))
+    remove_ids = list(dict.fromkeys(changes.remove))
+    if set(add_ids) & set(remove_ids):
+        raise HTTPException(
+            status_code=400, detail="A word can't be both saved and removed."
+        )
+    try:
+        return await apply_saved_word_changes(db, user_id, add_ids, remove_ids)
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get("/users/{user_id}/words")
-async def get_saved_words(user_id: UUID4, db: Session = Depends(get_db)) -> list[dict]:
+async def get_saved_words(
+    request: Request,
+    user_id: UUID4,
+    language: LanguageModel | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_SAVED_WORDS_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """
-    Retrieve saved words for the user.
+    Retrieve saved words for the user, most recent first.
+
+    Without ``limit`` and ``cursor`` every saved word is returned. Otherwise a
+    single page is returned, and the ``X-Next-Cursor`` header holds the cursor
+    of the next page if there is one.
+
+    The weak ETag changes whenever the user's favorites change, and a request
+    whose ``If-None-Match`` holds the current one is answered with 304 Not
+    Modified without loading any words.
+
+    :param request: Incoming request.
+    :param user_id: User ID.
+    :param language: Language of the translations to include (default is all).
+    :param limit: Maximum number of words in the page.
+    :param cursor: Cursor returned with the previous page.
+    :param db: Database session dependency.
+    :return: JSON list of dictionaries containing saved words information.
+    """
+    try:
+        version = await get_favorites_version(db, user_id)
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    # Browsers may keep the response, but must revalidate it before every use
+    headers = {"ETag": f'W/"{version}"', "Cache-Control": "private, no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        if limit is None and cursor is None:
+            saved_word_ids = await get_saved_word_ids_for_user(db, user_id)
+        else:
+            limit = limit or DEFAULT_SAVED_WORDS_PAGE_SIZE
+            after = decode_cursor(cursor) if cursor else None
+            # One extra row tells whether there is a next page
+            page = await get_saved_word_page(db, user_id, limit + 1, after)
+            if len(page) > limit:
+                page = page[:limit]
+                word_id, created_at = page[-1]
+                headers["X-Next-Cursor"] = encode_cursor(created_at, word_id)
+            saved_word_ids = [word_id for word_id, _ in page]
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    payloads = await get_word_payloads_async(
+        db, saved_word_ids, language and language.value
+    )
+    return Response(
+        content=b"[" + b",".join(payloads) + b"]",
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get("/users/{user_id}/words/ids")
+async def get_saved_word_ids(
+    request: Request, user_id: UUID4, db: AsyncSession = Depends(get_async_db)
+) -> Response:
+    """
+    Retrieve only the IDs of the words saved by the user.
+
+    Lets clients tell whether a word is saved without downloading every saved
+    word. The weak ETag is the same as the one of the saved words listing.
 
+    :param request: Incoming request.
     :param user_id: User ID.
     :param db: Database session dependency.
-    :return: List of dictionaries containing saved words information.
+    :return: JSON list of saved word IDs, in no particular order.
     """
     try:
-        saved_words = get_all_saved_words_for_user(db, user_id)
+        version, word_ids = await get_saved_word_id_set(db, user_id)
     except UserNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
-    formatted_words = []
-    for word in saved_words:
-        formatted_words.append(format_word_info(word))
-    return formatted_words
+    headers = {"ETag": f'W/"{version}"', "Cache-Control": "private, no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse([str(word_id) for word_id in word_ids], headers=headers)
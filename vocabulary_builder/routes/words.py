@@ -1,23 +1,144 @@
-"""Module providing an API route to fetch a new random word"""
-from fastapi import APIRouter, Depends
+"""Module providing API routes to fetch random words and their audio"""
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import UUID4
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
+from starlette.requests import Request
 
+from vocabulary_builder.db.crud import get_audio_length, read_audio_chunk
 from vocabulary_builder.dependencies import get_db
-from vocabulary_builder.utils.word_info import fetch_random_word_data
+from vocabulary_builder.utils.http_cache import etag_matches, parse_range
+from vocabulary_builder.utils.translations import LanguageModel
+from vocabulary_builder.utils.word_info import (
+    fetch_random_word_payload,
+    fetch_random_word_payloads,
+)
+from vocabulary_builder.utils.word_pool import random_word_pool
+
 
+MAX_WORDS_PER_BATCH = 50
+AUDIO_MEDIA_TYPE = "audio/mpeg"
+AUDIO_CHUNK_SIZE = 64 * 1024
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 router = APIRouter()
 
 
 @router.get("/new_word")
-def get_new_word(db: Session = Depends(get_db)) -> dict:
+def get_new_word(
+    language: LanguageModel | None = None, db: Session = Depends(get_db)
+) -> Response:
     """
     Fetch a new random word and return it as a JSON response.
 
+    :param language: Language of the translations to include (default is all).
     :param db: Database session dependency.
     :return: JSON response with the new word data, or a message if no word is found.
     """
-    word_data = fetch_random_word_data(db)
-    if word_data:
-        return word_data
-    return {"message": "No word found"}
+    language = language and language.value
+    pooled_word = random_word_pool.pop(language)
+    if pooled_word:
+        return Response(content=pooled_word[1], media_type="application/json")
+    payload = fetch_random_word_payload(db, language)
+    if payload:
+        return Response(content=payload, media_type="application/json")
+    return JSONResponse({"message": "No word found"})
+
+
+@router.get("/new_words")
+def get_new_words(
+    count: int = Query(10, ge=1, le=MAX_WORDS_PER_BATCH),
+    language: LanguageModel | None = None,
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    Fetch several distinct random words and return them as a JSON list.
+
+    :param count: Number of words to fetch.
+    :param language: Language of the translations to include (default is all).
+    :param db: Database session dependency.
+    :return: JSON response with a list of word data; shorter than requested if
+        there are not enough words.
+    """
+    payloads = fetch_random_word_payloads(db, count, language and language.value)
+    return Response(
+        content=b"[" + b",".join(payloads) + b"]", media_type="application/json"
+    )
+
+
+def stream_audio(
+    bind: Engine | Connection, word_id: UUID4, first: int, last: int
+) -> Iterator[bytes]:
+    """
+    Read a byte range of a word's audio from the database in chunks.
+
+    A dedicated session is used because the response body is sent after the
+    request's database session has been closed.
+
+    :param bind: Engine or connection to read from.
+    :param word_id: ID of the word.
+    :param first: Offset of the first byte to send.
+    :param last: Offset of the last byte to send.
+    :yields: Consecutive chunks of the audio.
+    """
+    with Session(bind=bind) as db:
+        offset = first
+        while offset <= last:
+            size = min(AUDIO_CHUNK_SIZE, last - offset + 1)
+            yield read_audio_chunk(db, word_id, offset, size)
+            offset += size
+
+
+@router.get("/words/{word_id}/audio")
+def get_word_audio(
+    word_id: UUID4,
+    request: Request,
+    range_header: str | None = Header(None, alias="range"),
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    Stream the pronunciation audio of a word.
+
+    Supports single byte ranges and conditional requests. The audio of a word
+    never changes, so it may be cached by browsers and proxies indefinitely.
+
+    :param word_id: ID of the word.
+    :param request: HTTP request.
+    :param range_header: Value of the Range header, if any.
+    :param db: Database session dependency.
+    :return: Audio stream, partial audio stream or empty 304 response.
+    """
+    length = get_audio_length(db, word_id)
+    if length is None:
+        raise HTTPException(status_code=404, detail="Word not found")
+
+    etag = f'"{word_id.hex}-{length}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": AUDIO_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    if range_header and request.headers.get("if-range", etag) == etag:
+        byte_range = parse_range(range_header, length)
+
+    status_code = 200
+    first, last = 0, length - 1
+    if byte_range is not None:
+        status_code = 206
+        first, last = byte_range
+        headers["Content-Range"] = f"bytes {first}-{last}/{length}"
+    headers["Content-Length"] = str(last - first + 1)
+
+    return StreamingResponse(
+        stream_audio(db.get_bind(), word_id, first, last),
+        status_code=status_code,
+        media_type=AUDIO_MEDIA_TYPE,
+        headers=headers,
+    )
@@ -1,3 +1,7 @@
+const FAVORITES_PAGE_SIZE = 24;
+// Start loading the next page this far before the end of the list
+const FAVORITES_PRELOAD_MARGIN = 600;
+
 function fetchAndDisplayFavorites() {
     const accessToken = getCookie('access_token');
     if (!accessToken) {
@@ -13,47 +17,103 @@ function fetchAndDisplayFavorites() {
         return;
     }
 
-    fetch(`/users/${userId}/words`)
-        .then((response) => response.json())
-        .then((data) => {
-            const wordCardContainer = document.getElementById(
-                'favorites-card-container',
-            );
-            const noWordsMessage = document.getElementById('no-words-message');
-
-            let language = getLanguageFromUrl();
-            if (language) {
-                localStorage.setItem('language', language);
-            } else {
-                language = localStorage.getItem('language') || 'ru';
-                const urlParams = new URLSearchParams(window.location.search);
-                urlParams.set('language', language);
-                const newUrl = `${window.location.pathname}?${urlParams.toString()}`;
-
-                window.location.replace(newUrl);
-            }
+    let language = getLanguageFromUrl();
+    if (language) {
+        localStorage.setItem('language', language);
+    } else {
+        language = localStorage.getItem('language') || 'ru';
+        const urlParams = new URLSearchParams(window.location.search);
+        urlParams.set('language', language);
+        const newUrl = `${window.location.pathname}?${urlParams.toString()}`;
+
+        window.location.replace(newUrl);
+        return;
+    }
+
+    const wordCardContainer = document.getElementById(
+        'favorites-card-container',
+    );
+    const noWordsMessage = document.getElementById('no-words-message');
+    const sentinel = document.getElementById('favorites-sentinel');
+    let masonry = null;
+    let nextCursor = null;
+    let isLoading = false;
+    let isFinished = false;
+
+    function isSentinelNearViewport() {
+        return (
+            sentinel.getBoundingClientRect().top <
+            window.innerHeight + FAVORITES_PRELOAD_MARGIN
+        );
+    }
 
-            if (data.length !== 0) {
+    function loadNextPage() {
+        if (isLoading || isFinished) {
+            return;
+        }
+        isLoading = true;
+
+        const params = new URLSearchParams({
+            language: language,
+            limit: FAVORITES_PAGE_SIZE,
+        });
+        if (nextCursor) {
+            params.set('cursor', nextCursor);
+        }
+
+        fetchSavedWords(`/users/${userId}/words?${params.toString()}`)
+            .then((page) => {
+                nextCursor = page.nextCursor;
+                isFinished = !nextCursor;
+                const data = page.data;
+                if (data.length === 0) {
+                    return;
+                }
                 noWordsMessage.style.display = 'none';
-                data.forEach((wordData) => {
-                    const wordCard = createWordCard(wordData, language);
-                    wordCardContainer.appendChild(wordCard);
-                });
+                const wordCards = data.map((wordData) =>
+                    createWordCard(wordData, language),
+                );
+                wordCards.forEach((wordCard) =>
+                    wordCardContainer.appendChild(wordCard),
+                );
 
-                const msnry = new Masonry(wordCardContainer, {
-                    itemSelector: '.word-card',
-                    columnWidth: '.word-card',
-                    gutter: 16,
-                    fitWidth: true,
-                });
+                if (masonry) {
+                    masonry.appended(wordCards);
+                } else {
+                    masonry = new Masonry(wordCardContainer, {
+                        itemSelector: '.word-card',
+                        columnWidth: '.word-card',
+                        gutter: 16,
+                        fitWidth: true,
+                    });
+                }
                 imagesLoaded(wordCardContainer, function () {
-                    msnry.layout();
+                    masonry.layout();
                 });
+            })
+            .catch((error) => {
+                isFinished = true;
+                console.error('Error fetching favorite words:', error);
+            })
+            .finally(() => {
+                isLoading = false;
+                // A short page may leave the sentinel visible, and the
+                // observer only fires when visibility changes
+                if (isSentinelNearViewport()) {
+                    loadNextPage();
+                }
+            });
+    }
+
+    const observer = new IntersectionObserver(
+        (entries) => {
+            if (entries.some((entry) => entry.isIntersecting)) {
+                loadNextPage();
             }
-        })
-        .catch((error) => {
-            console.error('Error fetching favorite words:', error);
-        });
+        },
+        { rootMargin: `${FAVORITES_PRELOAD_MARGIN}px` },
+    );
+    observer.observe(sentinel);
 }
 
 document.addEventListener('DOMContentLoaded', fetchAndDisplayFavorites);
@@ -90,7 +90,11 @@ function setupWelcomePageEventListeners() {
 
 function setupLearnPageEventListeners() {
     const getNewWordButton = document.getElementById('get-new-word-button');
+    if (!getNewWordButton) {
+        return;
+    }
     getNewWordButton.addEventListener('click', fetchAndDisplayWordCard);
+    refillWordQueue(getLanguageFromUrl() || 'ru');
 }
 
 function getLanguageFromUrl() {
@@ -127,7 +127,7 @@ function removeWord(wordId) {
         });
 }
 
-function getSavedWords(callback) {
+function getSavedWordIds(callback) {
     const accessToken = getCookie('access_token');
     if (!accessToken) {
         console.error('Access token is not found in cookies.');
@@ -145,28 +145,107 @@ function getSavedWords(callback) {
         return;
     }
 
-    const url = `/users/${userId}/words`;
+    const url = `/users/${userId}/words/ids`;
 
-    fetch(url, {
-        method: 'GET',
-        headers: {
-            'Content-Type': 'application/json',
-            Authorization: accessToken,
-        },
+    fetchSavedWords(url, {
+        'Content-Type': 'application/json',
+        Authorization: accessToken,
     })
+        .then(({ data }) => {
+            callback(data);
+        })
+        .catch((error) => {
+            console.error('Error fetching saved word IDs:', error);
+            callback([]);
+        });
+}
+
+const SAVED_WORDS_CACHE_PREFIX = 'saved-words:';
+
+// Fetch saved words, revalidating the copy kept from the last response to the
+// same URL: the server answers 304 while the user's favorites are unchanged
+function fetchSavedWords(url, headers = {}) {
+    const cacheKey = SAVED_WORDS_CACHE_PREFIX + url;
+    let cached = null;
+    try {
+        cached = JSON.parse(sessionStorage.getItem(cacheKey));
+    } catch (error) {
+        cached = null;
+    }
+
+    const requestHeaders = { ...headers };
+    if (cached) {
+        requestHeaders['If-None-Match'] = cached.etag;
+    }
+
+    return fetch(url, { method: 'GET', headers: requestHeaders }).then(
+        (response) => {
+            if (response.status === 304 && cached) {
+                return cached;
+            }
+            if (!response.ok) {
+                throw new Error('Network response was not ok');
+            }
+            const etag = response.headers.get('ETag');
+            const nextCursor = response.headers.get('X-Next-Cursor');
+            return response.json().then((data) => {
+                const result = { etag, data, nextCursor };
+                if (etag) {
+                    try {
+                        sessionStorage.setItem(cacheKey, JSON.stringify(result));
+                    } catch (error) {
+                        // The storage is full or disabled, so skip caching
+                    }
+                }
+                return result;
+            });
+        },
+    );
+}
+
+const WORD_QUEUE_SIZE = 5;
+const wordQueue = [];
+let wordQueueRefill = null;
+
+function refillWordQueue(language) {
+    if (wordQueueRefill) {
+        return wordQueueRefill;
+    }
+    const count = WORD_QUEUE_SIZE - wordQueue.length;
+    if (count <= 0) {
+        return Promise.resolve();
+    }
+
+    wordQueueRefill = fetch(`/new_words?count=${count}&language=${language}`)
         .then((response) => {
             if (!response.ok) {
                 throw new Error('Network response was not ok');
             }
             return response.json();
         })
-        .then((data) => {
-            callback(data);
+        .then((words) => {
+            wordQueue.push(...words);
         })
-        .catch((error) => {
-            console.error('Error fetching saved words:', error);
-            callback([]);
+        .catch((error) => console.error('Error prefetching words:', error))
+        .finally(() => {
+            wordQueueRefill = null;
         });
+    return wordQueueRefill;
+}
+
+function takeWordFromQueue(language) {
+    const waitForWord = wordQueue.length
+        ? Promise.resolve()
+        : refillWordQueue(language);
+
+    return waitForWord.then(() => {
+        const word = wordQueue.shift();
+        refillWordQueue(language); // Top the queue up in the background
+        if (!word) {
+            throw new Error('No word found');
+        }
+        return word;
+    });
 }
 
 function fetchAndDisplayWordCard(callback) {
@@ -182,27 +261,27 @@ function fetchAndDisplayWordCard(callback) {
     loadingIndicator.classList.remove('hidden'); // Show loading indicator
     wordCardContainer.classList.add('hidden'); // Hide word card container
 
-    getSavedWords((savedWords) => {
-        fetch(`/new_word?language=${language}`)
-            .then((response) => response.json())
-            .then((data) => {
-                wordCardContainer.innerHTML = ''; // Clear previous word card
-                const wordCard = createWordCard(data, language, savedWords);
-                wordCardContainer.appendChild(wordCard);
-                if (callback) {
-                    callback(data);
-                }
-            })
-            .catch((error) => console.error('Error fetching word data:', error))
-            .finally(() => {
-                wordCardContainer.classList.remove('hidden'); // Show word card container
-                loadingIndicator.classList.add('hidden'); // Hide loading indicator
-                newWordButton.disabled = false; // Enable the button
-            });
-    });
+    const savedWordIdsRequest = new Promise((resolve) =>
+        getSavedWordIds(resolve),
+    );
+    Promise.all([takeWordFromQueue(language), savedWordIdsRequest])
+        .then(([data, savedWordIds]) => {
+            wordCardContainer.innerHTML = ''; // Clear previous word card
+            const wordCard = createWordCard(data, language, savedWordIds);
+            wordCardContainer.appendChild(wordCard);
+            if (typeof callback === 'function') {
+                callback(data);
+            }
+        })
+        .catch((error) => console.error('Error fetching word data:', error))
+        .finally(() => {
+            wordCardContainer.classList.remove('hidden'); // Show word card container
+            loadingIndicator.classList.add('hidden'); // Hide loading indicator
+            newWordButton.disabled = false; // Enable the button
+        });
 }
 
-function createWordCard(data, language, savedWords = null) {
+function createWordCard(data, language, savedWordIds = null) {
     const wordCard = document.createElement('div');
     wordCard.className = 'word-card simple-box clickable shine-shift';
 
@@ -220,10 +299,10 @@ function createWordCard(data, language, savedWords = null) {
     starDiv.className = 'word-card__star';
     starDiv.setAttribute('data-word-id', data.word_id);
 
-    // Check if the word is in the saved words list
+    // Check if the word is among the saved word IDs
     isWordSaved = true;
-    if (savedWords) {
-        isWordSaved = savedWords.some((word) => word.word_id === data.word_id);
+    if (savedWordIds) {
+        isWordSaved = savedWordIds.includes(data.word_id);
     }
     if (isWordSaved) {
         starDiv.style.backgroundImage = "url('/static/images/star-filled.svg')";
@@ -250,7 +329,7 @@ function createWordCard(data, language, savedWords = null) {
 
     const audioButton = document.createElement('button');
     audioButton.classList.add('icon-button', 'word-card__audio-button');
-    audioButton.setAttribute('onclick', 'playAudio()');
+    audioButton.addEventListener('click', () => playAudio(data.audio_url));
     const audioIcon = document.createElement('i');
     audioIcon.className = 'fas fa-volume-up';
     audioButton.appendChild(audioIcon);
@@ -320,6 +399,8 @@ function createWordCard(data, language, savedWords = null) {
     return wordCard;
 }
 
-function playAudio() {
-    console.log('Play audio');
+function playAudio(audioUrl) {
+    new Audio(audioUrl)
+        .play()
+        .catch((error) => console.error('Error playing audio:', error));
 }
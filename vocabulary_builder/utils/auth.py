@@ -11,13 +11,15 @@ from dotenv import load_dotenv
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jwt import InvalidTokenError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
-from vocabulary_builder.db.crud import get_user_by_username
-from vocabulary_builder.dependencies import get_db
+from vocabulary_builder.db.async_crud import get_user_by_username
+from vocabulary_builder.dependencies import get_async_db
 from vocabulary_builder.exceptions import CredentialsException
 from vocabulary_builder.models import UserBase
+from vocabulary_builder.utils.password_pool import password_hashing_pool
+from vocabulary_builder.utils.principal_cache import principal_cache
 
 
 load_dotenv()
@@ -69,8 +71,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
-def authenticate_user(
-    username: str, password: str, db: Session = Depends(get_db)
+async def authenticate_user(
+    username: str, password: str, db: AsyncSession = Depends(get_async_db)
 ) -> UserBase | bool:
     """
     Authenticate a user by username and password.
@@ -80,10 +82,12 @@ def authenticate_user(
     :param db: Database session dependency.
     :return: User representation if authentication is successful, False otherwise.
     """
-    user = get_user_by_username(db, username)
+    user = await get_user_by_username(db, username)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    if not await password_hashing_pool.run(
+        verify_password, password, user.hashed_password
+    ):
         return False
     return UserBase(username=username, user_id=str(user.id))
 
@@ -104,15 +108,22 @@ def create_access_token(data: dict, expires_delta: timedelta) -> str:
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> UserBase:
     """
     Get the current user based on the JWT token.
 
+    Users recently authenticated with the same token are served from the
+    principal cache without querying the database.
+
     :param token: JWT token.
     :param db: Database session dependency.
     :return: Current user.
     """
+    cached_user = principal_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
     try:
         payload = jwt.decode(token.split(" ")[1], SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("username")
@@ -121,7 +132,9 @@ async def get_current_user(
             raise CredentialsException
     except InvalidTokenError:
         raise CredentialsException
-    user = get_user_by_username(db, username)
+    user = await get_user_by_username(db, username)
     if user is None:
         raise CredentialsException
-    return UserBase(username=username, user_id=user_id)
+    current_user = UserBase(username=username, user_id=user_id)
+    principal_cache.put(token, current_user, payload.get("exp", 0))
+    return current_user
@@ -0,0 +1,124 @@
+"""
+This module keeps the words held in memory in sync with the dictionary.
+
+Imports and cleanups run in their own processes, so they can't drop the word
+payloads and pooled random words of a running application. Instead they
+increment the dictionary version in the database in the same transaction as
+their changes, and a background task of the application polls the version
+and drops the words in memory when it changes. Deleted words can be served
+until the next check.
+"""
+import asyncio
+import logging
+import os
+from collections.abc import Callable, Iterable
+
+from sqlalchemy.orm import Session
+
+from vocabulary_builder.db.crud import get_dictionary_version
+from vocabulary_builder.utils.word_cache import word_payload_cache
+from vocabulary_builder.utils.word_pool import random_word_pool
+
+
+DICTIONARY_VERSION_CHECK_INTERVAL = float(
+    os.getenv("DICTIONARY_VERSION_CHECK_INTERVAL", 5)
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DictionaryVersionWatcher:
+    """
+    Poller of the dictionary version that drops stale words from memory.
+
+    :param check_interval: Time in seconds between two checks of the version.
+    :param on_change: Functions called whenever the version changes.
+    """
+
+    def __init__(
+        self, check_interval: float, on_change: Iterable[Callable[[], None]]
+    ) -> None:
+        """Initialize without a known version; the first check records it."""
+        self.check_interval = check_interval
+        self._on_change = list(on_change)
+        self.version: int | None = None
+        self._task: asyncio.Task | None = None
+        self.changes = 0
+        self.check_errors = 0
+
+    def check(self, db: Session) -> bool:
+        """
+        Read the dictionary version, and call the change callbacks if it changed.
+
+        :param db: Database session.
+        :return: True if the version changed since the previous check.
+        """
+        version = get_dictionary_version(db)
+        changed = self.version is not None and version != self.version
+        self.version = version
+        if changed:
+            self.changes += 1
+            for callback in self._on_change:
+                callback()
+        return changed
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Start the background polling task on the running event loop.
+
+        :param session_factory: Factory of database sessions for the checks.
+        """
+        self._task = asyncio.create_task(self._watch_forever(session_factory))
+
+    async def stop(self) -> None:
+        """Cancel the background polling task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _watch_forever(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Check the version, then wait for the check interval, until cancelled.
+
+        :param session_factory: Factory of database sessions for the checks.
+        """
+        while True:
+            await asyncio.to_thread(self._check, session_factory)
+            await asyncio.sleep(self.check_interval)
+
+    def _check(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Check the version in a dedicated session, counting failures.
+
+        :param session_factory: Factory of database sessions.
+        """
+        try:
+            with session_factory() as db:
+                self.check(db)
+        except Exception:
+            self.check_errors += 1
+            logger.exception("Error checking the dictionary version")
+
+    def stats(self) -> dict:
+        """
+        Get watcher counters.
+
+        :return: Dictionary with the last seen version, the number of changes
+            and of failed checks.
+        """
+        return {
+            "version": self.version,
+            "changes": self.changes,
+            "check_errors": self.check_errors,
+        }
+
+
+dictionary_version_watcher = DictionaryVersionWatcher(
+    DICTIONARY_VERSION_CHECK_INTERVAL,
+    [word_payload_cache.clear, random_word_pool.clear],
+)
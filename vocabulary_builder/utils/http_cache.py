@@ -0,0 +1,66 @@
+"""
+This module provides helpers for HTTP caching and partial responses.
+
+They match entity tags and parse Range headers.
+"""
+from fastapi import HTTPException, status
+from starlette.requests import Request
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an entity tag.
+
+    Comparison is weak, as required for If-None-Match.
+
+    :param request: HTTP request.
+    :param etag: Current entity tag of the resource, including quotes.
+    :return: True if the client already has the current representation.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def parse_range(range_header: str, length: int) -> tuple[int, int] | None:
+    """
+    Parse a single byte range of a Range header.
+
+    :param range_header: Value of the Range header, e.g. ``bytes=0-1023``.
+    :param length: Full length of the resource in bytes.
+    :return: Inclusive start and end offsets, or None if the header should be
+        ignored and the full resource sent.
+    :raises HTTPException: If the range cannot be satisfied.
+    """
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    start, _, end = ranges.strip().partition("-")
+    try:
+        if not start:
+            suffix_length = int(end)
+            if suffix_length <= 0:
+                raise ValueError
+            first, last = max(length - suffix_length, 0), length - 1
+        else:
+            first = int(start)
+            last = int(end) if end else length - 1
+            if first < 0 or (end and last < first):
+                raise ValueError
+            last = min(last, length - 1)
+    except ValueError:
+        return None
+    if first >= length:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{length}"},
+        )
+    return first, last
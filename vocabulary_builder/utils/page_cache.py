@@ -0,0 +1,129 @@
+"""
+This module provides caching for rendered HTML pages.
+
+Pages that depend only on the language (login, signup, error page) are
+rendered once per language and served as precomputed bytes with an ETag,
+so repeated visits are answered with a 304. Their links are rendered as
+paths without the host, so the pages don't depend on the Host header.
+Templates are compiled through a persistent Jinja2 bytecode cache shared by
+all workers.
+"""
+import hashlib
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+from starlette.requests import Request
+from starlette.responses import Response
+
+from vocabulary_builder.utils.http_cache import etag_matches
+
+
+TEMPLATES_DIRECTORY = Path(__file__).parent.parent.absolute() / "templates"
+JINJA_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR")
+TEMPLATES_AUTO_RELOAD = os.getenv("TEMPLATES_AUTO_RELOAD", "false").lower() == "true"
+
+
+def create_templates() -> Jinja2Templates:
+    """
+    Create the Jinja2 templates with a persistent bytecode cache.
+
+    The cache is kept in ``JINJA_BYTECODE_CACHE_DIR`` if set, otherwise in the
+    private per-user temporary directory created by Jinja2, since compiled
+    templates are loaded as code.
+
+    :return: Templates renderer for the application.
+    """
+    if JINJA_BYTECODE_CACHE_DIR:
+        Path(JINJA_BYTECODE_CACHE_DIR).mkdir(mode=0o700, parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+    else:
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIRECTORY),
+        autoescape=jinja2.select_autoescape(),
+        bytecode_cache=bytecode_cache,
+        auto_reload=TEMPLATES_AUTO_RELOAD,
+    )
+    return Jinja2Templates(env=env)
+
+
+def get_templates_version() -> float:
+    """
+    Get the modification time of the most recently changed template.
+
+    :return: Latest modification time of the template files.
+    """
+    return max(path.stat().st_mtime for path in TEMPLATES_DIRECTORY.glob("*.html"))
+
+
+def relative_url_for(request: Request) -> Callable[..., str]:
+    """
+    Build a ``url_for`` template function that returns paths without the host.
+
+    :param request: HTTP request.
+    :return: Function taking a route name and path parameters.
+    """
+
+    def url_for(name: str, /, **path_params) -> str:
+        url_path = request.app.url_path_for(name, **path_params)
+        return request.scope.get("root_path", "") + url_path
+
+    return url_for
+
+
+class RenderedPageCache:
+    """
+    Cache of rendered pages keyed by template and language.
+
+    Pages are rendered with ``relative_url_for``, so a page is the same
+    whatever Host header the request that rendered it was sent with.
+
+    :param templates: Templates renderer.
+    :param auto_reload: Re-render pages when template files change.
+    """
+
+    def __init__(self, templates: Jinja2Templates, auto_reload: bool) -> None:
+        """Initialize an empty cache."""
+        self.templates = templates
+        self.auto_reload = auto_reload
+        self._pages: dict[tuple[str, str], tuple[bytes, str, float]] = {}
+        self._lock = threading.Lock()
+
+    def render(self, request: Request, name: str, context: dict) -> Response:
+        """
+        Serve a page from the cache, rendering it on the first request.
+
+        :param request: HTTP request.
+        :param name: Template name.
+        :param context: Template context; must only depend on the language.
+        :return: HTML response, or an empty 304 response if the client's copy
+            is current.
+        """
+        key = (name, context["language"])
+        version = get_templates_version() if self.auto_reload else 0.0
+        page = self._pages.get(key)
+        if page is None or page[2] != version:
+            body = self.templates.TemplateResponse(
+                request=request,
+                name=name,
+                context={**context, "url_for": relative_url_for(request)},
+            ).body
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            page = (body, etag, version)
+            with self._lock:
+                self._pages[key] = page
+
+        body, etag, _ = page
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="text/html", headers=headers)
+
+    def clear(self) -> None:
+        """Drop every rendered page."""
+        with self._lock:
+            self._pages.clear()
@@ -0,0 +1,39 @@
+"""
+This module provides opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last item of a page, so the next page
+starts right after it with an index range scan instead of an OFFSET.
+"""
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from vocabulary_builder.exceptions import InvalidCursor
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """
+    Encode the sort key of the last item of a page as an opaque cursor.
+
+    :param created_at: Creation time of the item.
+    :param item_id: ID of the item, which breaks ties between equal times.
+    :return: URL-safe cursor.
+    """
+    key = json.dumps([created_at.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    :param cursor: Cursor received from the client.
+    :return: Creation time and ID of the last item of the previous page.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("The cursor is malformed.") from e
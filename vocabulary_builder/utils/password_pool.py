@@ -0,0 +1,132 @@
+"""
+This module provides a bounded worker pool for password hashing.
+
+bcrypt deliberately burns hundreds of milliseconds of CPU per call. Running it
+directly in ``async def`` handlers stalls every other request on the worker,
+so hashing and verification are offloaded to a small thread pool (bcrypt
+releases the GIL). The number of queued calls is limited, and callers are
+rejected with a 503 as soon as the pool is saturated instead of piling up.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar
+
+from vocabulary_builder.exceptions import PasswordPoolSaturatedException
+
+
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", os.cpu_count() or 1))
+PASSWORD_POOL_MAX_QUEUE = int(os.getenv("PASSWORD_POOL_MAX_QUEUE", 32))
+
+T = TypeVar("T")
+
+
+class PasswordHashingPool:
+    """
+    Size-bounded thread pool with a queue-depth limit and latency metrics.
+
+    :param workers: Number of threads hashing passwords concurrently.
+    :param max_queue: Number of calls allowed to wait for a free thread.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        """Initialize the pool; threads are started on first use."""
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hashing"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    async def run(self, function: Callable[..., T], *args) -> T:
+        """
+        Run a hashing function in the pool without blocking the event loop.
+
+        :param function: Function to call, e.g. ``bcrypt.hashpw``.
+        :param args: Positional arguments for the function.
+        :return: Result of the function.
+        :raises PasswordPoolSaturatedException: If the queue is full.
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordPoolSaturatedException
+            self._pending += 1
+
+        future = self._executor.submit(self._call, function, args)
+        # A cancelled caller doesn't stop a call already running on a thread,
+        # so the slot is released when the call itself finishes
+        future.add_done_callback(partial(self._release, time.perf_counter()))
+        return await asyncio.wrap_future(future)
+
+    def _release(self, submitted_at: float, future: Future) -> None:
+        """
+        Free the slot of a finished call, recording its latency if it succeeded.
+
+        :param submitted_at: Time the call was submitted to the pool.
+        :param future: Future of the finished call.
+        """
+        latency = time.perf_counter() - submitted_at
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled() and future.exception() is None:
+                self.completed += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+
+    def _call(self, function: Callable[..., T], args: tuple) -> T:
+        """
+        Call a function on a pool thread, tracking busy threads.
+
+        :param function: Function to call.
+        :param args: Positional arguments for the function.
+        :return: Result of the function.
+        """
+        with self._lock:
+            self._running += 1
+        try:
+            return function(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def stats(self) -> dict:
+        """
+        Get pool utilization and latency counters.
+
+        :return: Dictionary with pool size, busy and queued calls, utilization,
+            successfully completed and rejected calls, and average and maximum
+            latency of completed calls in milliseconds (including time spent
+            in the queue).
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "utilization": self._running / self.workers,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "average_latency_ms": (
+                    self._total_latency / self.completed * 1000
+                    if self.completed
+                    else 0.0
+                ),
+                "max_latency_ms": self._max_latency * 1000,
+            }
+
+
+password_hashing_pool = PasswordHashingPool(
+    PASSWORD_POOL_WORKERS, PASSWORD_POOL_MAX_QUEUE
+)
@@ -0,0 +1,95 @@
+"""
+This module provides a short-lived cache of authenticated principals.
+
+Once a token has been checked against the database, the resulting user is
+remembered for a short time, so following requests with the same token
+authenticate without any database query. Entries never outlive the token.
+They are not dropped when a user row changes, so a deleted or renamed user
+keeps being authenticated by a cached token for up to
+``AUTH_CACHE_TTL_SECONDS``.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from vocabulary_builder.models import UserBase
+
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", 60))
+AUTH_CACHE_MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", 10_000))
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache of authenticated users keyed by access token.
+
+    :param ttl: Maximum time in seconds an entry is trusted.
+    :param max_size: Maximum number of cached tokens.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self.max_size = max_size
+        self._principals: OrderedDict[str, tuple[UserBase, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> UserBase | None:
+        """
+        Get the user authenticated by a token, if still fresh.
+
+        :param token: Access token.
+        :return: Cached user, or None on a cache miss.
+        """
+        with self._lock:
+            entry = self._principals.get(token)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._principals[token]
+                self.misses += 1
+                return None
+            self._principals.move_to_end(token)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, user: UserBase, token_expires_at: float) -> None:
+        """
+        Remember the user authenticated by a token.
+
+        :param token: Access token.
+        :param user: Authenticated user.
+        :param token_expires_at: Expiration time of the token as a Unix timestamp.
+        """
+        lifetime = min(self.ttl, token_expires_at - time.time())
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._principals[token] = (user, time.monotonic() + lifetime)
+            self._principals.move_to_end(token)
+            while len(self._principals) > self.max_size:
+                self._principals.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        with self._lock:
+            self._principals.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with entry count and avoided and performed
+            database lookups.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._principals),
+                "avoided_lookups": self.hits,
+                "database_lookups": self.misses,
+            }
+
+
+principal_cache = PrincipalCache(AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_MAX_SIZE)
@@ -0,0 +1,118 @@
+"""
+This module provides a cache of the IDs of the words saved by each user.
+
+Every entry is tagged with the favorites version of the user it was read at,
+and is only used while that version is current, so changes made by other
+processes are never served stale. The CRUD functions apply their own changes
+to the cached sets, so answering whether a word is saved doesn't require
+loading the user's favorites again after every star click.
+"""
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from uuid import UUID
+
+
+SAVED_WORD_CACHE_MAX_USERS = int(os.getenv("SAVED_WORD_CACHE_MAX_USERS", 10_000))
+
+
+class SavedWordIdCache:
+    """
+    Bounded LRU cache of saved word ID sets keyed by user ID.
+
+    :param max_users: Maximum number of cached users.
+    """
+
+    def __init__(self, max_users: int) -> None:
+        """Initialize an empty cache."""
+        self.max_users = max_users
+        self._entries: OrderedDict[UUID, tuple[int, frozenset[UUID]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+
+    def get(self, user_id: UUID, version: int) -> frozenset[UUID] | None:
+        """
+        Get the saved word IDs of a user if they were cached at a version.
+
+        :param user_id: ID of the user.
+        :param version: Current favorites version of the user.
+        :return: Cached IDs, or None on a cache miss.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id: UUID, version: int, word_ids: Iterable[UUID]) -> None:
+        """
+        Store the saved word IDs of a user.
+
+        The least recently used user is evicted if the cache is full.
+
+        :param user_id: ID of the user.
+        :param version: Favorites version the IDs were read at.
+        :param word_ids: IDs of the words saved by the user.
+        """
+        with self._lock:
+            self._entries[user_id] = (version, frozenset(word_ids))
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+
+    def apply(
+        self,
+        user_id: UUID,
+        version: int,
+        added: Iterable[UUID] = (),
+        removed: Iterable[UUID] = (),
+    ) -> None:
+        """
+        Apply a committed change to the cached IDs of a user.
+
+        The change is applied only if the entry is at the version preceding
+        it; otherwise a change was missed and the entry is dropped.
+
+        :param user_id: ID of the user.
+        :param version: Favorites version after the change.
+        :param added: IDs of the words the change saved.
+        :param removed: IDs of the words the change removed.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return
+            if entry[0] != version - 1:
+                del self._entries[user_id]
+                return
+            word_ids = (entry[1] | frozenset(added)) - frozenset(removed)
+            self._entries[user_id] = (version, word_ids)
+            self.updates += 1
+
+    def clear(self) -> None:
+        """Drop every cached user."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with entry count, hits, misses and applied changes.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "updates": self.updates,
+            }
+
+
+saved_word_id_cache = SavedWordIdCache(SAVED_WORD_CACHE_MAX_USERS)
@@ -3,11 +3,16 @@ This module provides functions and classes for handling translations
 across different languages using gettext.
 """
 import gettext
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Callable
 
 
+LOCALES_DIRECTORY = Path(__file__).parent.parent.absolute() / "locales"
+TRANSLATIONS_DOMAIN = "translations"
+
+
 class LanguageModel(str, Enum):
     """Enumeration of supported languages."""
 
@@ -17,19 +22,57 @@ class LanguageModel(str, Enum):
     de = "de"
 
 
+_catalogs: dict[str, gettext.NullTranslations] = {}
+_catalogs_lock = threading.Lock()
+
+
+def _load_catalog(language: str) -> gettext.NullTranslations:
+    """
+    Parse the compiled message catalog of a language from disk.
+
+    :param language: Language code (e.g., 'ru', 'fr').
+    :return: The parsed catalog, or a pass-through catalog if none is compiled.
+    """
+    path = gettext.find(TRANSLATIONS_DOMAIN, LOCALES_DIRECTORY, languages=[language])
+    if path is None:
+        return gettext.NullTranslations()
+    with open(path, "rb") as file:
+        return gettext.GNUTranslations(file)
+
+
+def load_translations() -> None:
+    """Load the message catalogs of every supported language."""
+    catalogs = {
+        language.value: _load_catalog(language.value) for language in LanguageModel
+    }
+    with _catalogs_lock:
+        _catalogs.update(catalogs)
+
+
+def reload_translations() -> None:
+    """
+    Reload every message catalog from disk.
+
+    Call it after the catalogs have been recompiled (``doit mo``).
+    """
+    with _catalogs_lock:
+        _catalogs.clear()
+    load_translations()
+
+
 def _(language: str) -> Callable[[str], str]:
     """
     Retrieve the gettext translation function for the specified language.
 
+    Catalogs are loaded once, on startup or on first use, and kept in memory
+    until ``reload_translations`` is called.
+
     :param language: Language code (e.g., 'ru', 'fr').
     :return: The translation function for the specified language.
     """
-    try:
-        translations = gettext.translation(
-            domain="translations",
-            localedir=Path(__file__).parent.parent.absolute() / "locales",
-            languages=[language],
-        )
-    except FileNotFoundError:
-        translations = gettext.NullTranslations()
-    return translations.gettext
+    catalog = _catalogs.get(language)
+    if catalog is None:
+        catalog = _load_catalog(language)
+        with _catalogs_lock:
+            catalog = _catalogs.setdefault(language, catalog)
+    return catalog.gettext
@@ -0,0 +1,124 @@
+"""
+This module provides a cache of serialized word payloads.
+
+Word content never changes for a given word ID (imports always create new
+IDs), so the final JSON bytes of a formatted word can be reused across
+requests. The cache is a bounded LRU keyed by word ID and requested language
+that evicts the least recently used payloads once its memory budget is spent.
+Deleted words are dropped when the dictionary version changes, see
+``vocabulary_builder.utils.dictionary_version``.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+
+
+WORD_CACHE_MAX_BYTES = int(os.getenv("WORD_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+CacheKey = tuple[UUID, str | None]
+
+
+def serialize_word_info(word_info: dict) -> bytes:
+    """
+    Serialize formatted word information the same way FastAPI's JSONResponse does.
+
+    :param word_info: Dictionary returned by ``format_word_info``.
+    :return: JSON encoded payload.
+    """
+    return json.dumps(
+        jsonable_encoder(word_info),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class WordPayloadCache:
+    """
+    Bounded LRU cache of serialized word payloads.
+
+    :param max_bytes: Memory budget for the cached payloads.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self._payloads: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, word_id: UUID, language: str | None = None) -> bytes | None:
+        """
+        Get a cached payload and mark it as recently used.
+
+        :param word_id: ID of the word.
+        :param language: Requested language, or None for all languages.
+        :return: Serialized payload, or None on a cache miss.
+        """
+        key = (word_id, language)
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._payloads.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, word_id: UUID, language: str | None, payload: bytes) -> None:
+        """
+        Store a payload, evicting the least recently used ones if needed.
+
+        :param word_id: ID of the word.
+        :param language: Requested language, or None for all languages.
+        :param payload: Serialized payload.
+        """
+        if len(payload) > self.max_bytes:
+            return
+        key = (word_id, language)
+        with self._lock:
+            previous = self._payloads.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._payloads[key] = payload
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                _, evicted = self._payloads.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        with self._lock:
+            self._payloads.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with entry count, size, hits, misses, hit rate
+            and evictions.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._payloads),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+word_payload_cache = WordPayloadCache(WORD_CACHE_MAX_BYTES)
@@ -1,18 +1,35 @@
 """
 This module provides functions to format word data and
-fetch random words from the database.
+fetch random words from the database, or from the dictionary snapshot when
+one is configured.
 """
+import json
+import os
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from vocabulary_builder.db.crud import get_random_word
+from vocabulary_builder.db import async_crud
+from vocabulary_builder.db.crud import get_word_documents, get_words_by_ids
 from vocabulary_builder.db.models import WordModel
+from vocabulary_builder.db.sampler import pick_random_word_id, pick_random_word_ids
+from vocabulary_builder.utils.word_cache import serialize_word_info, word_payload_cache
+from vocabulary_builder.utils.word_snapshot import word_snapshot
+
 
+# Write the materialized word documents during imports, and read words from them
+# before assembling them from the normalized tables
+WORD_DOCUMENTS_ENABLED = os.getenv("WORD_DOCUMENTS_ENABLED", "true").lower() == "true"
 
-def format_word_info(word: WordModel) -> dict:
+
+def format_word_info(word: WordModel, language: str | None = None) -> dict:
     """
     Format word information into a dictionary.
 
     :param word: Word model instance.
+    :param language: If given, only translations into this language are included.
     :return: Dictionary containing formatted word information.
     """
     word_info = {
@@ -20,7 +37,7 @@ def format_word_info(word: WordModel) -> dict:
         "word": word.word,
         "part_of_speech": word.part_of_speech,
         "transcription": word.transcription,
-        "audio": word.audio,
+        "audio_url": f"/words/{word.id}/audio",
         "semantics": [],
     }
 
@@ -30,6 +47,8 @@ def format_word_info(word: WordModel) -> dict:
             "examples": [example.example for example in semantic.examples],
         }
         for translation in semantic.translations:
+            if language is not None and translation.language != language:
+                continue
             translation_info = {
                 "word": translation.word,
                 "examples": [
@@ -42,17 +61,194 @@ def format_word_info(word: WordModel) -> dict:
     return word_info
 
 
-def fetch_random_word_data(db: Session) -> dict:
+def fetch_random_word_data(db: Session, language: str | None = None) -> dict:
     """
     Fetch a random word and formats it as a JSON response.
 
     :param db: The database session.
+    :param language: If given, only translations into this language are included.
     :return: A dictionary containing the word and its translation information.
     """
-    random_word = get_random_word(db)
+    snapshot = word_snapshot.get()
+    if snapshot is not None and snapshot.word_count:
+        return snapshot.random_word_infos(1, language)[0]
 
-    if not random_word:
+    payload = fetch_random_word_payload(db, language)
+    if not payload:
         return {}
+    return json.loads(payload)
 
-    word_info = format_word_info(random_word)
-    return word_info
+
+def _get_snapshot_payloads(
+    word_ids: list[UUID], language: str | None, payloads: dict[UUID, bytes]
+) -> list[UUID]:
+    """
+    Read word payloads from the dictionary snapshot.
+
+    The payloads are not cached, so that the words are kept in memory only
+    once, in the page cache shared by all workers.
+
+    :param word_ids: IDs of the words.
+    :param language: Requested language, or None for all languages.
+    :param payloads: Payloads by word ID to add the read payloads to.
+    :return: IDs of the words missing from the snapshot.
+    """
+    snapshot = word_snapshot.get()
+    if snapshot is None:
+        return word_ids
+    missing_ids = []
+    for word_id in word_ids:
+        word_info = snapshot.get_word_info(word_id, language)
+        if word_info is None:
+            missing_ids.append(word_id)
+        else:
+            payloads[word_id] = serialize_word_info(word_info)
+    return missing_ids
+
+
+def _get_cached_payloads(
+    word_ids: list[UUID], language: str | None, payloads: dict[UUID, bytes]
+) -> list[UUID]:
+    """
+    Look word payloads up in the payload cache.
+
+    :param word_ids: IDs of the words.
+    :param language: Requested language, or None for all languages.
+    :param payloads: Payloads by word ID to add the cached payloads to.
+    :return: IDs of the words missing from the cache.
+    """
+    missing_ids = []
+    for word_id in word_ids:
+        payload = word_payload_cache.get(word_id, language)
+        if payload is None:
+            missing_ids.append(word_id)
+        else:
+            payloads[word_id] = payload
+    return missing_ids
+
+
+def _cache_payloads(
+    words: list[WordModel], language: str | None, payloads: dict[UUID, bytes]
+) -> None:
+    """
+    Serialize loaded words and store their payloads in the payload cache.
+
+    :param words: Word model instances with their graph loaded.
+    :param language: Requested language, or None for all languages.
+    :param payloads: Payloads by word ID to add the new payloads to.
+    """
+    for word in words:
+        payload = serialize_word_info(format_word_info(word, language))
+        word_payload_cache.put(word.id, language, payload)
+        payloads[word.id] = payload
+
+
+def _use_documents(
+    documents: dict[UUID, bytes],
+    language: str | None,
+    payloads: dict[UUID, bytes],
+    missing_ids: list[UUID],
+) -> list[UUID]:
+    """
+    Store fetched word documents in the payload cache.
+
+    :param documents: Serialized documents by word ID.
+    :param language: Requested language, or None for all languages.
+    :param payloads: Payloads by word ID to add the documents to.
+    :param missing_ids: IDs of the words that were looked up.
+    :return: IDs of the words that still have to be assembled.
+    """
+    for word_id, document in documents.items():
+        word_payload_cache.put(word_id, language, document)
+        payloads[word_id] = document
+    return [word_id for word_id in missing_ids if word_id not in documents]
+
+
+def get_word_payloads(
+    db: Session, word_ids: Iterable[UUID], language: str | None = None
+) -> list[bytes]:
+    """
+    Get serialized word payloads, loading only the words missing from the cache.
+
+    Words are read from the snapshot if there is one. Missing words are read
+    from their documents, and only words without one are assembled from the
+    normalized tables.
+
+    :param db: The database session.
+    :param word_ids: IDs of the words.
+    :param language: If given, only translations into this language are included.
+    :return: List of JSON payloads in the order of the IDs; unknown IDs are skipped.
+    """
+    word_ids = list(word_ids)
+    payloads = {}
+    missing_ids = _get_snapshot_payloads(word_ids, language, payloads)
+    missing_ids = _get_cached_payloads(missing_ids, language, payloads)
+    if missing_ids and WORD_DOCUMENTS_ENABLED:
+        documents = get_word_documents(db, missing_ids, language)
+        missing_ids = _use_documents(documents, language, payloads, missing_ids)
+    _cache_payloads(get_words_by_ids(db, missing_ids, language), language, payloads)
+    return [payloads[word_id] for word_id in word_ids if word_id in payloads]
+
+
+async def get_word_payloads_async(
+    db: AsyncSession, word_ids: Iterable[UUID], language: str | None = None
+) -> list[bytes]:
+    """
+    Get serialized word payloads using an asyncio database session.
+
+    :param db: The asyncio database session.
+    :param word_ids: IDs of the words.
+    :param language: If given, only translations into this language are included.
+    :return: List of JSON payloads in the order of the IDs; unknown IDs are skipped.
+    """
+    word_ids = list(word_ids)
+    payloads = {}
+    missing_ids = _get_snapshot_payloads(word_ids, language, payloads)
+    missing_ids = _get_cached_payloads(missing_ids, language, payloads)
+    if missing_ids and WORD_DOCUMENTS_ENABLED:
+        documents = await async_crud.get_word_documents(db, missing_ids, language)
+        missing_ids = _use_documents(documents, language, payloads, missing_ids)
+    words = await async_crud.get_words_by_ids(db, missing_ids, language)
+    _cache_payloads(words, language, payloads)
+    return [payloads[word_id] for word_id in word_ids if word_id in payloads]
+
+
+def fetch_random_word_payload(db: Session, language: str | None = None) -> bytes | None:
+    """
+    Fetch a random word as a serialized JSON payload.
+
+    :param db: The database session.
+    :param language: If given, only translations into this language are included.
+    :return: JSON payload of the word, or None if there are no words.
+    """
+    snapshot = word_snapshot.get()
+    if snapshot is not None and snapshot.word_count:
+        return serialize_word_info(snapshot.random_word_infos(1, language)[0])
+
+    word_id = pick_random_word_id(db)
+    if word_id is None:
+        return None
+
+    payloads = get_word_payloads(db, [word_id], language)
+    return payloads[0] if payloads else None
+
+
+def fetch_random_word_payloads(
+    db: Session, count: int, language: str | None = None
+) -> list[bytes]:
+    """
+    Fetch distinct random words as serialized JSON payloads.
+
+    :param db: The database session.
+    :param count: Number of words to fetch.
+    :param language: If given, only translations into this language are included.
+    :return: List of JSON payloads; shorter than requested if there are not enough
+        words.
+    """
+    snapshot = word_snapshot.get()
+    if snapshot is not None and snapshot.word_count:
+        return [
+            serialize_word_info(word_info)
+            for word_info in snapshot.random_word_infos(count, language)
+        ]
+    return get_word_payloads(db, pick_random_word_ids(db, count), language)
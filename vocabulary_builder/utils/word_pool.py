@@ -0,0 +1,217 @@
+"""
+This module provides a background pool of random words ready to be served.
+
+Serving a random word costs a sample index lookup and loading the word.
+The pool keeps a ring buffer of already loaded and formatted random words per
+language, refilled by a background task of the application whenever a buffer
+drops below its low-water mark, so requests only pop a word. When a buffer is
+empty, requests fall back to loading a word themselves.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+from sqlalchemy.orm import Session
+
+from vocabulary_builder.utils.translations import LanguageModel
+from vocabulary_builder.utils.word_info import fetch_random_word_payloads
+
+
+WORD_POOL_SIZE = int(os.getenv("WORD_POOL_SIZE", 64))
+WORD_POOL_LOW_WATER = int(os.getenv("WORD_POOL_LOW_WATER", 16))
+# How often the refill task checks the buffers without being woken up
+WORD_POOL_REFILL_INTERVAL = float(os.getenv("WORD_POOL_REFILL_INTERVAL", 5))
+
+PooledWord = tuple[dict, bytes]
+
+logger = logging.getLogger(__name__)
+
+
+class RandomWordPool:
+    """
+    Ring buffers of formatted random words keyed by language.
+
+    :param size: Maximum number of words per language.
+    :param low_water: Number of words per language below which the buffer is
+        refilled.
+    :param languages: Languages to keep words for; None stands for words with
+        translations into all languages.
+    """
+
+    def __init__(
+        self, size: int, low_water: int, languages: Iterable[str | None]
+    ) -> None:
+        """Initialize empty buffers; they are filled once the pool is started."""
+        self.size = size
+        self.low_water = low_water
+        self._buffers = {language: deque(maxlen=size) for language in languages}
+        self._lock = threading.Lock()
+        # Incremented whenever pooled words are dropped, so refills that
+        # started before don't add back the dropped words
+        self._generation = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self.hits = 0
+        self.underflows = 0
+        self.refills = 0
+        self.refilled_words = 0
+        self.refill_errors = 0
+        self._refill_time = 0.0
+
+    def pop(self, language: str | None = None) -> PooledWord | None:
+        """
+        Take a random word out of the pool.
+
+        :param language: Language of the translations, or None for all.
+        :return: Formatted word and its JSON payload, or None if the buffer
+            is empty and the caller has to load a word itself.
+        """
+        buffer = self._buffers.get(language)
+        if buffer is None:
+            return None
+        with self._lock:
+            word = buffer.popleft() if buffer else None
+            if word is None:
+                self.underflows += 1
+            else:
+                self.hits += 1
+            needs_refill = len(buffer) < self.low_water
+        if needs_refill:
+            self._wake_up()
+        return word
+
+    def fill(self, db: Session, language: str | None) -> int:
+        """
+        Top a buffer up to its size with freshly loaded random words.
+
+        :param db: Database session.
+        :param language: Language of the buffer.
+        :return: Number of added words.
+        """
+        buffer = self._buffers[language]
+        generation = self._generation
+        start = time.perf_counter()
+        words = [
+            (json.loads(payload), payload)
+            for payload in fetch_random_word_payloads(
+                db, self.size - len(buffer), language
+            )
+        ]
+        with self._lock:
+            if generation != self._generation:
+                return 0
+            buffer.extend(words)
+            self.refills += 1
+            self.refilled_words += len(words)
+            self._refill_time += time.perf_counter() - start
+        return len(words)
+
+    def clear(self) -> None:
+        """Drop every pooled word."""
+        with self._lock:
+            self._generation += 1
+            for buffer in self._buffers.values():
+                buffer.clear()
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Start the background refill task on the running event loop.
+
+        :param session_factory: Factory of database sessions for the refills.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._refill_forever(session_factory))
+
+    async def stop(self) -> None:
+        """Cancel the background refill task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = self._loop = self._wakeup = None
+
+    def _wake_up(self) -> None:
+        """Wake the refill task up from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def _refill_forever(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Refill the buffers that dropped below the low-water mark, forever.
+
+        After every round, wait until a request drains a buffer or the refill
+        interval passes.
+
+        :param session_factory: Factory of database sessions for the refills.
+        """
+        while True:
+            self._wakeup.clear()
+            for language, buffer in self._buffers.items():
+                if len(buffer) < self.low_water:
+                    await asyncio.to_thread(self._refill, session_factory, language)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), WORD_POOL_REFILL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    def _refill(
+        self, session_factory: Callable[[], Session], language: str | None
+    ) -> None:
+        """
+        Fill a buffer in a dedicated session, counting failures.
+
+        :param session_factory: Factory of database sessions.
+        :param language: Language of the buffer.
+        """
+        try:
+            with session_factory() as db:
+                self.fill(db, language)
+        except Exception:
+            with self._lock:
+                self.refill_errors += 1
+            logger.exception("Error refilling the random word pool for %r", language)
+
+    def stats(self) -> dict:
+        """
+        Get pool usage counters.
+
+        :return: Dictionary with the number of pooled words per language,
+            served and missed requests, refills and the refill rate.
+        """
+        with self._lock:
+            return {
+                "sizes": {
+                    language or "all": len(buffer)
+                    for language, buffer in self._buffers.items()
+                },
+                "max_size": self.size,
+                "low_water": self.low_water,
+                "hits": self.hits,
+                "underflows": self.underflows,
+                "refills": self.refills,
+                "refilled_words": self.refilled_words,
+                "refill_errors": self.refill_errors,
+                "refill_words_per_second": (
+                    self.refilled_words / self._refill_time
+                    if self._refill_time
+                    else 0.0
+                ),
+            }
+
+
+random_word_pool = RandomWordPool(
+    WORD_POOL_SIZE,
+    WORD_POOL_LOW_WATER,
+    [None, *(language.value for language in LanguageModel)],
+)
@@ -0,0 +1,345 @@
+"""
+This module provides a compact read-only snapshot of the dictionary.
+
+The dictionary only changes with imports, so it can be compiled into a binary
+file that is memory-mapped instead of queried. Every uvicorn worker maps the
+same file, so the words live once in the page cache rather than in the memory
+of each worker, and serving a word needs no database round trip.
+
+The file is little-endian and laid out as follows:
+
+- header: magic, format version, build time in nanoseconds (the snapshot
+  version), number of strings, number of words, and the positions of the
+  sections below;
+- string offsets: ``string_count + 1`` unsigned 32-bit offsets into the
+  string data;
+- string data: every distinct string, interned and UTF-8 encoded;
+- word index: 16-byte word UUID and 32-bit record position per word, sorted
+  by UUID;
+- records: per word, its length followed by string IDs and counts, all
+  unsigned 32-bit integers: word, part of speech, transcription, number of
+  semantics and per semantic the number of examples, the examples, the
+  number of translations and per translation its language, word, number of
+  examples and examples.
+
+Snapshots are written to a temporary file that atomically replaces the
+previous one, and ``WordSnapshotFile`` maps the new file on its next check.
+"""
+import logging
+import mmap
+import os
+import random
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from uuid import UUID
+
+
+WORD_SNAPSHOT_PATH = os.getenv("WORD_SNAPSHOT_PATH")
+# How often the snapshot file is checked for a rebuilt version
+WORD_SNAPSHOT_CHECK_INTERVAL = float(os.getenv("WORD_SNAPSHOT_CHECK_INTERVAL", 10))
+
+MAGIC = b"VBSNAP\x00\x00"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIQIIQQQQ")
+INDEX_ENTRY = struct.Struct("<16sI")
+UINT32 = struct.Struct("<I")
+
+logger = logging.getLogger(__name__)
+
+
+class WordSnapshot:
+    """
+    Memory-mapped dictionary snapshot.
+
+    :param path: Path to the snapshot file.
+    :raises ValueError: If the file is not a snapshot of a supported format.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the file and read its header."""
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path} is not a word snapshot")
+        (
+            magic,
+            format_version,
+            self.version,
+            self.string_count,
+            self.word_count,
+            self._offsets_position,
+            self._strings_position,
+            self._index_position,
+            self._records_position,
+        ) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a word snapshot of a supported format")
+
+    def _string(self, string_id: int) -> str:
+        """
+        Decode an interned string.
+
+        :param string_id: ID of the string.
+        :return: The string.
+        """
+        start, end = struct.unpack_from(
+            "<2I", self._map, self._offsets_position + 4 * string_id
+        )
+        start += self._strings_position
+        end += self._strings_position
+        return self._map[start:end].decode("utf-8")
+
+    def _find(self, word_id: UUID) -> int | None:
+        """
+        Find the position of a word in the index with a binary search.
+
+        :param word_id: ID of the word.
+        :return: Index position, or None if the word is not in the snapshot.
+        """
+        key = word_id.bytes
+        low, high = 0, self.word_count
+        while low < high:
+            middle = (low + high) // 2
+            position = self._index_position + INDEX_ENTRY.size * middle
+            end = position + len(key)
+            candidate = self._map[position:end]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _word_info(self, index: int, language: str | None) -> dict:
+        """
+        Decode the word at an index position.
+
+        :param index: Position in the word index.
+        :param language: If given, only translations into this language are
+            included.
+        :return: Dictionary with the same content as ``format_word_info``.
+        """
+        word_id, record = INDEX_ENTRY.unpack_from(
+            self._map, self._index_position + INDEX_ENTRY.size * index
+        )
+        position = self._records_position + 4 * record
+        (length,) = UINT32.unpack_from(self._map, position)
+        values = struct.unpack_from(f"<{length}I", self._map, position + 4)
+        word_id = UUID(bytes=word_id)
+        word_info = {
+            "word_id": word_id,
+            "word": self._string(values[0]),
+            "part_of_speech": self._string(values[1]),
+            "transcription": self._string(values[2]),
+            "audio_url": f"/words/{word_id}/audio",
+            "semantics": [],
+        }
+        cursor = 4
+        for _ in range(values[3]):
+            first, end = cursor + 1, cursor + 1 + values[cursor]
+            semantic_info = {
+                "translations": {},
+                "examples": [self._string(value) for value in values[first:end]],
+            }
+            translation_count, cursor = values[end], end + 1
+            for _ in range(translation_count):
+                translation_language = self._string(values[cursor])
+                first, end = cursor + 3, cursor + 3 + values[cursor + 2]
+                if language is None or translation_language == language:
+                    semantic_info["translations"][translation_language] = {
+                        "word": self._string(values[cursor + 1]),
+                        "examples": [
+                            self._string(value) for value in values[first:end]
+                        ],
+                    }
+                cursor = end
+            word_info["semantics"].append(semantic_info)
+        return word_info
+
+    def get_word_info(self, word_id: UUID, language: str | None = None) -> dict | None:
+        """
+        Get a word by ID.
+
+        :param word_id: ID of the word.
+        :param language: If given, only translations into this language are
+            included.
+        :return: Formatted word, or None if the word is not in the snapshot.
+        """
+        index = self._find(word_id)
+        return None if index is None else self._word_info(index, language)
+
+    def random_word_infos(self, count: int, language: str | None = None) -> list[dict]:
+        """
+        Get distinct uniformly random words.
+
+        :param count: Number of words.
+        :param language: If given, only translations into this language are
+            included.
+        :return: Formatted words; fewer than requested if there are not enough.
+        """
+        indexes = random.sample(range(self.word_count), min(count, self.word_count))
+        return [self._word_info(index, language) for index in indexes]
+
+
+def write_word_snapshot(path: str | Path, word_infos: Iterable[dict]) -> int:
+    """
+    Compile formatted words into a snapshot file.
+
+    The file is written next to the previous one and atomically replaces it.
+
+    :param path: Path to the snapshot file.
+    :param word_infos: Words formatted by ``format_word_info`` with every
+        translation.
+    :return: Number of words in the snapshot.
+    """
+    string_ids: dict[str, int] = {}
+
+    def intern(string: str) -> int:
+        return string_ids.setdefault(string, len(string_ids))
+
+    records: list[int] = []
+    index: list[tuple[bytes, int]] = []
+    for word_info in word_infos:
+        values = [
+            intern(word_info["word"]),
+            intern(word_info["part_of_speech"]),
+            intern(word_info["transcription"]),
+            len(word_info["semantics"]),
+        ]
+        for semantic_info in word_info["semantics"]:
+            values.append(len(semantic_info["examples"]))
+            values.extend(intern(example) for example in semantic_info["examples"])
+            values.append(len(semantic_info["translations"]))
+            for language, translation_info in semantic_info["translations"].items():
+                values.extend(
+                    (
+                        intern(language),
+                        intern(translation_info["word"]),
+                        len(translation_info["examples"]),
+                    )
+                )
+                values.extend(
+                    intern(example) for example in translation_info["examples"]
+                )
+        index.append((UUID(str(word_info["word_id"])).bytes, len(records)))
+        records.append(len(values))
+        records.extend(values)
+    index.sort()
+
+    encoded = [string.encode("utf-8") for string in string_ids]
+    offsets = [0]
+    for string in encoded:
+        offsets.append(offsets[-1] + len(string))
+    offsets_position = HEADER.size
+    strings_position = offsets_position + 4 * len(offsets)
+    index_position = strings_position + offsets[-1]
+    records_position = index_position + INDEX_ENTRY.size * len(index)
+
+    path = Path(path)
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}."
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    time.time_ns(),
+                    len(encoded),
+                    len(index),
+                    offsets_position,
+                    strings_position,
+                    index_position,
+                    records_position,
+                )
+            )
+            file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            file.write(b"".join(encoded))
+            for entry in index:
+                file.write(INDEX_ENTRY.pack(*entry))
+            file.write(struct.pack(f"<{len(records)}I", *records))
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+    return len(index)
+
+
+class WordSnapshotFile:
+    """
+    Snapshot file that is mapped again whenever it is replaced.
+
+    :param path: Path to the snapshot file, or None to disable snapshots.
+    :param check_interval: Minimum time in seconds between two checks of the
+        file for a new version.
+    """
+
+    def __init__(self, path: str | Path | None, check_interval: float) -> None:
+        """Initialize without mapping the file yet."""
+        self.path = path
+        self.check_interval = check_interval
+        self._snapshot: WordSnapshot | None = None
+        self._file_id: tuple[int, int] | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def get(self) -> WordSnapshot | None:
+        """
+        Get the current snapshot, mapping the file again if it was replaced.
+
+        A replaced snapshot is never unmapped explicitly: it is closed once
+        the requests still reading it release it.
+
+        :return: Current snapshot, or None if there is no usable snapshot.
+        """
+        if self.path is None:
+            return None
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._snapshot
+        with self._lock:
+            if now - self._checked_at >= self.check_interval:
+                self._checked_at = now
+                self._reload()
+            return self._snapshot
+
+    def _reload(self) -> None:
+        """Map the file if it changed since it was last mapped."""
+        try:
+            stat = os.stat(self.path)
+            file_id = (stat.st_ino, stat.st_mtime_ns)
+            if file_id != self._file_id:
+                self._snapshot = WordSnapshot(self.path)
+                self._file_id = file_id
+                self.reloads += 1
+        except (OSError, ValueError):
+            # Keep serving the mapped snapshot, or the database if there is none
+            logger.exception("Error loading the word snapshot %s", self.path)
+
+    def stats(self) -> dict:
+        """
+        Get snapshot information.
+
+        :return: Dictionary with the path, version and number of words of the
+            mapped snapshot, and the number of times it was mapped.
+        """
+        snapshot = self._snapshot
+        return {
+            "path": None if self.path is None else str(self.path),
+            "version": None if snapshot is None else snapshot.version,
+            "words": None if snapshot is None else snapshot.word_count,
+            "reloads": self.reloads,
+        }
+
+
+word_snapshot = WordSnapshotFile(WORD_SNAPSHOT_PATH, WORD_SNAPSHOT_CHECK_INTERVAL)